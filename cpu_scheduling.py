@@ -1,9 +1,29 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from theme import Theme
 import random
+import heapq
+import bisect
+import math
+import csv
+import json
+import os
+import threading
+import multiprocessing
+from collections import deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used without it
+    np = None
 
 class Process:
+    __slots__ = ('pid', 'arrival', 'burst', 'priority', 'remaining', 'start_time',
+                 'completion_time', 'waiting_time', 'turnaround_time')
+
     def __init__(self, pid, arrival, burst, priority=0):
         self.pid = pid
         self.arrival = arrival
@@ -15,116 +35,2057 @@ class Process:
         self.waiting_time = 0
         self.turnaround_time = 0
 
+class RTTask:
+    """Periodic real-time task: a job of wcet units is released every period
+    and must finish within deadline (defaults to period, at most period)."""
+    __slots__ = ('tid', 'period', 'wcet', 'deadline')
+
+    def __init__(self, tid, period, wcet, deadline=None):
+        if deadline is None:
+            deadline = period
+        if not 0 < wcet <= deadline <= period:
+            raise ValueError(f"{tid}: need 0 < wcet <= deadline <= period")
+        self.tid = tid
+        self.period = period
+        self.wcet = wcet
+        self.deadline = deadline
+
+def _column(name):
+    def get(self):
+        return getattr(self._table, name)[self._index]
+
+    def set(self, value):
+        getattr(self._table, name)[self._index] = value
+    return property(get, set)
+
+class ProcessRow:
+    """View of one ProcessTable row with the same attributes as Process"""
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    @property
+    def pid(self):
+        return f"P{self._table.pid[self._index]}"
+
+    arrival = _column('arrival')
+    burst = _column('burst')
+    priority = _column('priority')
+    remaining = _column('remaining')
+    start_time = _column('start_time')
+    completion_time = _column('completion_time')
+    waiting_time = _column('waiting_time')
+    turnaround_time = _column('turnaround_time')
+
+class ProcessTable:
+    """Struct-of-arrays process storage: one array('q') column per field.
+
+    Costs 72 bytes per process instead of a Process object, and every
+    CPUScheduler algorithm accepts it in place of a list (indexing yields
+    ProcessRow views). pid "P7" is stored as the integer 7.
+    """
+    INPUTS = ('pid', 'arrival', 'burst', 'priority')
+    OUTPUTS = ('remaining', 'start_time', 'completion_time', 'waiting_time', 'turnaround_time')
+
+    def __init__(self):
+        for name in self.INPUTS + self.OUTPUTS:
+            setattr(self, name, array('q'))
+
+    @classmethod
+    def from_processes(cls, processes):
+        table = cls()
+        for p in processes:
+            table.append(p.pid, p.arrival, p.burst, p.priority)
+        return table
+
+    def append(self, pid, arrival, burst, priority=0):
+        self.pid.append(int(pid[1:]) if isinstance(pid, str) else pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+        self.remaining.append(burst)
+        self.start_time.append(-1)
+        self.completion_time.append(0)
+        self.waiting_time.append(0)
+        self.turnaround_time.append(0)
+
+    def reset(self):
+        """Clear the result columns with bulk copies"""
+        n = len(self.pid)
+        self.remaining = array('q', self.burst)
+        self.start_time = array('q', [-1]) * n
+        self.completion_time = array('q', bytes(8 * n))
+        self.waiting_time = array('q', bytes(8 * n))
+        self.turnaround_time = array('q', bytes(8 * n))
+
+    def copy(self):
+        """Fresh table with the same inputs and reset results"""
+        table = ProcessTable()
+        for name in self.INPUTS:
+            setattr(table, name, array('q', getattr(self, name)))
+        table.reset()
+        return table
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.pid)
+        if not 0 <= index < len(self.pid):
+            raise IndexError("process index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        for i in range(len(self.pid)):
+            yield ProcessRow(self, i)
+
+class ScheduleRows:
+    """ProcessTable rows in schedule order, backed by index arrays.
+
+    order[k] is the table index of the k-th process scheduled and
+    start[k] / completion[k] its times. Indexing yields ProcessRow views,
+    so results read like the lists the other algorithms return.
+    """
+    def __init__(self, table, order, start, completion):
+        self.table = table
+        self.order = order
+        self.start = start
+        self.completion = completion
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, k):
+        return ProcessRow(self.table, int(self.order[k]))
+
+    def __iter__(self):
+        for i in self.order.tolist():
+            yield ProcessRow(self.table, i)
+
+class GanttSegments:
+    """Gantt lane stored as three int64 arrays (needs NumPy).
+
+    Segment i runs process pid[i] (the n of "Pn"), or IDLE / CS, from
+    start[i] to end[i]. Indexing and slicing build (pid, start, end) tuples
+    on demand, so a lane of 10M segments reads like a list without holding
+    10M tuples; the chart and stats use the arrays directly.
+    """
+    IDLE = -1
+    CS = -2
+
+    def __init__(self, pid, start, end):
+        self.pid = pid
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return len(self.pid)
+
+    def segment(self, i):
+        code = int(self.pid[i])
+        name = 'idle' if code == self.IDLE else 'cs' if code == self.CS else f"P{code}"
+        return name, int(self.start[i]), int(self.end[i])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.segment(i) for i in range(*index.indices(len(self.pid)))]
+        if index < 0:
+            index += len(self.pid)
+        if not 0 <= index < len(self.pid):
+            raise IndexError("segment index out of range")
+        return self.segment(index)
+
+    def __iter__(self):
+        for i in range(len(self.pid)):
+            yield self.segment(i)
+
+    def busy_before(self):
+        """CPU-busy time (anything but idle) before each segment"""
+        busy = np.where(self.pid != self.IDLE, self.end - self.start, 0)
+        return np.cumsum(busy) - busy
+
+    def totals(self):
+        """(busy time, switch overhead, context switches) of the lane"""
+        length = self.end - self.start
+        cs = self.pid == self.CS
+        runs = self.pid[self.pid >= 0]
+        return (int(length[self.pid >= 0].sum()), int(length[cs].sum()),
+                int(np.count_nonzero(runs[1:] != runs[:-1])))
+
+    def finish(self):
+        return int(self.end[-1])
+
+class RunSegments(GanttSegments):
+    """GanttSegments of one run per process, in the order they ran (FCFS).
+
+    Only the runs are stored: pid, start and end, with the idle gaps and
+    switches between runs, are laid out when first read. len(), totals()
+    and finish() come from the runs, so stats never build the full lane.
+    """
+    def __init__(self, runs, run_start, completion, switch_cost=0):
+        self.runs = runs
+        self.run_start = run_start
+        self.completion = completion
+        self.switch_cost = switch_cost
+        # every run after the first is dispatched through a switch, and an
+        # idle gap comes first when the CPU freed up before that dispatch
+        self.switch_slots = len(runs) - 1 if switch_cost else 0
+        idle = np.count_nonzero(completion[:-1] < run_start[1:] - switch_cost) + (run_start[0] > 0)
+        self.size = len(runs) + self.switch_slots + int(idle)
+
+    def __getattr__(self, name):
+        if name not in ('pid', 'start', 'end'):
+            raise AttributeError(name)
+        self.pid, self.start, self.end = self.layout()
+        return getattr(self, name)
+
+    def __len__(self):
+        return self.size
+
+    def layout(self):
+        """(pid, start, end) arrays with the idle and switch segments in place"""
+        start, completion = self.run_start, self.completion
+        prev_end = np.zeros_like(completion)
+        prev_end[1:] = completion[:-1]
+        dispatch = start - self.switch_cost
+        dispatch[0] = start[0]
+        idle = prev_end < dispatch
+        cs = dispatch < start
+        run_at = np.cumsum(1 + idle + cs) - 1
+        pid = np.empty(self.size, dtype=np.int64)
+        seg_start = np.empty(self.size, dtype=np.int64)
+        seg_end = np.empty(self.size, dtype=np.int64)
+        pid[run_at] = self.runs
+        seg_start[run_at] = start
+        seg_end[run_at] = completion
+        at = np.nonzero(cs)[0]
+        pid[run_at[at] - 1] = self.CS
+        seg_start[run_at[at] - 1] = dispatch[at]
+        seg_end[run_at[at] - 1] = start[at]
+        at = np.nonzero(idle)[0]
+        slot = run_at[at] - 1 - cs[at]
+        pid[slot] = self.IDLE
+        seg_start[slot] = prev_end[at]
+        seg_end[slot] = dispatch[at]
+        return pid, seg_start, seg_end
+
+    def totals(self):
+        runs = self.runs
+        return (int((self.completion - self.run_start).sum()), self.switch_cost * self.switch_slots,
+                int(np.count_nonzero(runs[1:] != runs[:-1])))
+
+    def finish(self):
+        return int(self.completion[-1])
+
 class CPUScheduler:
     @staticmethod
-    def fcfs(processes):
+    def fcfs(processes, switch_cost=0):
+        """A ProcessTable (with NumPy) runs on the vectorized kernel and gets
+        ScheduleRows and a GanttSegments lane back instead of lists"""
+        if np is not None and isinstance(processes, ProcessTable) and len(processes):
+            return CPUScheduler._fcfs_table(processes, switch_cost)
         sorted_p = sorted(processes, key=lambda p: (p.arrival, int(p.pid[1:])))
-        time = 0
+        gantt = CPUScheduler._collect(CPUScheduler._fcfs_events(sorted_p, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    @staticmethod
+    def fcfs_arrays(arrival, burst, pid=None, switch_cost=0):
+        """Vectorized FCFS kernel (needs NumPy).
+
+        completion[i] = max(completion[i-1], arrival[i]) + burst[i] unrolls to
+        cumsum(burst) + running max of (arrival - burst time already queued),
+        so the whole schedule is a few array passes with no Python loop. A
+        switch cost is folded into the burst of every job after the first.
+        Returns (order, start, completion) with start/completion in `order`.
+        """
+        arrival = np.asarray(arrival, dtype=np.int64)
+        burst = np.asarray(burst, dtype=np.int64)
+        later, tied = arrival[1:] > arrival[:-1], arrival[1:] == arrival[:-1]
+        if pid is not None:
+            pid = np.asarray(pid)
+            tied &= pid[1:] > pid[:-1]
+        if np.all(later | tied):
+            # traces usually come sorted already
+            order, a, b = np.arange(len(arrival)), arrival, burst
+        else:
+            order = np.lexsort((pid, arrival)) if pid is not None else np.argsort(arrival, kind='stable')
+            a, b = arrival[order], burst[order]
+        run = b
+        if switch_cost and len(b) > 1:
+            run = b + switch_cost
+            run[0] -= switch_cost
+        completion = np.cumsum(run)
+        # in place: arrival minus the burst time queued ahead, then its running max
+        offset = completion - run
+        np.subtract(a, offset, out=offset)
+        np.maximum.accumulate(offset, out=offset)
+        np.maximum(offset, 0, out=offset)
+        completion += offset
+        return order, completion - b, completion
+
+    @staticmethod
+    def _fcfs_table(table, switch_cost=0):
+        """FCFS on a ProcessTable without per-process Python work: returns
+        ScheduleRows and a RunSegments lane over the kernel's arrays"""
+        cols = {name: np.frombuffer(getattr(table, name), dtype=np.int64)
+                for name in ProcessTable.INPUTS + ProcessTable.OUTPUTS}
+        order, start, completion = CPUScheduler.fcfs_arrays(
+            cols['arrival'], cols['burst'], cols['pid'], switch_cost)
+        cols['start_time'][order] = start
+        cols['completion_time'][order] = completion
+        CPUScheduler.metrics(table)
+
+        return (ScheduleRows(table, order, start, completion),
+                RunSegments(cols['pid'][order], start, completion, switch_cost))
+
+    @staticmethod
+    def metrics(processes):
+        """Fill turnaround and waiting time from completion time for every process"""
+        if np is not None and isinstance(processes, ProcessTable) and len(processes):
+            completion = np.frombuffer(processes.completion_time, dtype=np.int64)
+            arrival = np.frombuffer(processes.arrival, dtype=np.int64)
+            burst = np.frombuffer(processes.burst, dtype=np.int64)
+            turnaround = np.frombuffer(processes.turnaround_time, dtype=np.int64)
+            np.subtract(completion, arrival, out=turnaround)
+            np.subtract(turnaround, burst, out=np.frombuffer(processes.waiting_time, dtype=np.int64))
+            return
+        for p in processes:
+            p.turnaround_time = p.completion_time - p.arrival
+            p.waiting_time = p.turnaround_time - p.burst
+
+    @staticmethod
+    def _finish(processes, sorted_p):
+        # Tables get the vectorized pass; other inputs may be one-shot iterables
+        CPUScheduler.metrics(processes if isinstance(processes, ProcessTable) else sorted_p)
+
+    @staticmethod
+    def averages(processes):
+        """(avg waiting, avg turnaround) of a finished run"""
+        n = len(processes)
+        if not n:
+            return 0, 0
+        if isinstance(processes, ScheduleRows):
+            processes = processes.table
+        if np is not None and isinstance(processes, ProcessTable):
+            return (float(np.frombuffer(processes.waiting_time, dtype=np.int64).mean()),
+                    float(np.frombuffer(processes.turnaround_time, dtype=np.int64).mean()))
+        return (sum(p.waiting_time for p in processes) / n,
+                sum(p.turnaround_time for p in processes) / n)
+
+    @staticmethod
+    def context_switches(gantt):
+        """Dispatches that change the running process (idle gaps and the
+        'cs' switch segments themselves do not count)"""
+        if isinstance(gantt, GanttSegments):
+            return gantt.totals()[2]
+        switches = 0
+        last = None
+        for pid, _, _ in gantt:
+            if pid != 'idle' and pid != 'cs':
+                if last is not None and pid != last:
+                    switches += 1
+                last = pid
+        return switches
+
+    @staticmethod
+    def _pid_num(p):
+        return int(p.pid[1:])
+
+    @staticmethod
+    def _append_gantt(gantt, pid, start, end):
+        """Append a slice, extending the previous one if it is the same pid"""
+        if gantt and gantt[-1][0] == pid and gantt[-1][2] == start:
+            gantt[-1] = (pid, gantt[-1][1], end)
+        else:
+            gantt.append((pid, start, end))
+
+    @staticmethod
+    def _collect(events):
+        """Drain an engine's events into a Gantt list"""
         gantt = []
-        for p in sorted_p:
+        append = gantt.append
+        last_pid = last_end = None
+        for kind, item in events:
+            if kind == 'segment':
+                pid, start, end = item
+                # Same coalescing as _append_gantt, inlined for the hot loop
+                if pid == last_pid and start == last_end:
+                    gantt[-1] = (pid, gantt[-1][1], end)
+                else:
+                    append(item)
+                    last_pid = pid
+                last_end = end
+        return gantt
+
+    @staticmethod
+    def _stream(events):
+        """Coalesce an engine's segments and fill each process's metrics as it finishes"""
+        pending = None
+        for kind, item in events:
+            if kind == 'segment':
+                if pending and pending[0] == item[0] and pending[2] == item[1]:
+                    pending = (item[0], pending[1], item[2])
+                    continue
+                if pending:
+                    yield 'segment', pending
+                pending = item
+            else:
+                # A finished pid never runs again, so nothing can merge across this point
+                if pending:
+                    yield 'segment', pending
+                    pending = None
+                item.turnaround_time = item.completion_time - item.arrival
+                item.waiting_time = item.turnaround_time - item.burst
+                yield 'done', item
+        if pending:
+            yield 'segment', pending
+
+    @staticmethod
+    def _fcfs_events(arrivals, switch_cost=0):
+        time = 0
+        ran = False
+        for p in arrivals:
             if time < p.arrival:
-                gantt.append(('idle', time, p.arrival))
+                yield 'segment', ('idle', time, p.arrival)
                 time = p.arrival
+            if switch_cost and ran:
+                yield 'segment', ('cs', time, time + switch_cost)
+                time += switch_cost
+            ran = True
             p.start_time = time
-            gantt.append((p.pid, time, time + p.burst))
+            yield 'segment', (p.pid, time, time + p.burst)
             time += p.burst
             p.completion_time = time
-            p.turnaround_time = p.completion_time - p.arrival
-            p.waiting_time = p.turnaround_time - p.burst
-        return sorted_p, gantt
+            yield 'done', p
 
     @staticmethod
-    def sjf(processes):
-        sorted_p = sorted(processes, key=lambda p: (p.arrival, p.burst, int(p.pid[1:])))
+    def _nonpreemptive_events(arrivals, key, switch_cost=0):
+        """Event-driven dispatcher: arrival cursor + min-heap ready queue on key"""
+        arrivals = iter(arrivals)
+        nxt = next(arrivals, None)
         time = 0
-        gantt = []
-        completed = 0
-        while completed < len(sorted_p):
-            available = [p for p in sorted_p if p.arrival <= time and p.remaining > 0]
-            if not available:
-                next_arr = min((p.arrival for p in sorted_p if p.remaining > 0), default=time)
-                gantt.append(('idle', time, next_arr))
-                time = next_arr
+        ready = []
+        seq = 0
+        ran = False
+        while nxt is not None or ready:
+            while nxt is not None and nxt.arrival <= time:
+                heapq.heappush(ready, (key(nxt), seq, nxt))
+                seq += 1
+                nxt = next(arrivals, None)
+            if not ready:
+                yield 'segment', ('idle', time, nxt.arrival)
+                time = nxt.arrival
                 continue
-            current = min(available, key=lambda p: p.burst)
+            current = heapq.heappop(ready)[2]
+            # Every dispatch after the first switches to a new process
+            if switch_cost and ran:
+                yield 'segment', ('cs', time, time + switch_cost)
+                time += switch_cost
+            ran = True
             if current.start_time == -1:
                 current.start_time = time
-            gantt.append((current.pid, time, time + current.burst))
+            yield 'segment', (current.pid, time, time + current.burst)
             time += current.burst
             current.remaining = 0
             current.completion_time = time
-            current.turnaround_time = current.completion_time - current.arrival
-            current.waiting_time = current.turnaround_time - current.burst
-            completed += 1
-        return sorted_p, gantt
+            yield 'done', current
 
     @staticmethod
-    def priority(processes):
-        sorted_p = sorted(processes, key=lambda p: (p.arrival, p.priority, int(p.pid[1:])))
+    def _preemptive_events(arrivals, key, switch_cost=0):
+        """Event-driven preemptive dispatcher: the running process is only
+        re-evaluated when a new arrival is admitted, never per time unit"""
+        arrivals = iter(arrivals)
+        nxt = next(arrivals, None)
         time = 0
-        gantt = []
-        completed = 0
-        while completed < len(sorted_p):
-            available = [p for p in sorted_p if p.arrival <= time and p.remaining > 0]
-            if not available:
-                next_arr = min((p.arrival for p in sorted_p if p.remaining > 0), default=time)
-                gantt.append(('idle', time, next_arr))
-                time = next_arr
-                continue
-            current = min(available, key=lambda p: p.priority)
+        ready = []
+        seq = 0
+        current = None
+        last = None
+        while nxt is not None or ready or current is not None:
+            while nxt is not None and nxt.arrival <= time:
+                heapq.heappush(ready, (key(nxt), seq, nxt))
+                seq += 1
+                nxt = next(arrivals, None)
+            if current is not None and ready and ready[0][0] < key(current):
+                heapq.heappush(ready, (key(current), seq, current))
+                seq += 1
+                current = None
+            if current is None:
+                if not ready:
+                    yield 'segment', ('idle', time, nxt.arrival)
+                    time = nxt.arrival
+                    continue
+                current = heapq.heappop(ready)[2]
+            if switch_cost and last is not None and current is not last:
+                yield 'segment', ('cs', time, time + switch_cost)
+                time += switch_cost
+                # The switch completes before anything runs: admit arrivals
+                # made during it and hand the CPU to the best of them if needed
+                while nxt is not None and nxt.arrival <= time:
+                    heapq.heappush(ready, (key(nxt), seq, nxt))
+                    seq += 1
+                    nxt = next(arrivals, None)
+                if ready and ready[0][0] < key(current):
+                    heapq.heappush(ready, (key(current), seq, current))
+                    seq += 1
+                    current = heapq.heappop(ready)[2]
+            last = current
             if current.start_time == -1:
                 current.start_time = time
-            gantt.append((current.pid, time, time + current.burst))
-            time += current.burst
-            current.remaining = 0
-            current.completion_time = time
-            current.turnaround_time = current.completion_time - current.arrival
-            current.waiting_time = current.turnaround_time - current.burst
-            completed += 1
-        return sorted_p, gantt
+            run = current.remaining
+            if nxt is not None:
+                run = min(run, nxt.arrival - time)
+            yield 'segment', (current.pid, time, time + run)
+            time += run
+            current.remaining -= run
+            if current.remaining == 0:
+                current.completion_time = time
+                yield 'done', current
+                current = None
 
     @staticmethod
-    def round_robin(processes, quantum):
-        queue = []
+    def _rr_events(arrivals, quantum, switch_cost=0):
+        arrivals = iter(arrivals)
+        nxt = next(arrivals, None)
+        queue = deque()
         time = 0
-        gantt = []
-        completed = 0
-        n = len(processes)
-        sorted_p = sorted(processes, key=lambda p: p.arrival)
-        idx = 0
-        while completed < n:
-            while idx < n and sorted_p[idx].arrival <= time:
-                queue.append(sorted_p[idx])
-                idx += 1
+        last = None
+        while nxt is not None or queue:
+            while nxt is not None and nxt.arrival <= time:
+                queue.append(nxt)
+                nxt = next(arrivals, None)
             if not queue:
-                if idx < n:
-                    gantt.append(('idle', time, sorted_p[idx].arrival))
-                    time = sorted_p[idx].arrival
+                yield 'segment', ('idle', time, nxt.arrival)
+                time = nxt.arrival
                 continue
-            current = queue.pop(0)
+            current = queue.popleft()
+            if switch_cost and last is not None and current is not last:
+                yield 'segment', ('cs', time, time + switch_cost)
+                time += switch_cost
+                while nxt is not None and nxt.arrival <= time:
+                    queue.append(nxt)
+                    nxt = next(arrivals, None)
+            last = current
             if current.start_time == -1:
                 current.start_time = time
-            exec_time = min(quantum, current.remaining)
-            gantt.append((current.pid, time, time + exec_time))
+            if queue:
+                exec_time = min(quantum, current.remaining)
+            elif nxt is not None:
+                # Sole runnable process: skip every quantum that ends before the next arrival
+                slices = -(-(nxt.arrival - time) // quantum)
+                exec_time = min(slices * quantum, current.remaining)
+            else:
+                exec_time = current.remaining
+            yield 'segment', (current.pid, time, time + exec_time)
             time += exec_time
             current.remaining -= exec_time
-            while idx < n and sorted_p[idx].arrival <= time:
-                queue.append(sorted_p[idx])
-                idx += 1
+            while nxt is not None and nxt.arrival <= time:
+                queue.append(nxt)
+                nxt = next(arrivals, None)
             if current.remaining > 0:
                 queue.append(current)
             else:
                 current.completion_time = time
-                current.turnaround_time = current.completion_time - current.arrival
-                current.waiting_time = current.turnaround_time - current.burst
-                completed += 1
+                yield 'done', current
+
+    @staticmethod
+    def _mlfq_events(arrivals, quanta, boost_period, switch_cost=0):
+        levels = len(quanta)
+        bottom = levels - 1
+        queues = [deque() for _ in range(levels)]
+        top = queues[0]
+        boosted = deque()
+        arrivals = iter(arrivals)
+        nxt = next(arrivals, None)
+        next_arrival = nxt.arrival if nxt is not None else math.inf
+        time = 0
+        active = 0
+        epoch = 0
+        next_boost = boost_period if boost_period > 0 else math.inf
+        last = None
+        while nxt is not None or active:
+            while next_arrival <= time:
+                top.append(nxt)
+                active += 1
+                nxt = next(arrivals, None)
+                next_arrival = nxt.arrival if nxt is not None else math.inf
+            while boosted and not boosted[0]:
+                boosted.popleft()
+            if boosted:
+                current = boosted[0].popleft()
+                level = 0
+            elif top:
+                current = top.popleft()
+                level = 0
+            else:
+                for level in range(1, levels):
+                    if queues[level]:
+                        break
+                else:
+                    yield 'segment', ('idle', time, next_arrival)
+                    time = next_arrival
+                    if time >= next_boost:
+                        next_boost = (time // boost_period + 1) * boost_period
+                    continue
+                current = queues[level].popleft()
+            if switch_cost and last is not None and current is not last:
+                yield 'segment', ('cs', time, time + switch_cost)
+                time += switch_cost
+                while next_arrival <= time:
+                    top.append(nxt)
+                    active += 1
+                    nxt = next(arrivals, None)
+                    next_arrival = nxt.arrival if nxt is not None else math.inf
+            last = current
+            if current.start_time == -1:
+                current.start_time = time
+            dispatch_epoch = epoch
+            quantum = quanta[level]
+            remaining = current.remaining
+            if active > 1:
+                exec_time = quantum if quantum < remaining else remaining
+            else:
+                # Sole runnable process: run every slice that ends before the
+                # next arrival or boost at once, demoting as each is used up
+                horizon = min(next_arrival, next_boost) - time
+                exec_time = 0
+                while True:
+                    left = remaining - exec_time
+                    if horizon == math.inf:
+                        exec_time = remaining
+                        break
+                    if level == bottom:
+                        slices = max(1, -(-(horizon - exec_time) // quantum))
+                        exec_time += min(slices * quantum, left)
+                        break
+                    exec_time += min(quantum, left)
+                    if exec_time == remaining or exec_time >= horizon:
+                        break
+                    level += 1
+                    quantum = quanta[level]
+            yield 'segment', (current.pid, time, time + exec_time)
+            time += exec_time
+            remaining -= exec_time
+            current.remaining = remaining
+            while next_arrival <= time:
+                top.append(nxt)
+                active += 1
+                nxt = next(arrivals, None)
+                next_arrival = nxt.arrival if nxt is not None else math.inf
+            if time >= next_boost:
+                epoch += 1
+                next_boost = (time // boost_period + 1) * boost_period
+                boosted.extend(queues)
+                queues = [deque() for _ in range(levels)]
+                top = queues[0]
+            if remaining > 0:
+                if dispatch_epoch != epoch:
+                    level = 0
+                elif exec_time >= quantum and level < bottom:
+                    level += 1
+                queues[level].append(current)
+            else:
+                current.completion_time = time
+                active -= 1
+                yield 'done', current
+
+    # Linux prio_to_weight: CFS load weight for nice -20 .. 19 (nice 0 = 1024)
+    NICE_WEIGHTS = [
+        88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+        9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+        1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+        110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+    ]
+
+    @staticmethod
+    def _cfs_events(arrivals, min_granularity, sched_latency, switch_cost=0):
+        weights = CPUScheduler.NICE_WEIGHTS
+        heappush = heapq.heappush
+        arrivals = iter(arrivals)
+        nxt = next(arrivals, None)
+        next_arrival = nxt.arrival if nxt is not None else math.inf
+        time = 0
+        runqueue = []   # heap of (vruntime, seq, weight, process); leftmost runs next
+        seq = 0
+        total_weight = 0
+        min_vruntime = 0.0
+        last = None
+        requeue = None  # entry of the task just run, pushed back with the next pick
+        while nxt is not None or runqueue or requeue is not None:
+            while next_arrival <= time:
+                # New tasks start at min_vruntime so they cannot starve the rest
+                weight = weights[max(-20, min(19, nxt.priority)) + 20]
+                heappush(runqueue, (min_vruntime, seq, weight, nxt))
+                seq += 1
+                total_weight += weight
+                nxt = next(arrivals, None)
+                next_arrival = nxt.arrival if nxt is not None else math.inf
+            if requeue is not None:
+                vruntime, _, weight, current = heapq.heappushpop(runqueue, requeue)
+                requeue = None
+            elif runqueue:
+                vruntime, _, weight, current = heapq.heappop(runqueue)
+            else:
+                yield 'segment', ('idle', time, next_arrival)
+                time = next_arrival
+                continue
+            if switch_cost and last is not None and current is not last:
+                yield 'segment', ('cs', time, time + switch_cost)
+                time += switch_cost
+                while next_arrival <= time:
+                    arriving = weights[max(-20, min(19, nxt.priority)) + 20]
+                    heappush(runqueue, (min_vruntime, seq, arriving, nxt))
+                    seq += 1
+                    total_weight += arriving
+                    nxt = next(arrivals, None)
+                    next_arrival = nxt.arrival if nxt is not None else math.inf
+            last = current
+            if current.start_time == -1:
+                current.start_time = time
+            # Linux stretches the period once sched_latency / min_granularity
+            # tasks are runnable, so slices never drop below min_granularity
+            period = max(sched_latency, (len(runqueue) + 1) * min_granularity)
+            timeslice = max(min_granularity, period * weight // total_weight)
+            remaining = current.remaining
+            if runqueue:
+                run = timeslice if timeslice < remaining else remaining
+            elif nxt is not None:
+                # Alone on the CPU: take every slice that ends before the next arrival at once
+                slices = -(-(next_arrival - time) // timeslice)
+                run = min(slices * timeslice, remaining)
+            else:
+                run = remaining
+            yield 'segment', (current.pid, time, time + run)
+            time += run
+            remaining -= run
+            current.remaining = remaining
+            vruntime += run * 1024 / weight
+            min_vruntime = max(min_vruntime, min(vruntime, runqueue[0][0]) if runqueue else vruntime)
+            if remaining > 0:
+                requeue = (vruntime, seq, weight, current)
+                seq += 1
+            else:
+                current.completion_time = time
+                total_weight -= weight
+                yield 'done', current
+
+    @staticmethod
+    def _sjf_key(p):
+        return (p.burst, p.arrival, CPUScheduler._pid_num(p))
+
+    @staticmethod
+    def _priority_key(p):
+        return (p.priority, p.arrival, CPUScheduler._pid_num(p))
+
+    @staticmethod
+    def _srtf_key(p):
+        return (p.remaining, p.arrival, CPUScheduler._pid_num(p))
+
+    @staticmethod
+    def sjf(processes, switch_cost=0):
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, p.burst, int(p.pid[1:])))
+        gantt = CPUScheduler._collect(
+            CPUScheduler._nonpreemptive_events(sorted_p, CPUScheduler._sjf_key, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    @staticmethod
+    def priority(processes, switch_cost=0):
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, p.priority, int(p.pid[1:])))
+        gantt = CPUScheduler._collect(
+            CPUScheduler._nonpreemptive_events(sorted_p, CPUScheduler._priority_key, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    @staticmethod
+    def srtf(processes, switch_cost=0):
+        """Shortest Remaining Time First (preemptive SJF)"""
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, p.burst, int(p.pid[1:])))
+        gantt = CPUScheduler._collect(
+            CPUScheduler._preemptive_events(sorted_p, CPUScheduler._srtf_key, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
         return sorted_p, gantt
 
+    @staticmethod
+    def preemptive_priority(processes, switch_cost=0):
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, p.priority, int(p.pid[1:])))
+        gantt = CPUScheduler._collect(
+            CPUScheduler._preemptive_events(sorted_p, CPUScheduler._priority_key, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    @staticmethod
+    def round_robin(processes, quantum, switch_cost=0):
+        sorted_p = sorted(processes, key=lambda p: p.arrival)
+        gantt = CPUScheduler._collect(CPUScheduler._rr_events(sorted_p, quantum, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    @staticmethod
+    def mlfq(processes, quanta, boost_period=0, switch_cost=0):
+        """Multi-Level Feedback Queue.
+
+        quanta[i] is the time slice of level i (level 0 is highest). A process
+        that uses its whole slice is demoted one level; every boost_period time
+        units all processes return to level 0. Slices are not preempted by
+        arrivals. Boosting is lazy: the per-level deques are moved as a whole
+        onto a chain drained ahead of level 0, and the running process learns
+        about a boost through the epoch counter, so a boost costs O(levels).
+        A process running alone takes every slice up to the next arrival or
+        boost in one step, demoted level by level as each slice is used up.
+        """
+        sorted_p = sorted(processes, key=lambda p: p.arrival)
+        gantt = CPUScheduler._collect(
+            CPUScheduler._mlfq_events(sorted_p, quanta, boost_period, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    @staticmethod
+    def cfs(processes, min_granularity=4, sched_latency=None, switch_cost=0):
+        """Completely Fair Scheduler.
+
+        Each process accrues vruntime = runtime * 1024 / weight, with its
+        priority taken as a nice value (-20..19) for the weight. The leftmost
+        (smallest vruntime) process of the run queue runs for
+        period * weight / total weight, at least min_granularity, where
+        period = max(sched_latency, nr_running * min_granularity) as in
+        Linux. The run queue is a heap, so insert and pick-leftmost are
+        O(log n). Defaults are min_granularity=4 and sched_latency =
+        8 * min_granularity, the 6ms / 0.75ms ratio of Linux; a granularity
+        of 1 costs one heap operation per time unit under load.
+        """
+        if sched_latency is None:
+            sched_latency = 8 * min_granularity
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, CPUScheduler._pid_num(p)))
+        gantt = CPUScheduler._collect(
+            CPUScheduler._cfs_events(sorted_p, min_granularity, sched_latency, switch_cost))
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, gantt
+
+    # ── Streaming versions ──────────────────────────────────────────
+    # Each takes an iterable of processes already in arrival order (such as
+    # load_trace) and yields ('segment', (pid, start, end)) and
+    # ('done', process) as they are produced. Only runnable processes are
+    # held in memory, so traces of any size can be simulated.
+
+    @staticmethod
+    def fcfs_stream(arrivals, switch_cost=0):
+        return CPUScheduler._stream(CPUScheduler._fcfs_events(arrivals, switch_cost))
+
+    @staticmethod
+    def sjf_stream(arrivals, switch_cost=0):
+        return CPUScheduler._stream(
+            CPUScheduler._nonpreemptive_events(arrivals, CPUScheduler._sjf_key, switch_cost))
+
+    @staticmethod
+    def priority_stream(arrivals, switch_cost=0):
+        return CPUScheduler._stream(
+            CPUScheduler._nonpreemptive_events(arrivals, CPUScheduler._priority_key, switch_cost))
+
+    @staticmethod
+    def srtf_stream(arrivals, switch_cost=0):
+        return CPUScheduler._stream(
+            CPUScheduler._preemptive_events(arrivals, CPUScheduler._srtf_key, switch_cost))
+
+    @staticmethod
+    def preemptive_priority_stream(arrivals, switch_cost=0):
+        return CPUScheduler._stream(
+            CPUScheduler._preemptive_events(arrivals, CPUScheduler._priority_key, switch_cost))
+
+    @staticmethod
+    def round_robin_stream(arrivals, quantum, switch_cost=0):
+        return CPUScheduler._stream(CPUScheduler._rr_events(arrivals, quantum, switch_cost))
+
+    @staticmethod
+    def cfs_stream(arrivals, min_granularity=4, sched_latency=None, switch_cost=0):
+        if sched_latency is None:
+            sched_latency = 8 * min_granularity
+        return CPUScheduler._stream(
+            CPUScheduler._cfs_events(arrivals, min_granularity, sched_latency, switch_cost))
+
+    @staticmethod
+    def mlfq_stream(arrivals, quanta, boost_period=0, switch_cost=0):
+        return CPUScheduler._stream(
+            CPUScheduler._mlfq_events(arrivals, quanta, boost_period, switch_cost))
+
+    @staticmethod
+    def smp(processes, algo, cores, quantum=None, balancer="global", switch_cost=0):
+        """Simulate `cores` CPUs running FCFS, SJF, Priority or Round Robin.
+
+        balancer="global" shares one ready queue between all cores;
+        balancer="steal" gives every core its own queue (arrivals are spread
+        round-robin, preempted RR processes keep their core) and lets an idle
+        core with an empty queue steal from the longest one. A core pays
+        switch_cost whenever it runs a different process than it ran last.
+        Returns the processes and one Gantt lane per core.
+        """
+        pid_num = CPUScheduler._pid_num
+        keys = {
+            "FCFS": lambda p, seq: (p.arrival, pid_num(p)),
+            "SJF": lambda p, seq: (p.burst, p.arrival, pid_num(p)),
+            "Priority": lambda p, seq: (p.priority, p.arrival, pid_num(p)),
+            "Round Robin": lambda p, seq: (seq,),
+        }
+        if algo not in keys:
+            raise ValueError(f"Multi-core mode does not support {algo}")
+        if algo == "Round Robin" and not quantum:
+            raise ValueError("Round Robin needs a quantum")
+        key = keys[algo]
+        per_core = balancer == "steal"
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, pid_num(p)))
+        n = len(sorted_p)
+        lanes = [[] for _ in range(cores)]
+        lane_end = [0] * cores
+        queues = [[] for _ in range(cores if per_core else 1)]
+        longest = []   # lazy max-heap of (-len, core) used to pick steal victims
+        idle = list(range(cores))   # heap of idle cores, lazily pruned via is_idle
+        is_idle = [True] * cores
+        last = [None] * cores       # process index each core ran last
+        running = []   # heap of (slice end, core, process index, slice length)
+        queued = 0
+        seq = 0
+        placement = 0
+        idx = 0
+        completed = 0
+
+        def enqueue(q, i):
+            nonlocal queued, seq
+            heapq.heappush(queues[q], (key(sorted_p[i], seq), i))
+            seq += 1
+            queued += 1
+            if per_core:
+                heapq.heappush(longest, (-len(queues[q]), q))
+
+        def take(q):
+            nonlocal queued
+            queued -= 1
+            i = heapq.heappop(queues[q])[1]
+            if per_core and queues[q]:
+                heapq.heappush(longest, (-len(queues[q]), q))
+            return i
+
+        def dispatch(core, i, time):
+            p = sorted_p[i]
+            if lane_end[core] < time:
+                lanes[core].append(('idle', lane_end[core], time))
+            if switch_cost and last[core] is not None and last[core] != i:
+                lanes[core].append(('cs', time, time + switch_cost))
+                time += switch_cost
+            last[core] = i
+            if p.start_time == -1:
+                p.start_time = time
+            run = p.remaining if quantum is None else min(quantum, p.remaining)
+            CPUScheduler._append_gantt(lanes[core], p.pid, time, time + run)
+            lane_end[core] = time + run
+            is_idle[core] = False
+            heapq.heappush(running, (time + run, core, i, run))
+
+        def next_idle():
+            while idle:
+                core = heapq.heappop(idle)
+                if is_idle[core]:
+                    return core
+            return None
+
+        if algo != "Round Robin":
+            quantum = None
+        while completed < n:
+            time = sorted_p[idx].arrival if idx < n else running[0][0]
+            if running and running[0][0] < time:
+                time = running[0][0]
+            preempted = []
+            while running and running[0][0] == time:
+                _, core, i, run = heapq.heappop(running)
+                p = sorted_p[i]
+                p.remaining -= run
+                if p.remaining > 0:
+                    preempted.append((core, i))
+                else:
+                    p.completion_time = time
+                    completed += 1
+                is_idle[core] = True
+                heapq.heappush(idle, core)
+            touched = []
+            while idx < n and sorted_p[idx].arrival <= time:
+                q = placement % cores if per_core else 0
+                enqueue(q, idx)
+                touched.append(q)
+                placement += 1
+                idx += 1
+            for core, i in preempted:
+                q = core if per_core else 0
+                enqueue(q, i)
+                touched.append(q)
+            if per_core:
+                # Idle cores serve their own queue first ...
+                for core in touched:
+                    if is_idle[core] and queues[core]:
+                        dispatch(core, take(core), time)
+                # ... and only then steal from the longest queue
+                while queued:
+                    core = next_idle()
+                    if core is None:
+                        break
+                    while -longest[0][0] != len(queues[longest[0][1]]):
+                        heapq.heappop(longest)
+                    victim = heapq.heappop(longest)[1]
+                    dispatch(core, take(victim), time)
+            else:
+                while queued:
+                    core = next_idle()
+                    if core is None:
+                        break
+                    dispatch(core, take(0), time)
+        CPUScheduler._finish(processes, sorted_p)
+        return sorted_p, lanes
+
+class RealTimeScheduler:
+    """EDF and Rate-Monotonic scheduling of periodic RTTask sets.
+
+    The analyses work on the task parameters alone (synchronous release is
+    the worst case), so they stay fast when the hyperperiod is huge.
+    """
+
+    @staticmethod
+    def utilization(tasks):
+        return sum(t.wcet / t.period for t in tasks)
+
+    @staticmethod
+    def hyperperiod(tasks):
+        h = 1
+        for t in tasks:
+            h = h * t.period // math.gcd(h, t.period)
+        return h
+
+    @staticmethod
+    def liu_layland_bound(n):
+        return n * (2 ** (1 / n) - 1) if n else 1.0
+
+    @staticmethod
+    def rm_order(tasks):
+        return sorted(tasks, key=lambda t: (t.period, t.deadline))
+
+    @staticmethod
+    def response_times(tasks):
+        """Worst-case response time of each task under RM, in rm_order.
+
+        Iterates R = C + sum(ceil(R / Tj) * Cj) over the higher priority
+        tasks; None marks a task whose response time exceeds its deadline.
+        """
+        result = []
+        higher = []
+        for t in RealTimeScheduler.rm_order(tasks):
+            r = t.wcet + sum(h.wcet for h in higher)
+            while r <= t.deadline:
+                nxt = t.wcet + sum(-(-r // h.period) * h.wcet for h in higher)
+                if nxt == r:
+                    break
+                r = nxt
+            result.append((t, r if r <= t.deadline else None))
+            higher.append(t)
+        return result
+
+    @staticmethod
+    def rm_schedulable(tasks):
+        """Liu & Layland bound first, exact response-time analysis if it fails"""
+        implicit = all(t.deadline == t.period for t in tasks)
+        if implicit and RealTimeScheduler.utilization(tasks) <= \
+                RealTimeScheduler.liu_layland_bound(len(tasks)):
+            return True
+        return all(r is not None for _, r in RealTimeScheduler.response_times(tasks))
+
+    @staticmethod
+    def demand(tasks, t):
+        """Processor demand of all jobs with release and deadline in [0, t]"""
+        return sum((t - k.deadline) // k.period * k.wcet + k.wcet
+                   for k in tasks if t >= k.deadline)
+
+    @staticmethod
+    def edf_schedulable(tasks):
+        """Exact EDF test: U <= 1 for implicit deadlines, otherwise the
+        density test and then Quick Processor-demand Analysis (QPA), which
+        checks h(t) <= t at a handful of deadlines below the busy period."""
+        u = RealTimeScheduler.utilization(tasks)
+        if u > 1:
+            return False
+        if all(t.deadline == t.period for t in tasks) or \
+                sum(t.wcet / t.deadline for t in tasks) <= 1:
+            return True
+        # Synchronous busy period bounds the interval that must be checked
+        busy = sum(t.wcet for t in tasks)
+        while True:
+            nxt = sum(-(-busy // t.period) * t.wcet for t in tasks)
+            if nxt == busy:
+                break
+            busy = nxt
+        limit = busy
+        if u < 1:
+            la = max(max(t.deadline for t in tasks),
+                     sum((t.period - t.deadline) * t.wcet / t.period for t in tasks) / (1 - u))
+            limit = min(limit, int(la) + 1)
+
+        def last_deadline(before):
+            return max(((before - t.deadline - 1) // t.period * t.period + t.deadline
+                        for t in tasks if before > t.deadline), default=0)
+
+        min_deadline = min(t.deadline for t in tasks)
+        t = last_deadline(limit + 1)
+        h = RealTimeScheduler.demand(tasks, t)
+        while min_deadline < h <= t:
+            t = h if h < t else last_deadline(t)
+            h = RealTimeScheduler.demand(tasks, t)
+        return h <= min_deadline
+
+    @staticmethod
+    def simulate(tasks, policy="EDF", horizon=None):
+        """Run the task set until horizon (default: one hyperperiod).
+
+        Time jumps from one release to the next, the only points where a
+        preemption can happen, so the cost is O(jobs log n) regardless of
+        the length of the horizon. Returns (gantt, misses) where misses
+        lists (tid, release, deadline, finish) of jobs that finished late,
+        with finish None for jobs still unfinished at the horizon.
+        """
+        if horizon is None:
+            horizon = RealTimeScheduler.hyperperiod(tasks)
+        if policy == "EDF":
+            def key(task, i, deadline):
+                return deadline
+        elif policy == "RM":
+            rank = {id(t): r for r, t in enumerate(RealTimeScheduler.rm_order(tasks))}
+
+            def key(task, i, deadline):
+                return rank[id(task)]
+        else:
+            raise ValueError(f"unknown real-time policy {policy!r}")
+        releases = [(0, i) for i in range(len(tasks))]
+        heapq.heapify(releases)
+        ready = []      # heap of (key, seq, [task, release, deadline, remaining])
+        seq = 0
+        gantt = []
+        misses = []
+        time = 0
+        while time < horizon:
+            while releases and releases[0][0] <= time:
+                release, i = heapq.heappop(releases)
+                task = tasks[i]
+                deadline = release + task.deadline
+                heapq.heappush(ready, (key(task, i, deadline), seq,
+                                       [task, release, deadline, task.wcet]))
+                seq += 1
+                heapq.heappush(releases, (release + task.period, i))
+            next_release = min(releases[0][0], horizon) if releases else horizon
+            if not ready:
+                CPUScheduler._append_gantt(gantt, 'idle', time, next_release)
+                time = next_release
+                continue
+            job = ready[0][2]
+            run = min(job[3], next_release - time)
+            CPUScheduler._append_gantt(gantt, job[0].tid, time, time + run)
+            time += run
+            job[3] -= run
+            if job[3] == 0:
+                heapq.heappop(ready)
+                if time > job[2]:
+                    misses.append((job[0].tid, job[1], job[2], time))
+        for _, _, job in ready:
+            if job[2] <= horizon:
+                misses.append((job[0].tid, job[1], job[2], None))
+        return gantt, misses
+
+class IncrementalScheduler:
+    """FCFS, SJF or Priority over a growing workload, re-simulating only the tail.
+
+    While it runs, the dispatcher checkpoints (time, arrival cursor, ready
+    heap, Gantt length) at arrival boundaries. Adding processes never
+    changes a dispatch made before the earliest new arrival, so the next
+    run() resumes from the last checkpoint taken before it instead of from
+    t=0. A checkpoint is taken once at least max(every, len(ready))
+    dispatches have passed, which keeps the heap copies amortized O(1) per
+    dispatch. FCFS with no usable checkpoint (the first run, or an arrival
+    before every checkpoint) runs on the vectorized kernel instead, which
+    leaves one checkpoint at the end of the schedule for later arrivals.
+    """
+    KEYS = {
+        "FCFS": lambda p: (p.arrival, CPUScheduler._pid_num(p)),
+        "SJF": CPUScheduler._sjf_key,
+        "Priority": CPUScheduler._priority_key,
+    }
+
+    def __init__(self, algo, processes=(), every=64, switch_cost=0):
+        self.key = self.KEYS[algo]
+        self.algo = algo
+        self.every = every
+        self.switch_cost = switch_cost
+        self.table = ProcessTable()
+        self.order = []         # rows in arrival order
+        self.order_keys = []    # sort keys of self.order, for bisect
+        self.gantt = []
+        self.checkpoints = []   # (time, cursor, ready, seq, gantt length, last segment)
+        self.times = []         # checkpoint times, for bisect
+        self.dirty_from = 0     # earliest arrival not yet simulated; None when up to date
+        if isinstance(processes, ProcessTable):
+            self.table = processes.copy()
+        else:
+            for p in processes:
+                self.table.append(p.pid, p.arrival, p.burst, p.priority)
+        t = self.table
+        tie = t.burst if algo == "SJF" else t.priority if algo == "Priority" else bytes(len(t))
+        keys = list(zip(t.arrival, tie, t.pid))
+        order = sorted(range(len(t)), key=keys.__getitem__)
+        self.order_keys = [keys[i] for i in order]
+        self.order = [ProcessRow(t, i) for i in order]
+
+    def sort_key(self, i):
+        # Same arrival order (and tie-breaks) as the fcfs/sjf/priority list APIs
+        t = self.table
+        tie = t.burst[i] if self.algo == "SJF" else t.priority[i] if self.algo == "Priority" else 0
+        return (t.arrival[i], tie, t.pid[i])
+
+    def add(self, pid, arrival, burst, priority=0):
+        self.table.append(pid, arrival, burst, priority)
+        i = len(self.table) - 1
+        sort_key = self.sort_key(i)
+        at = bisect.bisect_right(self.order_keys, sort_key)
+        self.order_keys.insert(at, sort_key)
+        self.order.insert(at, ProcessRow(self.table, i))
+        if self.dirty_from is None or arrival < self.dirty_from:
+            self.dirty_from = arrival
+
+    def run(self):
+        """Bring the schedule up to date; returns (processes, gantt) like the list APIs"""
+        if self.dirty_from is not None:
+            self.resume(self.dirty_from)
+            self.dirty_from = None
+        # A GanttSegments lane is replaced, never mutated, by a later resume
+        gantt = self.gantt if isinstance(self.gantt, GanttSegments) else list(self.gantt)
+        return list(self.order), gantt
+
+    def run_arrays(self):
+        """Whole FCFS schedule from the vectorized kernel, checkpointed at its end"""
+        _, self.gantt = CPUScheduler.fcfs(self.table, self.switch_cost)
+        n = len(self.order)
+        end = self.gantt.finish()
+        self.checkpoints.append((end, n, (), n, len(self.gantt), self.gantt[-1]))
+        self.times.append(end)
+
+    def resume(self, arrival):
+        keep = bisect.bisect_left(self.times, arrival)
+        del self.checkpoints[keep:]
+        del self.times[keep:]
+        if not self.checkpoints and self.algo == "FCFS" and np is not None and self.order:
+            self.run_arrays()
+            return
+        if self.checkpoints:
+            time, cursor, ready, seq, length, last = self.checkpoints[-1]
+            ready = list(ready)
+            if isinstance(self.gantt, GanttSegments):
+                self.gantt = self.gantt[:length]
+            else:
+                del self.gantt[length:]
+            if length:
+                self.gantt[-1] = last
+        else:
+            time, cursor, ready, seq = 0, 0, [], 0
+            self.gantt = []
+
+        key = self.key
+        switch_cost = self.switch_cost
+        order = self.order
+        gantt = self.gantt
+        ran = len(gantt) > 1 or (len(gantt) == 1 and gantt[0][0] != 'idle')
+        append_gantt = CPUScheduler._append_gantt
+        n = len(order)
+        since = 0
+        while cursor < n or ready:
+            while cursor < n and order[cursor].arrival <= time:
+                p = order[cursor]
+                heapq.heappush(ready, (key(p), seq, p))
+                seq += 1
+                cursor += 1
+            if since >= max(self.every, len(ready)):
+                self.checkpoints.append((time, cursor, tuple(ready), seq, len(gantt),
+                                         gantt[-1] if gantt else None))
+                self.times.append(time)
+                since = 0
+            if not ready:
+                append_gantt(gantt, 'idle', time, order[cursor].arrival)
+                time = order[cursor].arrival
+                continue
+            current = heapq.heappop(ready)[2]
+            if switch_cost and ran:
+                append_gantt(gantt, 'cs', time, time + switch_cost)
+                time += switch_cost
+            ran = True
+            current.start_time = time
+            append_gantt(gantt, current.pid, time, time + current.burst)
+            time += current.burst
+            current.remaining = 0
+            current.completion_time = time
+            current.turnaround_time = time - current.arrival
+            current.waiting_time = current.turnaround_time - current.burst
+            since += 1
+
+class QuantileSketch:
+    """Streaming quantiles of non-negative integers in bounded memory.
+
+    A fixed-bucket log histogram: values below `linear` are counted exactly
+    and bucket i above it covers [linear * gamma^i, linear * gamma^(i+1)),
+    so every quantile is within `accuracy` relative error and even values
+    near 2^63 need only a couple of thousand buckets.
+    """
+    def __init__(self, accuracy=0.01):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.linear = math.ceil(1 / (self.gamma - 1))   # log buckets narrower than 1 below this
+        self.counts = array('q', bytes(8 * self.linear))
+        self.log_counts = array('q')
+        self.count = 0
+        self.max = 0
+
+    def copy(self):
+        sketch = QuantileSketch.__new__(QuantileSketch)
+        sketch.__dict__.update(self.__dict__)
+        sketch.counts = array('q', self.counts)
+        sketch.log_counts = array('q', self.log_counts)
+        return sketch
+
+    def add(self, value):
+        if value < self.linear:
+            self.counts[max(value, 0)] += 1
+        else:
+            i = int(math.log(value / self.linear) / self.log_gamma)
+            if i >= len(self.log_counts):
+                self.log_counts.extend(array('q', bytes(8 * (i + 1 - len(self.log_counts)))))
+            self.log_counts[i] += 1
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values):
+        """Add a NumPy integer array in a few vectorized passes"""
+        values = np.maximum(values, 0)
+        if not len(values):
+            return
+        top = int(values.max())
+        if top < len(values) // 8:
+            # many repeats: count each value once and bucket only the distinct ones
+            counts = np.bincount(values)
+            small = counts[:self.linear]
+            large = np.nonzero(counts[self.linear:])[0] + self.linear
+            weights = counts[large]
+        else:
+            small = np.bincount(values[values < self.linear], minlength=self.linear)
+            large = values[values >= self.linear]
+            weights = None
+        for i, n in enumerate(small.tolist()):
+            self.counts[i] += n
+        if len(large):
+            index = (np.log(large / self.linear) / self.log_gamma).astype(np.int64)
+            binned = np.bincount(index, weights).astype(np.int64).tolist()
+            if len(binned) > len(self.log_counts):
+                self.log_counts.extend(array('q', bytes(8 * (len(binned) - len(self.log_counts)))))
+            for i, n in enumerate(binned):
+                if n:
+                    self.log_counts[i] += n
+        self.count += len(values)
+        self.max = max(self.max, top)
+
+    def quantile(self, q):
+        """Value at quantile q (0..1) by nearest rank; 0 when empty"""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for value, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return value
+        for i, n in enumerate(self.log_counts):
+            seen += n
+            if seen >= rank:
+                low = self.linear * self.gamma ** i
+                # Harmonic mean of the bucket bounds keeps the error within accuracy
+                return min(2 * low * self.gamma / (1 + self.gamma), self.max)
+        return self.max
+
+    def summary(self):
+        """(p50, p90, p99, max)"""
+        return self.quantile(0.5), self.quantile(0.9), self.quantile(0.99), self.max
+
+class RunningStats:
+    """Online aggregates of a streaming run, updated per event in O(1) memory"""
+    def __init__(self):
+        self.completed = 0
+        self.avg_waiting = 0.0
+        self.avg_turnaround = 0.0
+        self.switches = 0
+        self.busy = 0       # time spent running processes
+        self.overhead = 0   # time spent in context switches
+        self.end = 0
+        self.last = None
+        self.waiting_sketch = QuantileSketch()
+        self.turnaround_sketch = QuantileSketch()
+        self.response_sketch = QuantileSketch()
+
+    @classmethod
+    def for_lanes(cls, lanes, processes):
+        """Stats of a finished run: its processes and one Gantt lane per core"""
+        stats = cls()
+        if np is not None and isinstance(processes, ProcessTable) and len(processes):
+            column = {name: np.frombuffer(getattr(processes, name), dtype=np.int64)
+                      for name in ('arrival', 'start_time', 'waiting_time', 'turnaround_time')}
+            stats.completed = len(processes)
+            stats.avg_waiting = float(column['waiting_time'].mean())
+            stats.avg_turnaround = float(column['turnaround_time'].mean())
+            stats.waiting_sketch.add_many(column['waiting_time'])
+            stats.turnaround_sketch.add_many(column['turnaround_time'])
+            response = column['start_time'] - column['arrival']
+            if np.array_equal(response, column['waiting_time']):
+                # non-preemptive runs respond when they stop waiting
+                stats.response_sketch = stats.waiting_sketch.copy()
+            else:
+                stats.response_sketch.add_many(response)
+        else:
+            for p in processes:
+                stats.update('done', p)
+        for lane in lanes:
+            stats.last = None
+            if isinstance(lane, GanttSegments):
+                if len(lane):
+                    busy, overhead, switches = lane.totals()
+                    stats.busy += busy
+                    stats.overhead += overhead
+                    stats.switches += switches
+                    stats.end = max(stats.end, lane.finish())
+                continue
+            for segment in lane:
+                stats.update('segment', segment)
+        return stats
+
+    def update(self, kind, item):
+        if kind == 'done':
+            self.completed += 1
+            self.avg_waiting += (item.waiting_time - self.avg_waiting) / self.completed
+            self.avg_turnaround += (item.turnaround_time - self.avg_turnaround) / self.completed
+            self.waiting_sketch.add(item.waiting_time)
+            self.turnaround_sketch.add(item.turnaround_time)
+            self.response_sketch.add(item.start_time - item.arrival)
+            return
+        pid, start, end = item
+        if pid == 'cs':
+            self.overhead += end - start
+        elif pid != 'idle':
+            self.busy += end - start
+            if self.last is not None and pid != self.last:
+                self.switches += 1
+            self.last = pid
+        self.end = max(self.end, end)
+
+    def rates(self, cores=1):
+        """(CPU utilization, throughput in jobs per time unit, overhead fraction)"""
+        if not self.end:
+            return 0.0, 0.0, 0.0
+        capacity = self.end * cores
+        return self.busy / capacity, self.completed / self.end, self.overhead / capacity
+
+def _trace_pid(value, n):
+    if value is None or value == "":
+        return f"P{n}"
+    text = str(value)
+    digits = text[1:] if text[:1] in ("P", "p") else text
+    if not digits.isdigit():
+        raise ValueError(f"pid {text!r} must be a number or P<number>")
+    return f"P{int(digits)}"
+
+def load_trace(path):
+    """Stream processes from a CSV or JSONL trace file one record at a time.
+
+    CSV needs a header row with arrival and burst columns (pid and priority
+    are optional); JSONL has one object per line with the same keys. Records
+    must be sorted by arrival so the *_stream schedulers can consume them
+    without buffering the file.
+    """
+    jsonl = path.lower().endswith(('.jsonl', '.ndjson'))
+    with open(path, newline='') as f:
+        records = (json.loads(line) for line in f if line.strip()) if jsonl else csv.DictReader(f)
+        last_arrival = None
+        for n, rec in enumerate(records, 1):
+            try:
+                arrival = int(rec['arrival'])
+                burst = int(rec['burst'])
+                priority = int(rec.get('priority') or 0)
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"{path}: record {n} needs integer arrival and burst values")
+            if burst <= 0:
+                raise ValueError(f"{path}: record {n} has a non-positive burst")
+            if last_arrival is not None and arrival < last_arrival:
+                raise ValueError(f"{path}: record {n} is out of arrival order")
+            last_arrival = arrival
+            yield Process(_trace_pid(rec.get('pid'), n), arrival, burst, priority)
+
+class SharedWorkload:
+    """The input columns of a ProcessTable in one shared memory block.
+
+    Worker processes attach to it by name, so a workload is copied into each
+    worker once instead of being pickled with every task.
+    """
+    def __init__(self, table):
+        self.n = len(table)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, 8 * len(ProcessTable.INPUTS) * self.n))
+        offset = 0
+        for name in ProcessTable.INPUTS:
+            data = getattr(table, name).tobytes()
+            self.shm.buf[offset:offset + len(data)] = data
+            offset += len(data)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @staticmethod
+    def attach(name, n):
+        """Rebuild a ProcessTable from the block (called in the workers)"""
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            table = ProcessTable()
+            for i, column in enumerate(ProcessTable.INPUTS):
+                getattr(table, column).frombytes(shm.buf[8 * n * i:8 * n * (i + 1)])
+            table.reset()
+        finally:
+            shm.close()
+        return table
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+_worker_table = None
+
+def _sweep_init(name, n):
+    global _worker_table
+    _worker_table = SharedWorkload.attach(name, n)
+
+def _sweep_run(quantum, switch_cost):
+    table = _worker_table.copy()
+    _, gantt = CPUScheduler.round_robin(table, quantum, switch_cost)
+    avg_wt, avg_tat = CPUScheduler.averages(table)
+    return quantum, avg_wt, avg_tat, CPUScheduler.context_switches(gantt)
+
+class ParallelRun:
+    """A batch of independent simulations on a process pool.
+
+    Iterate it to block on the results, or call poll() from a UI timer to
+    collect whatever has finished; results come in completion order and
+    each is passed to collect() first.
+    """
+    workload = None
+
+    def _start(self, calls, workers, initializer=None, initargs=()):
+        # Workers must not be forked from this process: a pool may still be
+        # shutting down on a release thread, and fork only copies the caller
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=context,
+                                            initializer=initializer, initargs=initargs)
+        self.pending = {self.executor.submit(*call) for call in calls}
+        self.total = len(self.pending)
+
+    def collect(self, result):
+        pass
+
+    def poll(self):
+        done = [f for f in self.pending if f.done()]
+        self.pending.difference_update(done)
+        if not self.pending:
+            self.close()
+        results = [f.result() for f in done]
+        for result in results:
+            self.collect(result)
+        return results
+
+    def __iter__(self):
+        try:
+            for future in as_completed(list(self.pending)):
+                self.pending.discard(future)
+                result = future.result()
+                self.collect(result)
+                yield result
+        finally:
+            self.close()
+
+    def close(self):
+        """Cancel what has not started; a shared workload is unlinked only
+        after every worker has exited, so none can attach to a removed name"""
+        if self.executor is None:
+            return
+        executor, self.executor = self.executor, None
+        threading.Thread(target=self._release, args=(executor,)).start()
+
+    def _release(self, executor):
+        executor.shutdown(wait=True, cancel_futures=True)
+        if self.workload is not None:
+            self.workload.close()
+
+class QuantumSweep(ParallelRun):
+    """Round Robin over many quanta of one workload.
+
+    Each result is (quantum, avg waiting, avg turnaround, context switches).
+    """
+    def __init__(self, processes, quanta, workers=None, switch_cost=0):
+        table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+        self.workload = SharedWorkload(table)
+        self._start([(_sweep_run, q, switch_cost) for q in quanta], workers,
+                    _sweep_init, (self.workload.name, self.workload.n))
+
+def _random_workload(rnd, sizes, arrivals, bursts, priorities, burst_dist):
+    spec = []
+    for i in range(rnd.randint(*sizes)):
+        if burst_dist == "exponential":
+            burst = max(1, round(rnd.expovariate(2 / (bursts[0] + bursts[1]))))
+        else:
+            burst = rnd.randint(*bursts)
+        spec.append((f"P{i+1}", rnd.randint(*arrivals), burst, rnd.randint(*priorities)))
+    return spec
+
+def _monte_carlo_chunk(first, count, params):
+    seed, quantum, switch_cost, shape = params
+    runs = {
+        "FCFS": lambda ps: CPUScheduler.fcfs(ps, switch_cost),
+        "SJF": lambda ps: CPUScheduler.sjf(ps, switch_cost),
+        "Priority": lambda ps: CPUScheduler.priority(ps, switch_cost),
+        "Round Robin": lambda ps: CPUScheduler.round_robin(ps, quantum, switch_cost),
+    }
+    waiting = {name: array('d') for name in runs}
+    turnaround = {name: array('d') for name in runs}
+    for i in range(first, first + count):
+        # Workload i depends only on (seed, i), whichever worker builds it
+        spec = _random_workload(random.Random(f"{seed}:{i}"), *shape)
+        for name, run in runs.items():
+            processes, _ = run([Process(*s) for s in spec])
+            avg_wt, avg_tat = CPUScheduler.averages(processes)
+            waiting[name].append(avg_wt)
+            turnaround[name].append(avg_tat)
+    return waiting, turnaround
+
+class MonteCarloStudy(ParallelRun):
+    """FCFS, SJF, Priority and Round Robin on many seeded random workloads.
+
+    Workloads are generated inside the workers from (seed, index), so only
+    the per-workload averages travel back. sizes, arrivals, bursts and
+    priorities are (low, high) ranges; burst_dist "exponential" draws
+    bursts with the mean of the bursts range instead of uniformly.
+    """
+    ALGORITHMS = ("FCFS", "SJF", "Priority", "Round Robin")
+
+    def __init__(self, workloads, seed=0, sizes=(4, 7), arrivals=(0, 10), bursts=(2, 12),
+                 priorities=(1, 5), burst_dist="uniform", quantum=2, switch_cost=0,
+                 workers=None, chunk=500):
+        self.waiting = {name: array('d') for name in self.ALGORITHMS}
+        self.turnaround = {name: array('d') for name in self.ALGORITHMS}
+        self.done = 0
+        params = (seed, quantum, switch_cost, (sizes, arrivals, bursts, priorities, burst_dist))
+        self._start([(_monte_carlo_chunk, first, min(chunk, workloads - first), params)
+                     for first in range(0, workloads, chunk)], workers)
+
+    def collect(self, result):
+        waiting, turnaround = result
+        for name in self.ALGORITHMS:
+            self.waiting[name].extend(waiting[name])
+            self.turnaround[name].extend(turnaround[name])
+        self.done += len(waiting[self.ALGORITHMS[0]])
+
+    @staticmethod
+    def percentile(ordered, p):
+        """Nearest-rank percentile of an already sorted sequence"""
+        return ordered[max(0, -(-p * len(ordered) // 100) - 1)]
+
+    def summary(self):
+        """Per algorithm: mean/p50/p95/p99 of avg waiting and avg turnaround
+        over the finished workloads, and the win rate (share of workloads
+        where it had the lowest avg waiting; ties count for every winner)"""
+        wins = dict.fromkeys(self.ALGORITHMS, 0)
+        for values in zip(*(self.waiting[name] for name in self.ALGORITHMS)):
+            best = min(values)
+            for name, value in zip(self.ALGORITHMS, values):
+                if value == best:
+                    wins[name] += 1
+        result = {}
+        for name in self.ALGORITHMS:
+            stats = {"win_rate": wins[name] / self.done if self.done else 0.0}
+            for metric, values in (("waiting", self.waiting[name]),
+                                   ("turnaround", self.turnaround[name])):
+                ordered = sorted(values)
+                stats[metric] = {
+                    "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+                    **{f"p{p}": self.percentile(ordered, p) if ordered else 0.0
+                       for p in (50, 95, 99)},
+                }
+            result[name] = stats
+        return result
+
+class GanttChart:
+    """Gantt renderer that only draws what lies inside the visible time window.
+
+    Segment start times are indexed per lane, so the visible slice of a lane
+    is found by binary search. Segments narrower than a pixel are merged into
+    density bars shaded by how busy the CPU was; when a lane has far more
+    visible segments than pixels, each pixel column is shaded straight from a
+    busy-time prefix sum instead. Mouse wheel zooms around the cursor,
+    dragging pans and double-click resets the view.
+    """
+    COLORS = ['#00d4aa', '#3fb950', '#d29922', '#f85149', '#a371f7', '#79c0ff']
+    MIN_WIDTH = 2        # px; narrower segments are merged into density bars
+    LABEL_LIMIT = 40     # label every segment boundary up to this many visible segments
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.label_width = 0
+        self.bar_height = 60
+        self.row_height = 85
+        self.lanes = []
+        self.starts = []
+        self.busy = []
+        self.total = 0
+        self.view_start = 0
+        self.view_end = 0
+        self.drag_x = None
+        canvas.bind('<MouseWheel>', self.on_wheel)
+        canvas.bind('<Button-4>', self.on_wheel)
+        canvas.bind('<Button-5>', self.on_wheel)
+        canvas.bind('<ButtonPress-1>', self.on_press)
+        canvas.bind('<B1-Motion>', self.on_drag)
+        canvas.bind('<Double-Button-1>', self.reset_view)
+        canvas.bind('<Configure>', lambda e: self.redraw())
+
+    def clear(self):
+        self.lanes = []
+        self.starts = []
+        self.busy = []
+        self.canvas.delete("all")
+
+    def set_lanes(self, lanes):
+        """Show one row per lane; each lane is a list of (pid, start, end)"""
+        self.lanes = lanes
+        self.starts = []
+        self.busy = []
+        for lane in lanes:
+            if isinstance(lane, GanttSegments):
+                self.starts.append(lane.start)
+                self.busy.append(lane.busy_before())
+                continue
+            starts = array('q')
+            busy = array('q')
+            total = 0
+            for pid, start, end in lane:
+                starts.append(start)
+                busy.append(total)
+                if pid != 'idle':
+                    total += end - start
+            self.starts.append(starts)
+            self.busy.append(busy)
+        self.total = max((lane[-1][2] for lane in lanes if lane), default=0)
+        multi = len(lanes) > 1
+        self.label_width = 50 if multi else 0
+        self.bar_height = 30 if multi else 60
+        self.row_height = self.bar_height + 25
+        self.canvas.config(height=max(100, 30 + self.row_height * len(lanes)) if multi else 100)
+        self.reset_view()
+
+    def reset_view(self, event=None):
+        self.view_start = 0
+        self.view_end = self.total
+        self.redraw()
+
+    def geometry(self):
+        width = self.canvas.winfo_width()
+        if width <= 1:
+            width = 940
+        x0 = 20 + self.label_width
+        span = self.view_end - self.view_start
+        scale = (width - 20 - x0) / span if span > 0 else 1
+        return x0, scale
+
+    def busy_until(self, row, t):
+        """CPU-busy time of a lane in [0, t]"""
+        lane = self.lanes[row]
+        i = bisect.bisect_right(self.starts[row], t) - 1
+        if i < 0:
+            return 0
+        pid, start, end = lane[i]
+        busy = self.busy[row][i]
+        if pid != 'idle':
+            busy += min(t, end) - start
+        return busy
+
+    def redraw(self):
+        self.canvas.delete("all")
+        if not any(self.lanes) or self.view_end <= self.view_start:
+            return
+        x0, scale = self.geometry()
+        labelled = True
+        for row, lane in enumerate(self.lanes):
+            y = 30 + row * self.row_height
+            if self.label_width:
+                self.canvas.create_text(20, y + self.bar_height/2, text=f"CPU{row}",
+                                        font=Theme.FONT_SMALL, fill=Theme.TEXT_DIM, anchor='w')
+            if not lane:
+                continue
+            starts = self.starts[row]
+            lo = max(0, bisect.bisect_right(starts, self.view_start) - 1)
+            hi = bisect.bisect_left(starts, self.view_end)
+            columns = int((self.view_end - self.view_start) * scale)
+            if hi - lo > columns:
+                self.draw_density(row, y, x0, scale, columns)
+                labelled = False
+            else:
+                label_times = hi - lo <= self.LABEL_LIMIT
+                self.draw_segments(lane, lo, hi, y, x0, scale, label_times)
+                labelled = labelled and label_times
+        if not labelled:
+            self.draw_axis(x0, scale)
+
+    def draw_segments(self, lane, lo, hi, y, x0, scale, label_times):
+        height = self.bar_height
+        bar_start = None
+        bar_busy = 0
+        bar_end = 0
+        for pid, start, end in lane[lo:hi]:
+            start = max(start, self.view_start)
+            end = min(end, self.view_end)
+            x = x0 + (start - self.view_start) * scale
+            width = (end - start) * scale
+            if width < self.MIN_WIDTH:
+                if bar_start is None:
+                    bar_start = start
+                    bar_busy = 0
+                if pid != 'idle':
+                    bar_busy += end - start
+                bar_end = end
+                if (bar_end - bar_start) * scale >= self.MIN_WIDTH:
+                    self.draw_bar(bar_start, bar_end, bar_busy, y, x0, scale)
+                    bar_start = None
+                continue
+            if bar_start is not None:
+                self.draw_bar(bar_start, bar_end, bar_busy, y, x0, scale)
+                bar_start = None
+            if pid == 'idle':
+                self.canvas.create_rectangle(x, y, x + width, y + height,
+                                             fill=Theme.BG_TERTIARY, outline=Theme.BORDER)
+                text, font, fill = "IDLE", Theme.FONT_SMALL, Theme.TEXT_DIM
+            elif pid == 'cs':
+                self.canvas.create_rectangle(x, y, x + width, y + height,
+                                             fill=Theme.WARNING, outline=Theme.BORDER)
+                text, font, fill = "CS", Theme.FONT_SMALL, Theme.BG_DARK
+            else:
+                self.canvas.create_rectangle(x, y, x + width, y + height,
+                                             fill=self.COLORS[hash(pid) % len(self.COLORS)],
+                                             outline=Theme.BORDER)
+                text, font, fill = pid, Theme.FONT_BOLD, Theme.BG_DARK
+            if width >= 9 * len(text):
+                self.canvas.create_text(x + width/2, y + height/2, text=text, font=font, fill=fill)
+            if label_times:
+                self.canvas.create_text(x, y + height + 10, text=str(start),
+                                        font=Theme.FONT_SMALL, fill=Theme.TEXT_DIM, anchor='n')
+        if bar_start is not None:
+            self.draw_bar(bar_start, bar_end, bar_busy, y, x0, scale)
+        if label_times and lane[hi - 1][2] <= self.view_end:
+            end = lane[hi - 1][2]
+            self.canvas.create_text(x0 + (end - self.view_start) * scale, y + height + 10,
+                                    text=str(end), font=Theme.FONT_SMALL,
+                                    fill=Theme.TEXT_DIM, anchor='n')
+
+    def draw_density(self, row, y, x0, scale, columns):
+        """One bar per pixel column, shaded by the busy fraction of its time span"""
+        step = max(1, columns // 300)
+        t_per_px = 1 / scale
+        prev = self.busy_until(row, self.view_start)
+        for col in range(0, columns, step):
+            t1 = self.view_start + (col + step) * t_per_px
+            busy = self.busy_until(row, t1)
+            fraction = (busy - prev) / (step * t_per_px)
+            prev = busy
+            self.canvas.create_rectangle(x0 + col, y, x0 + col + step, y + self.bar_height,
+                                         fill=self.shade(fraction), width=0)
+
+    def draw_bar(self, start, end, busy, y, x0, scale):
+        x = x0 + (start - self.view_start) * scale
+        self.canvas.create_rectangle(x, y, x0 + (end - self.view_start) * scale, y + self.bar_height,
+                                     fill=self.shade(busy / (end - start)), width=0)
+
+    def draw_axis(self, x0, scale):
+        """Tick labels for zoomed-in or dense views, where per-segment labels would collide"""
+        span = self.view_end - self.view_start
+        if span <= 0:
+            return
+        y = 30 + (len(self.lanes) - 1) * self.row_height + self.bar_height + 10
+        step = 10 ** max(0, len(str(int(span // 8))) - 1)
+        while span / step > 10:
+            step *= 2
+        t = (self.view_start // step + 1) * step
+        while t < self.view_end:
+            x = x0 + (t - self.view_start) * scale
+            self.canvas.create_line(x, y - 4, x, y, fill=Theme.BORDER)
+            self.canvas.create_text(x, y, text=str(int(t)), font=Theme.FONT_SMALL,
+                                    fill=Theme.TEXT_DIM, anchor='n')
+            t += step
+
+    @staticmethod
+    def shade(fraction):
+        """Blend from the idle colour to the accent colour by busy fraction"""
+        fraction = min(1.0, max(0.0, fraction))
+        lo = (0x21, 0x26, 0x2d)
+        hi = (0x00, 0xd4, 0xaa)
+        return '#%02x%02x%02x' % tuple(int(a + (b - a) * fraction) for a, b in zip(lo, hi))
+
+    def on_wheel(self, event):
+        if not any(self.lanes):
+            return
+        zoom_in = event.num == 4 or getattr(event, 'delta', 0) > 0
+        x0, scale = self.geometry()
+        anchor = self.view_start + (event.x - x0) / scale
+        factor = 0.8 if zoom_in else 1.25
+        span = min(self.total, max(1, (self.view_end - self.view_start) * factor))
+        anchor = min(max(anchor, self.view_start), self.view_end)
+        ratio = (anchor - self.view_start) / (self.view_end - self.view_start)
+        self.set_view(anchor - ratio * span, span)
+
+    def on_press(self, event):
+        self.drag_x = event.x
+
+    def on_drag(self, event):
+        if self.drag_x is None or not any(self.lanes):
+            return
+        _, scale = self.geometry()
+        shift = (self.drag_x - event.x) / scale
+        self.drag_x = event.x
+        self.set_view(self.view_start + shift, self.view_end - self.view_start)
+
+    def set_view(self, start, span):
+        start = min(max(0, start), self.total - span)
+        self.view_start = start
+        self.view_end = start + span
+        self.redraw()
+
+class VirtualTable:
+    """Treeview that only materializes the rows in view.
+
+    A fixed pool of `height` items is rewritten as the table scrolls, so a
+    10k- or 10M-row result costs the same number of widgets. Clicking a
+    heading sorts a permutation of row indices; the rows themselves (and the
+    simulation) are left untouched. Sorting compares the raw cells from
+    `values`; `formats` maps a column index to how its cell is displayed.
+    """
+    def __init__(self, parent, columns, values, height=8, formats=None):
+        self.columns = columns
+        self.values = values
+        self.formats = formats or {}
+        self.height = height
+        self.rows = []
+        self.order = range(0)
+        self.top = 0
+        self.sort_column = None
+        self.sort_reverse = False
+
+        style = ttk.Style(parent)
+        style.configure('Sim.Treeview', background=Theme.BG_DARK, fieldbackground=Theme.BG_DARK,
+                        foreground=Theme.TEXT, font=Theme.FONT, rowheight=22, borderwidth=0)
+        style.configure('Sim.Treeview.Heading', background=Theme.BG_TERTIARY,
+                        foreground=Theme.ACCENT, font=Theme.FONT_BOLD, relief='flat')
+
+        frame = tk.Frame(parent, bg=Theme.BG_DARK)
+        frame.pack(fill=tk.X)
+        self.tree = ttk.Treeview(frame, columns=columns, show='headings',
+                                 height=height, style='Sim.Treeview', selectmode='none')
+        for i, col in enumerate(columns):
+            self.tree.heading(col, text=col, command=lambda i=i: self.sort_by(i))
+            self.tree.column(col, width=100, anchor='center')
+        self.scrollbar = ttk.Scrollbar(frame, orient='vertical', command=self.on_scrollbar)
+        self.tree.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self.on_wheel)
+
+    def set_rows(self, rows):
+        """Show `rows` (any sequence); `values(row)` gives the cells of one row"""
+        self.rows = rows
+        self.order = range(len(rows))
+        self.sort_column = None
+        self.top = 0
+        self.refresh()
+
+    def refresh(self):
+        n = len(self.order)
+        visible = min(self.height, n)
+        items = self.tree.get_children()
+        if len(items) > visible:
+            self.tree.delete(*items[visible:])
+            items = items[:visible]
+        for _ in range(visible - len(items)):
+            items += (self.tree.insert('', tk.END),)
+        for k, item in enumerate(items):
+            cells = self.values(self.rows[self.order[self.top + k]])
+            if self.formats:
+                cells = [self.formats[i](cell) if i in self.formats else cell
+                         for i, cell in enumerate(cells)]
+            self.tree.item(item, values=cells)
+        if n:
+            self.scrollbar.set(self.top / n, (self.top + visible) / n)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, top):
+        top = max(0, min(int(top), len(self.order) - self.height))
+        if top != self.top:
+            self.top = top
+            self.refresh()
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.order))
+        elif unit == 'pages':
+            self.scroll_to(self.top + int(amount) * self.height)
+        else:
+            self.scroll_to(self.top + int(amount))
+
+    def on_wheel(self, event):
+        if event.num == 5 or getattr(event, 'delta', 0) < 0:
+            self.scroll_to(self.top + 3)
+        else:
+            self.scroll_to(self.top - 3)
+        return "break"
+
+    def sort_by(self, column):
+        if not self.rows:
+            return
+        self.sort_reverse = self.sort_column == column and not self.sort_reverse
+        self.sort_column = column
+
+        def key(i):
+            value = self.values(self.rows[i])[column]
+            if isinstance(value, str) and value[1:].isdigit():
+                return int(value[1:])  # "P12" sorts after "P2"
+            return value
+        self.order = sorted(range(len(self.rows)), key=key, reverse=self.sort_reverse)
+        self.top = 0
+        self.refresh()
+
 class CPUSchedulingGUI:
+    STREAM_CHUNK = 20000          # completions handled per UI tick while streaming
+    STREAM_GANTT_LIMIT = 100000   # segments kept for the chart of a streamed trace
+
     def __init__(self, parent):
         self.parent = parent
-        self.processes = []
+        self.processes = ProcessTable()
         self.counter = 1
+        self.stream_events = None
+        self.sweep = None
+        self.study = None
+        self.incremental = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -164,27 +2125,71 @@ class CPUSchedulingGUI:
                   padx=12, pady=5, cursor='hand2',
                   command=self.clear_all).pack(side=tk.LEFT, padx=5)
 
+        tk.Button(input_frame, text="Stream Trace", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.TEXT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.stream_trace).pack(side=tk.LEFT, padx=5)
+
         self.process_frame = tk.Frame(main, bg=Theme.BG_DARK)
         self.process_frame.pack(fill=tk.X, pady=10)
+        self.process_table = VirtualTable(self.process_frame, ["PID", "Arrival", "Burst", "Priority"],
+                                          lambda p: (p.pid, p.arrival, p.burst, p.priority), height=5)
         self.update_process_list()
 
         algo_frame = tk.Frame(main, bg=Theme.BG_SECONDARY, padx=15, pady=12)
         algo_frame.pack(fill=tk.X, pady=10)
+        algo_row = tk.Frame(algo_frame, bg=Theme.BG_SECONDARY)
+        algo_row.pack(fill=tk.X)
         self.algo_var = tk.StringVar(value="FCFS")
-        algorithms = ["FCFS", "SJF", "Priority", "Round Robin"]
+        algorithms = ["FCFS", "SJF", "SRTF", "Priority", "Priority (P)", "Round Robin", "MLFQ", "CFS"]
         for algo in algorithms:
-            tk.Radiobutton(algo_frame, text=algo, variable=self.algo_var, value=algo,
+            tk.Radiobutton(algo_row, text=algo, variable=self.algo_var, value=algo,
                            font=Theme.FONT, bg=Theme.BG_SECONDARY, fg=Theme.TEXT,
-                           selectcolor=Theme.BG_TERTIARY).pack(side=tk.LEFT, padx=15)
+                           selectcolor=Theme.BG_TERTIARY).pack(side=tk.LEFT, padx=(0, 15))
 
-        tk.Label(algo_frame, text="Quantum:", font=Theme.FONT_SMALL,
-                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(30, 5))
-        self.quantum_entry = tk.Entry(algo_frame, width=6, font=Theme.FONT,
+        param_row = tk.Frame(algo_frame, bg=Theme.BG_SECONDARY)
+        param_row.pack(fill=tk.X, pady=(8, 0))
+        tk.Label(param_row, text="Quantum (RR/CFS):", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(0, 5))
+        self.quantum_entry = tk.Entry(param_row, width=6, font=Theme.FONT,
                                       bg=Theme.BG_INPUT, fg=Theme.TEXT)
         self.quantum_entry.insert(0, "2")
         self.quantum_entry.pack(side=tk.LEFT)
 
-        tk.Button(algo_frame, text="Run Simulation", font=Theme.FONT_BOLD,
+        tk.Label(param_row, text="MLFQ Quanta:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(20, 5))
+        self.levels_entry = tk.Entry(param_row, width=10, font=Theme.FONT,
+                                     bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.levels_entry.insert(0, "2,4,8")
+        self.levels_entry.pack(side=tk.LEFT)
+
+        tk.Label(param_row, text="Boost:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(20, 5))
+        self.boost_entry = tk.Entry(param_row, width=6, font=Theme.FONT,
+                                    bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.boost_entry.insert(0, "20")
+        self.boost_entry.pack(side=tk.LEFT)
+
+        tk.Label(param_row, text="Cores:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(20, 5))
+        self.cores_entry = tk.Entry(param_row, width=4, font=Theme.FONT,
+                                    bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.cores_entry.insert(0, "1")
+        self.cores_entry.pack(side=tk.LEFT)
+
+        tk.Label(param_row, text="Switch Cost:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(20, 5))
+        self.switch_entry = tk.Entry(param_row, width=4, font=Theme.FONT,
+                                     bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.switch_entry.insert(0, "0")
+        self.switch_entry.pack(side=tk.LEFT)
+        self.balancer_var = tk.StringVar(value="global")
+        for text, value in [("Global Queue", "global"), ("Per-core + Steal", "steal")]:
+            tk.Radiobutton(param_row, text=text, variable=self.balancer_var, value=value,
+                           font=Theme.FONT_SMALL, bg=Theme.BG_SECONDARY, fg=Theme.TEXT,
+                           selectcolor=Theme.BG_TERTIARY).pack(side=tk.LEFT, padx=(10, 0))
+
+        tk.Button(param_row, text="Run Simulation", font=Theme.FONT_BOLD,
                   bg=Theme.ACCENT, fg=Theme.BG_DARK, bd=0,
                   padx=20, pady=8, cursor='hand2',
                   command=self.run_simulation).pack(side=tk.RIGHT, padx=10)
@@ -193,6 +2198,7 @@ class CPUSchedulingGUI:
         self.gantt_canvas = tk.Canvas(main, height=100, bg=Theme.BG_DARK,
                                       highlightthickness=0)
         self.gantt_canvas.pack(fill=tk.X, pady=10)
+        self.gantt = GanttChart(self.gantt_canvas)
 
         results_frame = tk.Frame(main, bg=Theme.BG_SECONDARY, padx=15, pady=12)
         results_frame.pack(fill=tk.X)
@@ -201,10 +2207,79 @@ class CPUSchedulingGUI:
 
         self.results_body = tk.Frame(results_frame, bg=Theme.BG_DARK)
         self.results_body.pack(fill=tk.X)
-        self.avg_label = tk.Label(results_frame, text="", font=Theme.FONT,
+        self.results_table = VirtualTable(
+            self.results_body,
+            ["PID", "Arrival", "Burst", "Priority", "Completion", "Waiting", "Turnaround"],
+            lambda p: (p.pid, p.arrival, p.burst, p.priority, p.completion_time,
+                       p.waiting_time, p.turnaround_time))
+        self.avg_label = tk.Label(results_frame, text="", font=Theme.FONT, justify=tk.LEFT,
                                   bg=Theme.BG_SECONDARY, fg=Theme.SUCCESS)
         self.avg_label.pack(anchor='w', pady=8)
 
+        sweep_frame = tk.Frame(main, bg=Theme.BG_SECONDARY, padx=15, pady=12)
+        sweep_frame.pack(fill=tk.X, pady=(10, 0))
+        sweep_row = tk.Frame(sweep_frame, bg=Theme.BG_SECONDARY)
+        sweep_row.pack(fill=tk.X)
+        tk.Label(sweep_row, text="QUANTUM SWEEP (RR)", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(0, 15))
+        tk.Label(sweep_row, text="Quanta:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(0, 5))
+        self.sweep_entry = tk.Entry(sweep_row, width=10, font=Theme.FONT,
+                                    bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.sweep_entry.insert(0, "1-20")
+        self.sweep_entry.pack(side=tk.LEFT)
+        tk.Label(sweep_row, text="Workers:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(20, 5))
+        self.workers_entry = tk.Entry(sweep_row, width=4, font=Theme.FONT,
+                                      bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.workers_entry.insert(0, str(os.cpu_count() or 1))
+        self.workers_entry.pack(side=tk.LEFT)
+        tk.Button(sweep_row, text="Run Sweep", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.ACCENT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.run_sweep).pack(side=tk.LEFT, padx=10)
+        self.sweep_label = tk.Label(sweep_row, text="", font=Theme.FONT_SMALL,
+                                    bg=Theme.BG_SECONDARY, fg=Theme.SUCCESS)
+        self.sweep_label.pack(side=tk.LEFT, padx=10)
+        self.sweep_canvas = tk.Canvas(sweep_frame, height=120, bg=Theme.BG_DARK,
+                                      highlightthickness=0)
+        self.sweep_canvas.pack(fill=tk.X, pady=(8, 0))
+        self.sweep_canvas.bind('<Destroy>', lambda e: self.cancel_sweep())
+
+        study_row = tk.Frame(sweep_frame, bg=Theme.BG_SECONDARY)
+        study_row.pack(fill=tk.X, pady=(10, 0))
+        tk.Label(study_row, text="MONTE CARLO", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(0, 15))
+        self.study_entries = {}
+        for label, default, width in [("Workloads:", "1000", 8), ("Size:", "4-7", 6), ("Seed:", "0", 6)]:
+            tk.Label(study_row, text=label, font=Theme.FONT_SMALL,
+                     bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(0, 5))
+            entry = tk.Entry(study_row, width=width, font=Theme.FONT,
+                             bg=Theme.BG_INPUT, fg=Theme.TEXT)
+            entry.insert(0, default)
+            entry.pack(side=tk.LEFT, padx=(0, 15))
+            self.study_entries[label] = entry
+        self.burst_dist_var = tk.StringVar(value="uniform")
+        for text, value in [("Uniform", "uniform"), ("Exponential", "exponential")]:
+            tk.Radiobutton(study_row, text=text, variable=self.burst_dist_var, value=value,
+                           font=Theme.FONT_SMALL, bg=Theme.BG_SECONDARY, fg=Theme.TEXT,
+                           selectcolor=Theme.BG_TERTIARY).pack(side=tk.LEFT, padx=(0, 10))
+        tk.Button(study_row, text="Run Study", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.ACCENT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.run_study).pack(side=tk.LEFT, padx=10)
+        self.study_label = tk.Label(study_row, text="", font=Theme.FONT_SMALL,
+                                    bg=Theme.BG_SECONDARY, fg=Theme.SUCCESS)
+        self.study_label.pack(side=tk.LEFT, padx=10)
+        study_body = tk.Frame(sweep_frame, bg=Theme.BG_DARK)
+        study_body.pack(fill=tk.X, pady=(8, 0))
+        self.study_table = VirtualTable(
+            study_body,
+            ["Algorithm", "Mean WT", "P50 WT", "P95 WT", "P99 WT", "Mean TAT", "P95 TAT",
+             "P99 TAT", "Win Rate"],
+            lambda row: row, height=4, formats={8: lambda rate: f"{rate:.1%}"})
+        study_body.bind('<Destroy>', lambda e: self.cancel_study())
+
     def add_process(self):
         try:
             arrival = int(self.entries["Arrival Time:"].get())
@@ -212,8 +2287,7 @@ class CPUSchedulingGUI:
             priority = int(self.entries["Priority:"].get())
             if burst <= 0:
                 raise ValueError("Burst time must be positive")
-            p = Process(f"P{self.counter}", arrival, burst, priority)
-            self.processes.append(p)
+            self.processes.append(f"P{self.counter}", arrival, burst, priority)
             self.counter += 1
             self.update_process_list()
             for entry in self.entries.values():
@@ -229,124 +2303,395 @@ class CPUSchedulingGUI:
             arrival = random.randint(0, 10)
             burst = random.randint(2, 12)
             priority = random.randint(1, 5)
-            p = Process(f"P{i+1}", arrival, burst, priority)
-            self.processes.append(p)
+            self.processes.append(f"P{i+1}", arrival, burst, priority)
         self.counter = n + 1
         self.update_process_list()
 
     def clear_all(self):
-        self.processes = []
+        self.stream_events = None
+        self.incremental = None
+        self.cancel_sweep()
+        self.cancel_study()
+        self.processes = ProcessTable()
         self.counter = 1
         self.update_process_list()
-        self.gantt_canvas.delete("all")
-        for widget in self.results_body.winfo_children():
-            widget.destroy()
+        self.gantt.clear()
+        self.results_table.set_rows([])
         self.avg_label.config(text="")
 
     def update_process_list(self):
-        for widget in self.process_frame.winfo_children():
-            widget.destroy()
-        if not self.processes:
-            tk.Label(self.process_frame, text="No processes added yet",
-                     font=Theme.FONT_SMALL, bg=Theme.BG_DARK, fg=Theme.TEXT_DIM).pack()
-            return
-        for p in self.processes:
-            tk.Label(self.process_frame,
-                     text=f"{p.pid}  Arrival: {p.arrival}  Burst: {p.burst}  Priority: {p.priority}",
-                     font=Theme.FONT, bg=Theme.BG_DARK, fg=Theme.TEXT).pack(anchor='w')
+        self.process_table.set_rows(self.processes)
+
+    def read_cores(self, algo):
+        try:
+            cores = int(self.cores_entry.get())
+            if cores <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid core count (must be positive integer)")
+            return None
+        if cores > 1 and algo not in ("FCFS", "SJF", "Priority", "Round Robin"):
+            messagebox.showerror("Error", "Multi-core mode supports FCFS, SJF, Priority and Round Robin")
+            return None
+        return cores
+
+    def read_quantum(self):
+        try:
+            quantum = int(self.quantum_entry.get())
+            if quantum <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid quantum (must be positive integer)")
+            return None
+        return quantum
+
+    def read_switch_cost(self):
+        try:
+            cost = int(self.switch_entry.get())
+            if cost < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid switch cost (must be a non-negative integer)")
+            return None
+        return cost
+
+    def read_mlfq(self):
+        try:
+            quanta = [int(q) for q in self.levels_entry.get().split(",")]
+            boost = int(self.boost_entry.get())
+            if not quanta or min(quanta) <= 0 or boost < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid MLFQ settings (comma-separated positive quanta, boost >= 0)")
+            return None
+        return quanta, boost
 
     def run_simulation(self):
         if not self.processes:
             messagebox.showwarning("Warning", "Add at least one process first")
             return
 
+        self.stream_events = None
         algo = self.algo_var.get()
+        cores = self.read_cores(algo)
+        cost = self.read_switch_cost() if cores else None
+        if cost is None:
+            return
+
+        quantum = None
+        if algo in ("Round Robin", "CFS"):
+            quantum = self.read_quantum()
+            if quantum is None:
+                return
+
+        if cores == 1 and algo in IncrementalScheduler.KEYS:
+            processes, gantt = self.run_incremental(algo, cost)
+            self.draw_gantt([gantt])
+            self.display_results(processes, self.incremental.table, [gantt])
+            return
+
+        table = self.processes.copy()
+        if cores > 1:
+            processes, lanes = CPUScheduler.smp(table, algo, cores, quantum,
+                                                self.balancer_var.get(), cost)
+            self.draw_gantt(lanes)
+            self.display_results(processes, table, lanes)
+            return
+
         if algo == "Round Robin":
-            try:
-                quantum = int(self.quantum_entry.get())
-                if quantum <= 0:
-                    raise ValueError
-            except ValueError:
-                messagebox.showerror("Error", "Invalid quantum (must be positive integer)")
+            processes, gantt = CPUScheduler.round_robin(table, quantum, cost)
+        elif algo == "CFS":
+            processes, gantt = CPUScheduler.cfs(table, quantum, switch_cost=cost)
+        elif algo == "MLFQ":
+            params = self.read_mlfq()
+            if params is None:
                 return
-            processes, gantt = CPUScheduler.round_robin([Process(p.pid, p.arrival, p.burst, p.priority) for p in self.processes], quantum)
+            processes, gantt = CPUScheduler.mlfq(table, *params, switch_cost=cost)
+        elif algo == "SRTF":
+            processes, gantt = CPUScheduler.srtf(table, cost)
+        elif algo == "Priority (P)":
+            processes, gantt = CPUScheduler.preemptive_priority(table, cost)
         elif algo == "SJF":
-            processes, gantt = CPUScheduler.sjf([Process(p.pid, p.arrival, p.burst, p.priority) for p in self.processes])
+            processes, gantt = CPUScheduler.sjf(table, cost)
         elif algo == "Priority":
-            processes, gantt = CPUScheduler.priority([Process(p.pid, p.arrival, p.burst, p.priority) for p in self.processes])
+            processes, gantt = CPUScheduler.priority(table, cost)
         else:  # FCFS
-            processes, gantt = CPUScheduler.fcfs([Process(p.pid, p.arrival, p.burst, p.priority) for p in self.processes])
+            processes, gantt = CPUScheduler.fcfs(table, cost)
+
+        self.draw_gantt([gantt])
+        self.display_results(processes, table, [gantt])
 
-        self.draw_gantt(gantt)
-        self.display_results(processes)
+    def run_incremental(self, algo, switch_cost=0):
+        """Feed processes added since the last run to the checkpointed
+        scheduler, which only re-simulates from their earliest arrival"""
+        inc = self.incremental
+        if inc is None or inc.algo != algo or inc.switch_cost != switch_cost:
+            inc = self.incremental = IncrementalScheduler(algo, self.processes,
+                                                          switch_cost=switch_cost)
+        else:
+            for i in range(len(inc.table), len(self.processes)):
+                p = self.processes[i]
+                inc.add(p.pid, p.arrival, p.burst, p.priority)
+        return inc.run()
 
-    def draw_gantt(self, gantt):
-        self.gantt_canvas.delete("all")
-        if not gantt:
+    def stream_trace(self):
+        """Simulate a CSV/JSONL trace without loading it, a chunk of events per UI tick"""
+        algo = self.algo_var.get()
+        cores = self.read_cores(algo)
+        cost = self.read_switch_cost() if cores else None
+        if cost is None:
             return
+        if cores > 1:
+            messagebox.showerror("Error", "Trace streaming runs on a single core")
+            return
+        if algo in ("Round Robin", "CFS"):
+            quantum = self.read_quantum()
+            if quantum is None:
+                return
+        elif algo == "MLFQ":
+            params = self.read_mlfq()
+            if params is None:
+                return
 
-        canvas_width = self.gantt_canvas.winfo_width() - 40 or 900
-        total_time = gantt[-1][2]
-        scale = canvas_width / total_time if total_time > 0 else 1
-        x = 20
-        y = 30
-        height = 60
+        path = filedialog.askopenfilename(
+            title="Open process trace",
+            filetypes=[("Process traces", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if not path:
+            return
 
-        colors = ['#00d4aa', '#3fb950', '#d29922', '#f85149', '#a371f7', '#79c0ff']
+        arrivals = load_trace(path)
+        if algo == "Round Robin":
+            events = CPUScheduler.round_robin_stream(arrivals, quantum, cost)
+        elif algo == "CFS":
+            events = CPUScheduler.cfs_stream(arrivals, quantum, switch_cost=cost)
+        elif algo == "MLFQ":
+            events = CPUScheduler.mlfq_stream(arrivals, *params, switch_cost=cost)
+        else:
+            events = {
+                "SJF": CPUScheduler.sjf_stream,
+                "SRTF": CPUScheduler.srtf_stream,
+                "Priority": CPUScheduler.priority_stream,
+                "Priority (P)": CPUScheduler.preemptive_priority_stream,
+            }.get(algo, CPUScheduler.fcfs_stream)(arrivals, cost)
 
-        for pid, start, end in gantt:
-            width = (end - start) * scale
-            if pid == 'idle':
-                color = Theme.BG_TERTIARY
-                self.gantt_canvas.create_rectangle(x, y, x + width, y + height,
-                                                   fill=color, outline=Theme.BORDER)
-                self.gantt_canvas.create_text(x + width/2, y + height/2,
-                                              text="IDLE", font=Theme.FONT_SMALL, fill=Theme.TEXT_DIM)
+        self.gantt.clear()
+        self.results_table.set_rows([])
+        self.stream_events = events
+        self.stream_stats = RunningStats()
+        self.stream_gantt = []
+        self.parent.after(0, self.stream_step, events)
+
+    def stream_step(self, events):
+        if self.stream_events is not events:
+            return  # cancelled by Clear All or a new run
+        stats = self.stream_stats
+        gantt = self.stream_gantt
+        finished = True
+        try:
+            for kind, item in events:
+                stats.update(kind, item)
+                if kind == 'segment' and len(gantt) < self.STREAM_GANTT_LIMIT:
+                    gantt.append(item)
+                if kind == 'done' and stats.completed % self.STREAM_CHUNK == 0:
+                    finished = False
+                    break
+        except (OSError, ValueError) as e:
+            self.stream_events = None
+            messagebox.showerror("Trace Error", str(e))
+            return
+
+        text = (f"Processes: {stats.completed} | Avg Waiting Time: {stats.avg_waiting:.2f}"
+                f" | Avg Turnaround Time: {stats.avg_turnaround:.2f}")
+        if not finished:
+            self.avg_label.config(text="Streaming... " + text)
+            self.parent.after(1, self.stream_step, events)
+            return
+        self.stream_events = None
+        text += "\n" + self.overhead_text(stats) + "\n" + self.percentile_text(stats)
+        if len(gantt) >= self.STREAM_GANTT_LIMIT:
+            text += f" | Gantt shows the first {self.STREAM_GANTT_LIMIT} segments"
+        self.draw_gantt([gantt])
+        self.avg_label.config(text=text)
+
+    def read_sweep(self):
+        """Quanta as a range "1-20", a stepped range "5-100:5" or a list "2,4,8" """
+        try:
+            text = self.sweep_entry.get().replace(" ", "")
+            if "-" in text:
+                bounds, _, step = text.partition(":")
+                low, high = (int(v) for v in bounds.split("-"))
+                quanta = list(range(low, high + 1, int(step or 1)))
             else:
-                color = colors[hash(pid) % len(colors)]
-                self.gantt_canvas.create_rectangle(x, y, x + width, y + height,
-                                                   fill=color, outline=Theme.BORDER)
-                self.gantt_canvas.create_text(x + width/2, y + height/2,
-                                              text=pid, font=Theme.FONT_BOLD, fill=Theme.BG_DARK)
-
-            # Time labels
-            self.gantt_canvas.create_text(x, y + height + 10, text=str(start),
-                                          font=Theme.FONT_SMALL, fill=Theme.TEXT_DIM, anchor='n')
-            x += width
-
-        # Final time label
-        self.gantt_canvas.create_text(x, y + height + 10, text=str(total_time),
-                                      font=Theme.FONT_SMALL, fill=Theme.TEXT_DIM, anchor='n')
-
-    def display_results(self, processes):
-        for widget in self.results_body.winfo_children():
-            widget.destroy()
-
-        total_wt = 0
-        total_tat = 0
-        header = ["PID", "Arrival", "Burst", "Priority", "Completion", "Waiting", "Turnaround"]
-        header_frame = tk.Frame(self.results_body, bg=Theme.BG_TERTIARY)
-        header_frame.pack(fill=tk.X)
-        for h in header:
-            tk.Label(header_frame, text=h, font=Theme.FONT_BOLD,
-                     bg=Theme.BG_TERTIARY, fg=Theme.ACCENT, width=12).pack(side=tk.LEFT)
+                quanta = [int(q) for q in text.split(",")]
+            if not quanta or min(quanta) <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid sweep quanta (like 1-20, 5-100:5 or 2,4,8)")
+            return None
+        return quanta
 
-        for p in processes:
-            row = tk.Frame(self.results_body, bg=Theme.BG_DARK)
-            row.pack(fill=tk.X)
-            values = [p.pid, p.arrival, p.burst, p.priority, p.completion_time,
-                      p.waiting_time, p.turnaround_time]
-            for v in values:
-                tk.Label(row, text=str(v), font=Theme.FONT,
-                         bg=Theme.BG_DARK, fg=Theme.TEXT, width=12).pack(side=tk.LEFT)
+    def read_workers(self):
+        try:
+            workers = int(self.workers_entry.get())
+            if workers <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid worker count (must be positive integer)")
+            return None
+        return workers
 
-            total_wt += p.waiting_time
-            total_tat += p.turnaround_time
+    def run_sweep(self):
+        if not self.processes:
+            messagebox.showwarning("Warning", "Add at least one process first")
+            return
+        quanta = self.read_sweep()
+        workers = self.read_workers() if quanta else None
+        cost = self.read_switch_cost() if workers else None
+        if cost is None:
+            return
+        self.cancel_sweep()
+        self.sweep = QuantumSweep(self.processes, quanta, workers, cost)
+        self.sweep_results = []
+        self.draw_sweep()
+        self.parent.after(50, self.poll_sweep, self.sweep)
 
-        n = len(processes)
-        avg_wt = total_wt / n if n else 0
-        avg_tat = total_tat / n if n else 0
-        self.avg_label.config(text=f"Avg Waiting Time: {avg_wt:.2f} | Avg Turnaround Time: {avg_tat:.2f}")
+    def cancel_sweep(self):
+        if self.sweep is not None:
+            self.sweep.close()
+            self.sweep = None
+
+    def poll_sweep(self, sweep):
+        if self.sweep is not sweep:
+            return  # cancelled or replaced
+        try:
+            self.sweep_results.extend(sweep.poll())
+        except Exception as e:
+            self.cancel_sweep()
+            messagebox.showerror("Sweep Error", str(e))
+            return
+        self.draw_sweep()
+        if sweep.pending:
+            self.sweep_label.config(text=f"{len(self.sweep_results)}/{sweep.total} runs done")
+            self.parent.after(100, self.poll_sweep, sweep)
+            return
+        self.sweep = None
+        best = min(self.sweep_results, key=lambda r: (r[1], r[0]))
+        self.sweep_label.config(text=f"Best quantum for waiting time: {best[0]} ({best[1]:.2f})")
+
+    def read_study(self):
+        try:
+            workloads = int(self.study_entries["Workloads:"].get())
+            low, high = (int(v) for v in self.study_entries["Size:"].get().split("-"))
+            seed = int(self.study_entries["Seed:"].get())
+            if workloads <= 0 or not 0 < low <= high:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid study (workloads > 0, size like 4-7, integer seed)")
+            return None
+        return workloads, (low, high), seed
+
+    def run_study(self):
+        params = self.read_study()
+        quantum = self.read_quantum() if params else None
+        workers = self.read_workers() if quantum else None
+        cost = self.read_switch_cost() if workers else None
+        if cost is None:
+            return
+        workloads, sizes, seed = params
+        self.cancel_study()
+        self.study = MonteCarloStudy(workloads, seed, sizes, burst_dist=self.burst_dist_var.get(),
+                                     quantum=quantum, switch_cost=cost, workers=workers)
+        self.study_table.set_rows([])
+        self.parent.after(50, self.poll_study, self.study)
+
+    def cancel_study(self):
+        if self.study is not None:
+            self.study.close()
+            self.study = None
+
+    def poll_study(self, study):
+        if self.study is not study:
+            return  # cancelled or replaced
+        try:
+            study.poll()
+        except Exception as e:
+            self.cancel_study()
+            messagebox.showerror("Study Error", str(e))
+            return
+        if study.pending:
+            self.study_label.config(text=f"{study.done} workloads done")
+            self.parent.after(200, self.poll_study, study)
+            return
+        self.study = None
+        rows = []
+        for name, stats in study.summary().items():
+            wt, tat = stats["waiting"], stats["turnaround"]
+            rows.append((name, round(wt["mean"], 2), round(wt["p50"], 2), round(wt["p95"], 2),
+                         round(wt["p99"], 2), round(tat["mean"], 2), round(tat["p95"], 2),
+                         round(tat["p99"], 2), stats['win_rate']))
+        self.study_table.set_rows(rows)
+        self.study_label.config(text=f"{study.done} workloads | wins = lowest avg waiting time")
+
+    def draw_sweep(self):
+        """Avg waiting, avg turnaround and context switches against quantum,
+        each curve scaled to its own maximum"""
+        c = self.sweep_canvas
+        c.delete("all")
+        results = sorted(self.sweep_results)
+        width = max(c.winfo_width(), 300)
+        height = int(c['height'])
+        x0, x1, y0, y1 = 40, width - 20, 20, height - 20
+        series = [("Avg Waiting", 1, Theme.ACCENT), ("Avg Turnaround", 2, Theme.SUCCESS),
+                  ("Context Switches", 3, Theme.WARNING)]
+        x = x1
+        for name, _, color in reversed(series):
+            item = c.create_text(x, 8, text=name, fill=color, font=Theme.FONT_SMALL, anchor='e')
+            x = c.bbox(item)[0] - 15
+        if not results:
+            return
+        low, high = results[0][0], results[-1][0]
+        span = max(high - low, 1)
+        c.create_line(x0, y1, x1, y1, fill=Theme.BORDER)
+        c.create_text(x0, y1 + 10, text=f"q={low}", fill=Theme.TEXT_DIM, font=Theme.FONT_SMALL)
+        c.create_text(x1, y1 + 10, text=f"q={high}", fill=Theme.TEXT_DIM, font=Theme.FONT_SMALL)
+        for _, index, color in series:
+            peak = max(r[index] for r in results) or 1
+            points = []
+            for r in results:
+                points += [x0 + (r[0] - low) * (x1 - x0) / span,
+                           y1 - r[index] * (y1 - y0) / peak]
+            if len(points) > 2:
+                c.create_line(*points, fill=color, width=2)
+            else:
+                c.create_oval(points[0] - 2, points[1] - 2, points[0] + 2, points[1] + 2,
+                              fill=color, outline=color)
+
+    def draw_gantt(self, lanes):
+        """Draw one Gantt row per core; a single-core run passes one lane"""
+        self.gantt.set_lanes(lanes)
+
+    def display_results(self, processes, table, lanes):
+        self.results_table.set_rows(processes)
+
+        stats = RunningStats.for_lanes(lanes, table)
+        self.avg_label.config(text=f"Avg Waiting Time: {stats.avg_waiting:.2f}"
+                                   f" | Avg Turnaround Time: {stats.avg_turnaround:.2f}\n"
+                                   + self.overhead_text(stats, len(lanes)) + "\n"
+                                   + self.percentile_text(stats))
+
+    @staticmethod
+    def percentile_text(stats):
+        parts = []
+        for name, sketch in [("Waiting", stats.waiting_sketch), ("Turnaround", stats.turnaround_sketch),
+                             ("Response", stats.response_sketch)]:
+            parts.append(f"{name} p50/p90/p99/max: " + "/".join(f"{v:.0f}" for v in sketch.summary()))
+        return " | ".join(parts)
+
+    @staticmethod
+    def overhead_text(stats, cores=1):
+        utilization, throughput, overhead = stats.rates(cores)
+        return (f"Context Switches: {stats.switches} | CPU Utilization: {utilization:.1%}"
+                f" | Throughput: {throughput:.3f} jobs/unit | Switch Overhead: {overhead:.1%}")
 
 def open_cpu(parent_frame):
     CPUSchedulingGUI(parent_frame)
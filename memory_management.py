@@ -1,7 +1,15 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 from theme import Theme
 import random
+import bisect
+import time
+import os
+import threading
+from array import array
+from collections import deque
+from paging import (PageReplacement, StackDistance, AddressTranslator, address_trace,
+                    parse_references, load_references)
 
 class MemoryBlock:
     def __init__(self, size):
@@ -10,10 +18,177 @@ class MemoryBlock:
         self.process_id = None
         self.process_size = 0
 
+class BlockRow:
+    """View of one BlockTable row with the same attributes as MemoryBlock.
+
+    Writes go through the table so its counters stay current.
+    """
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def start(self):
+        return self.table.base[self.index]
+
+    @property
+    def size(self):
+        return self.table.size[self.index]
+
+    @size.setter
+    def size(self, value):
+        self.table.set_size(self.index, value)
+
+    @property
+    def is_allocated(self):
+        return bool(self.table.allocated[self.index])
+
+    @is_allocated.setter
+    def is_allocated(self, value):
+        self.table.set_allocated(self.index, value)
+
+    @property
+    def process_id(self):
+        return self.table.owner_name(self.table.owner[self.index])
+
+    @process_id.setter
+    def process_id(self, value):
+        self.table.owner[self.index] = self.table.owner_id(value)
+
+    @property
+    def process_size(self):
+        return self.table.used[self.index]
+
+    @process_size.setter
+    def process_size(self, value):
+        self.table.set_used(self.index, value)
+
+class BlockTable:
+    """Struct-of-arrays memory blocks: one array('q') column per field.
+
+    Costs 40 bytes per block instead of a MemoryBlock object; indexing
+    yields BlockRow views. Every write updates the total, held (sizes of
+    allocated blocks), requested (their process sizes) and allocated_blocks
+    counters, so memory stats are O(1). Owner "P7" is stored as 7, no owner
+    as -1 and any other name as a negative index into names.
+    """
+    COLUMNS = ('base', 'size', 'allocated', 'owner', 'used')
+
+    def __init__(self):
+        for name in self.COLUMNS:
+            setattr(self, name, array('q'))
+        self.names = []
+        self.name_ids = {}
+        self.end = 0
+        self.total = 0
+        self.held = 0
+        self.requested = 0
+        self.allocated_blocks = 0
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        table = cls()
+        for b in blocks:
+            table.append(b.size, b.process_id if b.is_allocated else None, b.process_size)
+        return table
+
+    def owner_id(self, process_id):
+        if process_id is None:
+            return -1
+        if isinstance(process_id, int):
+            return process_id
+        if process_id[:1] == "P" and process_id[1:].isdigit():
+            return int(process_id[1:])
+        if process_id not in self.name_ids:
+            self.name_ids[process_id] = -2 - len(self.names)
+            self.names.append(process_id)
+        return self.name_ids[process_id]
+
+    def owner_name(self, owner):
+        if owner >= 0:
+            return f"P{owner}"
+        return None if owner == -1 else self.names[-2 - owner]
+
+    def append(self, size, process_id=None, process_size=0, base=None):
+        """Add a block at base (default: right after the last one); returns its index"""
+        base = self.end if base is None else base
+        self.base.append(base)
+        self.size.append(size)
+        self.allocated.append(0)
+        self.owner.append(-1)
+        self.used.append(0)
+        self.end = max(self.end, base + size)
+        self.total += size
+        index = len(self.size) - 1
+        if process_id is not None:
+            self.allocate(index, process_id, process_size)
+        return index
+
+    def set_size(self, index, size):
+        self.total += size - self.size[index]
+        if self.allocated[index]:
+            self.held += size - self.size[index]
+        self.size[index] = size
+
+    def set_allocated(self, index, flag):
+        flag = 1 if flag else 0
+        if flag == self.allocated[index]:
+            return
+        sign = 1 if flag else -1
+        self.held += sign * self.size[index]
+        self.requested += sign * self.used[index]
+        self.allocated_blocks += sign
+        self.allocated[index] = flag
+
+    def set_used(self, index, process_size):
+        if self.allocated[index]:
+            self.requested += process_size - self.used[index]
+        self.used[index] = process_size
+
+    def allocate(self, index, process_id, process_size):
+        self.owner[index] = self.owner_id(process_id)
+        self.set_used(index, process_size)
+        self.set_allocated(index, True)
+
+    def release(self, index):
+        self.set_allocated(index, False)
+        self.owner[index] = -1
+        self.used[index] = 0
+
+    def fits(self, process_size):
+        """(index, size) of each free block of at least process_size, in order"""
+        for i, (size, flag) in enumerate(zip(self.size, self.allocated)):
+            if not flag and size >= process_size:
+                yield i, size
+
+    def internal_fragmentation(self):
+        return self.held - self.requested
+
+    def __len__(self):
+        return len(self.size)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.size)
+        if not 0 <= index < len(self.size):
+            raise IndexError("block index out of range")
+        return BlockRow(self, index)
+
+    def __iter__(self):
+        for i in range(len(self.size)):
+            yield BlockRow(self, i)
+
 class MemoryAllocator:
     @staticmethod
     def first_fit(blocks, process_size, process_id):
         """Allocate to FIRST block that fits"""
+        if isinstance(blocks, BlockTable):
+            for i, _ in blocks.fits(process_size):
+                blocks.allocate(i, process_id, process_size)
+                return True, blocks[i]
+            return False, None
         for block in blocks:
             if not block.is_allocated and block.size >= process_size:
                 block.is_allocated = True
@@ -25,6 +200,12 @@ class MemoryAllocator:
     @staticmethod
     def best_fit(blocks, process_size, process_id):
         """Allocate to SMALLEST block that fits"""
+        if isinstance(blocks, BlockTable):
+            best = min(blocks.fits(process_size), key=lambda fit: fit[1], default=None)
+            if best is None:
+                return False, None
+            blocks.allocate(best[0], process_id, process_size)
+            return True, blocks[best[0]]
         best = None
         for block in blocks:
             if not block.is_allocated and block.size >= process_size:
@@ -40,6 +221,12 @@ class MemoryAllocator:
     @staticmethod
     def worst_fit(blocks, process_size, process_id):
         """Allocate to LARGEST block that fits"""
+        if isinstance(blocks, BlockTable):
+            worst = max(blocks.fits(process_size), key=lambda fit: fit[1], default=None)
+            if worst is None:
+                return False, None
+            blocks.allocate(worst[0], process_id, process_size)
+            return True, blocks[worst[0]]
         worst = None
         for block in blocks:
             if not block.is_allocated and block.size >= process_size:
@@ -52,12 +239,820 @@ class MemoryAllocator:
             return True, worst
         return False, None
 
+class SizeIndex:
+    """Sorted (size, position) pairs kept in short sorted sublists.
+
+    bisect over the sublist maxima and then inside one sublist finds a pair
+    in O(log n); an insert or removal only shifts one sublist of at most
+    2 * LOAD entries, where one flat sorted list would move megabytes.
+    """
+    LOAD = 512
+
+    def __init__(self, pairs=()):
+        pairs = sorted(pairs)
+        self.lists = [pairs[i:i + self.LOAD] for i in range(0, len(pairs), self.LOAD)]
+        self.maxes = [sub[-1] for sub in self.lists]
+        self.count = len(pairs)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, pair):
+        self.count += 1
+        if not self.lists:
+            self.lists.append([pair])
+            self.maxes.append(pair)
+            return
+        i = min(bisect.bisect_left(self.maxes, pair), len(self.lists) - 1)
+        sub = self.lists[i]
+        bisect.insort(sub, pair)
+        self.maxes[i] = sub[-1]
+        if len(sub) > 2 * self.LOAD:
+            self.lists[i:i + 1] = [sub[:self.LOAD], sub[self.LOAD:]]
+            self.maxes[i:i + 1] = [sub[self.LOAD - 1], sub[-1]]
+
+    def remove(self, pair):
+        i = bisect.bisect_left(self.maxes, pair)
+        sub = self.lists[i]
+        del sub[bisect.bisect_left(sub, pair)]
+        self.count -= 1
+        if sub:
+            self.maxes[i] = sub[-1]
+        else:
+            del self.lists[i]
+            del self.maxes[i]
+
+    def ceiling(self, pair):
+        """Smallest pair >= pair, or None"""
+        i = bisect.bisect_left(self.maxes, pair)
+        if i == len(self.maxes):
+            return None
+        sub = self.lists[i]
+        return sub[bisect.bisect_left(sub, pair)]
+
+    def last(self):
+        return self.maxes[-1] if self.maxes else None
+
+class AddressIndex(SizeIndex):
+    """SizeIndex of (start, size) pairs with a max segment tree over its sublists.
+
+    Leaf i of the tree holds the largest size in sublist i, so the lowest
+    addressed pair of at least some size is found by descending to the
+    leftmost sublist that has one (O(log n)) and scanning only that sublist.
+    """
+    LOAD = 128
+
+    def __init__(self, pairs=()):
+        super().__init__(pairs)
+        self.rebuild([max(p[1] for p in sub) for sub in self.lists])
+
+    def rebuild(self, biggest):
+        """Build the tree from each sublist's largest size; leaf i is tree[capacity + i]"""
+        self.capacity = 1 << max(0, len(biggest) - 1).bit_length()
+        tree = array('q', bytes(8 * self.capacity)) + array('q', biggest)
+        tree.extend(array('q', bytes(8 * (self.capacity - len(biggest)))))
+        level = self.capacity // 2
+        while level:
+            tree[level:2 * level] = array('q', map(max, tree[2 * level:4 * level:2],
+                                                   tree[2 * level + 1:4 * level:2]))
+            level //= 2
+        self.tree = tree
+
+    def leaves(self, count):
+        return list(self.tree[self.capacity:self.capacity + count])
+
+    def set_biggest(self, i, size):
+        node = self.capacity + i
+        self.tree[node] = size
+        node //= 2
+        while node:
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+    def add(self, pair):
+        count = len(self.lists)
+        super().add(pair)
+        i = bisect.bisect_left(self.maxes, pair)
+        if len(self.lists) == count:
+            if pair[1] > self.tree[self.capacity + i]:
+                self.set_biggest(i, pair[1])
+            return
+        # a new sublist was created or split off around i
+        biggest = self.leaves(count)
+        biggest.insert(i, 0)
+        for j in range(max(0, i - 1), min(i + 2, len(self.lists))):
+            biggest[j] = max(p[1] for p in self.lists[j])
+        self.rebuild(biggest)
+
+    def remove(self, pair):
+        i = bisect.bisect_left(self.maxes, pair)
+        count = len(self.lists)
+        super().remove(pair)
+        if len(self.lists) != count:
+            biggest = self.leaves(count)
+            del biggest[i]
+            self.rebuild(biggest)
+        elif self.tree[self.capacity + i] == pair[1]:
+            self.set_biggest(i, max(p[1] for p in self.lists[i]))
+
+    def first(self, size):
+        """Lowest (start, size) pair whose size is at least size, or None"""
+        if not self.lists or self.tree[1] < size:
+            return None
+        node = 1
+        while node < self.capacity:
+            node = 2 * node if self.tree[2 * node] >= size else 2 * node + 1
+        for pair in self.lists[node - self.capacity]:
+            if pair[1] >= size:
+                return pair
+
+class PackedSizeIndex(SizeIndex):
+    """SizeIndex that packs each (a, b) pair into one int, a << 32 | b.
+
+    The sublists are array('q') columns, so an entry costs 8 bytes instead
+    of a tuple. A pair only fits with a < 2**31 and b < 2**32; pack raises
+    ValueError for anything larger, before the index is touched.
+    """
+    MASK = (1 << 32) - 1
+
+    def __init__(self, pairs=()):
+        super().__init__(map(self.pack, pairs))
+        self.lists = [array('q', sub) for sub in self.lists]
+
+    @staticmethod
+    def pack(pair):
+        a, b = pair
+        if not (0 <= a < 1 << 31 and 0 <= b < 1 << 32):
+            raise ValueError(f"{pair} does not fit in a packed 64-bit key")
+        return a << 32 | b
+
+    def add(self, pair):
+        key = self.pack(pair)
+        if not self.lists:
+            # open the first sublist as an array; SizeIndex.add would make a list
+            self.lists.append(array('q'))
+            self.maxes.append(key)
+        super().add(key)
+
+    def remove(self, pair):
+        super().remove(pair[0] << 32 | pair[1])
+
+    def ceiling(self, pair):
+        """Smallest pair >= pair, or None"""
+        key = super().ceiling(pair[0] << 32 | pair[1])
+        return None if key is None else (key >> 32, key & self.MASK)
+
+    def last(self):
+        return (self.maxes[-1] >> 32, self.maxes[-1] & self.MASK) if self.maxes else None
+
+class IndexedAllocator:
+    """First, best and worst fit over a BlockTable in O(log n) per request.
+
+    Blocks given as MemoryBlocks are copied into a table. Free blocks are
+    kept in a SizeIndex of (size, index) pairs (best and worst fit), packed
+    into 8-byte keys unless a block is too big to pack, and in a segment
+    tree over block indices holding the largest free size of each subtree
+    (first fit). Each fit picks exactly the block the MemoryAllocator scans
+    would: ties go to the lowest index.
+    """
+    def __init__(self, blocks=()):
+        self.blocks = blocks if isinstance(blocks, BlockTable) else BlockTable.from_blocks(blocks)
+        table = self.blocks
+        free = array('q', (0 if flag else size for size, flag in zip(table.size, table.allocated)))
+        try:
+            self.free_sizes = PackedSizeIndex(self.free_pairs())
+        except ValueError:
+            self.free_sizes = SizeIndex(self.free_pairs())
+        self.owners = {table.owner_name(owner): i
+                       for i, (owner, flag) in enumerate(zip(table.owner, table.allocated)) if flag}
+        self.capacity = 1 << max(0, len(free) - 1).bit_length()
+        # tree[1] is the root and leaf i sits at tree[capacity + i]
+        self.tree = array('q', bytes(8 * self.capacity)) + free
+        self.tree.extend(array('q', bytes(8 * (self.capacity - len(free)))))
+        for node in range(self.capacity - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def add_block(self, block):
+        index = self.blocks.append(block.size, block.process_id if block.is_allocated else None,
+                                   block.process_size)
+        if index == self.capacity:
+            self.capacity *= 2
+            leaves = array('q', bytes(8 * self.capacity))
+            leaves[:index] = self.tree[index:2 * index]
+            self.tree = array('q', bytes(8 * self.capacity)) + leaves
+            for node in range(self.capacity - 1, 0, -1):
+                self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+        if block.is_allocated:
+            self.owners[block.process_id] = index
+        else:
+            try:
+                self.free_sizes.add((block.size, index))
+            except ValueError:
+                # too big to pack: fall back to (size, index) tuples
+                self.free_sizes = SizeIndex(self.free_pairs())
+            self.set_free(index, block.size)
+        return self.blocks[index]
+
+    def free_pairs(self):
+        table = self.blocks
+        return ((size, i) for i, (size, flag) in enumerate(zip(table.size, table.allocated))
+                if size and not flag)
+
+    def set_free(self, index, size):
+        node = self.capacity + index
+        self.tree[node] = size
+        node //= 2
+        while node:
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+    def take(self, index, process_size, process_id):
+        self.free_sizes.remove((self.blocks.size[index], index))
+        self.set_free(index, 0)
+        self.blocks.allocate(index, process_id, process_size)
+        self.owners[process_id] = index
+        return True, self.blocks[index]
+
+    def free(self, process_id):
+        """Release the block held by process_id; returns it, or None"""
+        index = self.owners.pop(process_id, None)
+        if index is None:
+            return None
+        self.blocks.release(index)
+        size = self.blocks.size[index]
+        self.free_sizes.add((size, index))
+        self.set_free(index, size)
+        return self.blocks[index]
+
+    def largest_hole(self):
+        return self.tree[1]
+
+    def usage(self):
+        """(total, held, requested, holes) in O(1) from the table's counters"""
+        table = self.blocks
+        return table.total, table.held, table.requested, len(table) - table.allocated_blocks
+
+    def first_fit(self, process_size, process_id):
+        """Allocate to FIRST block that fits"""
+        if self.tree[1] < process_size:
+            return False, None
+        node = 1
+        while node < self.capacity:
+            node = 2 * node if self.tree[2 * node] >= process_size else 2 * node + 1
+        return self.take(node - self.capacity, process_size, process_id)
+
+    def best_fit(self, process_size, process_id):
+        """Allocate to SMALLEST block that fits"""
+        pair = self.free_sizes.ceiling((process_size, 0))
+        if pair is None:
+            return False, None
+        return self.take(pair[1], process_size, process_id)
+
+    def worst_fit(self, process_size, process_id):
+        """Allocate to LARGEST block that fits"""
+        largest = self.free_sizes.last()
+        if largest is None or largest[0] < process_size:
+            return False, None
+        return self.take(self.free_sizes.ceiling((largest[0], 0))[1], process_size, process_id)
+
+class Partition:
+    """A hole or an allocated piece of one region under variable partitioning"""
+    __slots__ = ('start', 'size', 'region', 'process_id', 'prev', 'next')
+
+    def __init__(self, start, size, region, process_id=None):
+        self.start = start
+        self.size = size
+        self.region = region
+        self.process_id = process_id
+        self.prev = None
+        self.next = None
+
+    @property
+    def is_allocated(self):
+        return self.process_id is not None
+
+    @property
+    def process_size(self):
+        return self.size if self.process_id is not None else 0
+
+class DynamicPartitioner:
+    """Variable partitioning: holes are split on allocation and coalesced on free.
+
+    Every added block becomes a region laid out after the previous one.
+    Partitions form one address-ordered doubly linked list, so freeing
+    merges with the neighbours in O(1); holes never merge across regions.
+    Holes are indexed by (size, start) for best and worst fit and by
+    (start, size) for first fit.
+    """
+    def __init__(self, blocks=()):
+        self.head = None
+        self.tail = None
+        self.end = 0
+        self.regions = 0
+        self.owners = {}
+        self.by_size = SizeIndex()
+        self.by_address = AddressIndex()
+        self.holes = {}                 # start -> free Partition
+        self.free_total = 0
+        for block in blocks:
+            self.add_block(block)
+
+    @property
+    def blocks(self):
+        """Partitions in address order, as a BlockTable snapshot"""
+        table = BlockTable()
+        node = self.head
+        while node:
+            table.append(node.size, node.process_id, node.size, node.start)
+            node = node.next
+        return table
+
+    def add_block(self, block):
+        """Append block.size units of free memory as a new region"""
+        node = Partition(self.end, block.size, self.regions)
+        self.regions += 1
+        self.end += block.size
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self.add_hole(node)
+        return node
+
+    def add_hole(self, node):
+        self.by_size.add((node.size, node.start))
+        self.by_address.add((node.start, node.size))
+        self.holes[node.start] = node
+        self.free_total += node.size
+
+    def drop_hole(self, node):
+        self.by_size.remove((node.size, node.start))
+        self.by_address.remove((node.start, node.size))
+        del self.holes[node.start]
+        self.free_total -= node.size
+
+    def unlink(self, node):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+    def take(self, start, process_size, process_id):
+        """Carve process_size off the front of the hole at start"""
+        hole = self.holes[start]
+        self.drop_hole(hole)
+        if hole.size == process_size:
+            hole.process_id = process_id
+            node = hole
+        else:
+            node = Partition(start, process_size, hole.region, process_id)
+            node.prev = hole.prev
+            node.next = hole
+            if hole.prev:
+                hole.prev.next = node
+            else:
+                self.head = node
+            hole.prev = node
+            hole.start += process_size
+            hole.size -= process_size
+            self.add_hole(hole)
+        self.owners[process_id] = node
+        return True, node
+
+    def free(self, process_id):
+        """Release the partition held by process_id and coalesce; returns the hole, or None"""
+        node = self.owners.pop(process_id, None)
+        if node is None:
+            return None
+        node.process_id = None
+        prev, nxt = node.prev, node.next
+        if prev and not prev.is_allocated and prev.region == node.region:
+            self.drop_hole(prev)
+            prev.size += node.size
+            self.unlink(node)
+            node = prev
+        if nxt and not nxt.is_allocated and nxt.region == node.region:
+            self.drop_hole(nxt)
+            node.size += nxt.size
+            self.unlink(nxt)
+        self.add_hole(node)
+        return node
+
+    def first_fit(self, process_size, process_id):
+        """Allocate from the lowest-addressed hole that fits"""
+        pair = self.by_address.first(process_size)
+        if pair is None:
+            return False, None
+        return self.take(pair[0], process_size, process_id)
+
+    def best_fit(self, process_size, process_id):
+        """Allocate from the SMALLEST hole that fits"""
+        pair = self.by_size.ceiling((process_size, 0))
+        if pair is None:
+            return False, None
+        return self.take(pair[1], process_size, process_id)
+
+    def worst_fit(self, process_size, process_id):
+        """Allocate from the LARGEST hole"""
+        largest = self.by_size.last()
+        if largest is None or largest[0] < process_size:
+            return False, None
+        return self.take(self.by_size.ceiling((largest[0], 0))[1], process_size, process_id)
+
+    def largest_hole(self):
+        largest = self.by_size.last()
+        return largest[0] if largest else 0
+
+    def usage(self):
+        """(total, held, requested, holes); a partition is exactly its process's size"""
+        held = self.end - self.free_total
+        return self.end, held, held, len(self.holes)
+
+    def external_fragmentation(self):
+        """Share of free memory outside the largest hole"""
+        if not self.free_total:
+            return 0.0
+        return 1 - self.largest_hole() / self.free_total
+
+    def replay(self, trace, fit="first_fit"):
+        """Run a churn trace with one fit; returns failed allocations"""
+        return replay_trace(trace, getattr(self, fit), self.free)
+
+class BuddyAllocator:
+    """Binary buddy system over an arena of unit << max_order.
+
+    free_lists[k] holds the addresses of free blocks of unit << k; the
+    buddy of the order-k block at addr is addr ^ (1 << k) (addresses are
+    in units), so allocation splits and freeing merges in O(max_order).
+    """
+    def __init__(self, max_order, unit=1):
+        self.max_order = max_order
+        self.unit = unit
+        self.free_lists = [set() for _ in range(max_order + 1)]
+        self.free_lists[max_order].add(0)
+        self.allocated = {}             # addr -> (order, process_id, process_size)
+        self.owners = {}
+        self.free_total = unit << max_order
+        self.free_blocks = 1
+        self.internal = 0               # block bytes handed out but not requested
+
+    def order_for(self, process_size):
+        units = -(-process_size // self.unit)
+        return max(0, (units - 1).bit_length())
+
+    def allocate(self, process_size, process_id):
+        """Allocate the smallest power-of-two block that fits; returns (success, addr)"""
+        order = self.order_for(process_size)
+        k = order
+        while k <= self.max_order and not self.free_lists[k]:
+            k += 1
+        if k > self.max_order:
+            return False, None
+        addr = self.free_lists[k].pop()
+        self.free_blocks += k - order - 1
+        while k > order:
+            k -= 1
+            self.free_lists[k].add(addr + (1 << k))
+        self.allocated[addr] = (order, process_id, process_size)
+        self.owners[process_id] = addr
+        self.free_total -= self.unit << order
+        self.internal += (self.unit << order) - process_size
+        return True, addr
+
+    def free(self, process_id):
+        """Release the block held by process_id and merge buddies; returns its address, or None"""
+        addr = self.owners.pop(process_id, None)
+        if addr is None:
+            return None
+        order, _, process_size = self.allocated.pop(addr)
+        self.free_total += self.unit << order
+        self.internal -= (self.unit << order) - process_size
+        while order < self.max_order:
+            buddy = addr ^ (1 << order)
+            if buddy not in self.free_lists[order]:
+                break
+            self.free_lists[order].remove(buddy)
+            self.free_blocks -= 1
+            addr &= ~(1 << order)
+            order += 1
+        self.free_lists[order].add(addr)
+        self.free_blocks += 1
+        return addr
+
+    def grow(self, max_order):
+        """Double the arena up to unit << max_order; live blocks keep their addresses.
+
+        The old arena becomes the left half of the new root and its buddy
+        on the right is a new free block (or the halves merge if both are free).
+        """
+        while self.max_order < max_order:
+            order = self.max_order
+            self.free_lists.append(set())
+            self.max_order += 1
+            self.free_total += self.unit << order
+            if 0 in self.free_lists[order]:
+                self.free_lists[order].remove(0)
+                self.free_lists[order + 1].add(0)
+            else:
+                self.free_lists[order].add(1 << order)
+                self.free_blocks += 1
+
+    def largest_hole(self):
+        for k in range(self.max_order, -1, -1):
+            if self.free_lists[k]:
+                return self.unit << k
+        return 0
+
+    def external_fragmentation(self):
+        """Share of free memory outside the largest free block"""
+        if not self.free_total:
+            return 0.0
+        return 1 - self.largest_hole() / self.free_total
+
+    def internal_fragmentation(self):
+        """Share of allocated memory that was not requested"""
+        used = (self.unit << self.max_order) - self.free_total
+        return self.internal / used if used else 0.0
+
+    def usage(self):
+        """(total, held, requested, holes) from the free and internal counters"""
+        total = self.unit << self.max_order
+        held = total - self.free_total
+        return total, held, held - self.internal, self.free_blocks
+
+    def nodes(self):
+        """(addr, order, state) of the split tree in address order; state is
+        'split', 'free' or the owning process id"""
+        stack = [(0, self.max_order)]
+        while stack:
+            addr, order = stack.pop()
+            if addr in self.free_lists[order]:
+                yield addr, order, 'free'
+            elif addr in self.allocated and self.allocated[addr][0] == order:
+                yield addr, order, self.allocated[addr][1]
+            else:
+                yield addr, order, 'split'
+                half = 1 << (order - 1)
+                stack.append((addr + half, order - 1))
+                stack.append((addr, order - 1))
+
+    @property
+    def blocks(self):
+        """Leaf blocks of the split tree in address order, as a BlockTable snapshot"""
+        table = BlockTable()
+        for addr, order, state in self.nodes():
+            if state == 'free':
+                table.append(self.unit << order, base=addr * self.unit)
+            elif state != 'split':
+                table.append(self.unit << order, state, self.allocated[addr][2], addr * self.unit)
+        return table
+
+    def replay(self, trace):
+        """Run a churn trace; returns failed allocations"""
+        return replay_trace(trace, self.allocate, self.free)
+
+class Slab:
+    """One slab_size page of a cache cut into equal objects"""
+    __slots__ = ('start', 'free', 'used', 'pos')
+
+    def __init__(self, start, count):
+        self.start = start
+        self.free = list(range(count - 1, -1, -1))  # stack of free slot indices
+        self.used = 0
+        self.pos = 0                    # index in the cache list holding the slab
+
+class SlabCache:
+    """Objects of one size class, with their slabs on full, partial and empty lists"""
+    def __init__(self, object_size, slab_size):
+        self.object_size = object_size
+        self.per_slab = slab_size // object_size
+        self.full = []
+        self.partial = []
+        self.empty = []
+
+    def list_for(self, used):
+        if used == 0:
+            return self.empty
+        return self.full if used == self.per_slab else self.partial
+
+    def move(self, slab, source, target):
+        """Swap-remove slab from source and append it to target in O(1)"""
+        last = source.pop()
+        if last is not slab:
+            source[slab.pos] = last
+            last.pos = slab.pos
+        slab.pos = len(target)
+        target.append(slab)
+
+    def adopt(self, slab):
+        slab.pos = len(self.empty)
+        self.empty.append(slab)
+
+    def take(self, slab):
+        source = self.list_for(slab.used)
+        slot = slab.free.pop()
+        slab.used += 1
+        target = self.list_for(slab.used)
+        if target is not source:
+            self.move(slab, source, target)
+        return slot
+
+    def give(self, slab, slot):
+        source = self.list_for(slab.used)
+        slab.free.append(slot)
+        slab.used -= 1
+        target = self.list_for(slab.used)
+        if target is not source:
+            self.move(slab, source, target)
+
+class SlabAllocator:
+    """Object caches carving slab_size pages out of the memory blocks.
+
+    Requests are rounded up to a multiple of align and served by the cache
+    of that size: from a partial slab, else an empty one, else a fresh page
+    (reclaiming another cache's empty slab when the blocks run out). A slab
+    hands out slots from its free-index stack, so alloc and free are O(1).
+    """
+    def __init__(self, blocks=(), slab_size=64, align=8):
+        self.slab_size = slab_size
+        self.align = align
+        self.pages = deque()            # free page addresses, lowest popped first
+        self.end = 0
+        self.total_pages = 0
+        self.caches = {}
+        self.owners = {}                # pid -> (cache, slab, slot, process_size)
+        self.requested = 0
+        self.object_bytes = 0           # size-class bytes of live objects
+        self.busy_slabs = 0             # slabs holding at least one object
+        self.requests = 0
+        self.hits = 0                   # served from slabs the cache already had
+        for block in blocks:
+            self.add_block(block)
+
+    def add_block(self, block):
+        """Carve whole pages out of block; the tail is left unused"""
+        count = block.size // self.slab_size
+        # below the older pages, which have lower addresses and go out first
+        self.pages.extendleft(range(self.end, self.end + count * self.slab_size, self.slab_size))
+        self.total_pages += count
+        self.end += block.size
+        return block
+
+    def grow(self):
+        if self.pages:
+            return self.pages.pop()
+        for cache in self.caches.values():
+            if cache.empty:
+                return cache.empty.pop().start
+        return None
+
+    def allocate(self, process_size, process_id):
+        """Allocate one object from the cache of its size class; returns (success, addr)"""
+        self.requests += 1
+        size = -(-process_size // self.align) * self.align
+        if size > self.slab_size:
+            return False, None
+        cache = self.caches.get(size)
+        if cache is None:
+            cache = self.caches[size] = SlabCache(size, self.slab_size)
+        if cache.partial:
+            slab = cache.partial[-1]
+            self.hits += 1
+        elif cache.empty:
+            slab = cache.empty[-1]
+            self.hits += 1
+        else:
+            start = self.grow()
+            if start is None:
+                return False, None
+            slab = Slab(start, cache.per_slab)
+            cache.adopt(slab)
+        if not slab.used:
+            self.busy_slabs += 1
+        slot = cache.take(slab)
+        self.owners[process_id] = (cache, slab, slot, process_size)
+        self.requested += process_size
+        self.object_bytes += size
+        return True, slab.start + slot * size
+
+    def free(self, process_id):
+        """Return process_id's object to its slab; returns its address, or None"""
+        entry = self.owners.pop(process_id, None)
+        if entry is None:
+            return None
+        cache, slab, slot, process_size = entry
+        cache.give(slab, slot)
+        if not slab.used:
+            self.busy_slabs -= 1
+        self.requested -= process_size
+        self.object_bytes -= cache.object_size
+        return slab.start + slot * cache.object_size
+
+    def cache_hit_rate(self):
+        return self.hits / self.requests if self.requests else 0.0
+
+    def overhead(self):
+        """Share of the pages held by caches that no live object requested"""
+        held = (self.total_pages - len(self.pages)) * self.slab_size
+        return 1 - self.requested / held if held else 0.0
+
+    @property
+    def blocks(self):
+        """Slabs and free pages in address order, as a BlockTable snapshot"""
+        rows = [(start, None, 0) for start in self.pages]
+        for cache in self.caches.values():
+            for slab in cache.full + cache.partial + cache.empty:
+                if slab.used:
+                    rows.append((slab.start, f"{cache.object_size}x{slab.used}",
+                                 slab.used * cache.object_size))
+                else:
+                    rows.append((slab.start, None, 0))
+        table = BlockTable()
+        for start, owner, used in sorted(rows, key=lambda row: row[0]):
+            table.append(self.slab_size, owner, used, start)
+        return table
+
+    def largest_hole(self):
+        return self.slab_size if self.pages or any(c.empty for c in self.caches.values()) else 0
+
+    def usage(self):
+        """(total, held, requested, holes) counted in whole pages, like blocks"""
+        return (self.total_pages * self.slab_size, self.busy_slabs * self.slab_size,
+                self.object_bytes, self.total_pages - self.busy_slabs)
+
+    def replay(self, trace):
+        """Run a churn trace; returns failed allocations"""
+        return replay_trace(trace, self.allocate, self.free)
+
+def replay_trace(trace, allocate, free):
+    """Run ('alloc', pid, size) / ('free', pid) operations; returns failed allocations"""
+    failed = 0
+    for op in trace:
+        if op[0] == 'alloc':
+            if not allocate(op[2], op[1])[0]:
+                failed += 1
+        else:
+            free(op[1])
+    return failed
+
+def churn_trace(ops, seed=0, sizes=(1, 256), live=64, classes=None):
+    """Seeded alloc/free stream keeping about `live` processes resident;
+    sizes are drawn from classes when given, else uniformly from sizes"""
+    rnd = random.Random(seed)
+    resident = []
+    for i in range(ops):
+        if resident and (len(resident) >= 2 * live or rnd.random() < len(resident) / (2 * live)):
+            j = rnd.randrange(len(resident))
+            resident[j], resident[-1] = resident[-1], resident[j]
+            yield ('free', resident.pop())
+        else:
+            pid = f"P{i}"
+            resident.append(pid)
+            yield ('alloc', pid, rnd.choice(classes) if classes else rnd.randint(*sizes))
+
+def compare_on_trace(sizes, trace, slab_size=64, align=8):
+    """Replay one trace on a slab allocator and on first/best/worst fit over the
+    same blocks; returns (name, hit rate, overhead, seconds) rows, where the hit
+    rate is the share of allocations served"""
+    trace = list(trace)
+    requests = sum(1 for op in trace if op[0] == 'alloc')
+    rows = []
+    slab = SlabAllocator([MemoryBlock(size) for size in sizes], slab_size, align)
+    start = time.perf_counter()
+    failed = slab.replay(trace)
+    rows.append(("Slab", 1 - failed / requests if requests else 0.0, slab.overhead(),
+                 time.perf_counter() - start))
+    for name, fit in (("First Fit", "first_fit"), ("Best Fit", "best_fit"), ("Worst Fit", "worst_fit")):
+        allocator = IndexedAllocator([MemoryBlock(size) for size in sizes])
+        start = time.perf_counter()
+        failed = replay_trace(trace, getattr(allocator, fit), allocator.free)
+        seconds = time.perf_counter() - start
+        held, used = allocator.blocks.held, allocator.blocks.requested
+        rows.append((name, 1 - failed / requests if requests else 0.0,
+                     1 - used / held if held else 0.0, seconds))
+    return rows
+
 class MemoryManagementGUI:
     def __init__(self, parent):
         self.parent = parent
-        self.blocks = []
+        self.sizes = []
+        self.allocator = IndexedAllocator()
         self.process_counter = 1
+        self.reference_file = None
+        self.reference_text = None
+        self.address_file = None
+        self.paging = None
         self.setup_ui()
+
+    @property
+    def blocks(self):
+        return self.allocator.blocks
         
     def setup_ui(self):
         main = tk.Frame(self.parent, bg=Theme.BG_DARK)
@@ -98,6 +1093,15 @@ class MemoryManagementGUI:
                   bg=Theme.BG_TERTIARY, fg=Theme.ERROR, bd=0,
                   padx=12, pady=5, cursor='hand2',
                   command=self.clear_all).pack(side=tk.LEFT, padx=5)
+
+        tk.Label(row1, text="Partitioning:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(20, 5))
+        self.mode_var = tk.StringVar(value="Fixed")
+        for mode in ["Fixed", "Variable", "Buddy", "Slab"]:
+            tk.Radiobutton(row1, text=mode, variable=self.mode_var, value=mode,
+                           font=Theme.FONT_SMALL, bg=Theme.BG_SECONDARY, fg=Theme.TEXT,
+                           selectcolor=Theme.BG_TERTIARY,
+                           command=self.reset_allocator).pack(side=tk.LEFT, padx=5)
         
         # Memory blocks display
         self.blocks_frame = tk.Frame(main, bg=Theme.BG_DARK)
@@ -134,6 +1138,102 @@ class MemoryManagementGUI:
                   bg=Theme.ACCENT, fg=Theme.BG_DARK, bd=0,
                   padx=20, pady=6, cursor='hand2',
                   command=self.allocate_process).pack(side=tk.RIGHT)
+
+        row3 = tk.Frame(alloc_frame, bg=Theme.BG_SECONDARY)
+        row3.pack(fill=tk.X)
+
+        tk.Label(row3, text="Process ID:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT)
+        self.free_entry = tk.Entry(row3, width=10, font=Theme.FONT,
+                                   bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.free_entry.pack(side=tk.LEFT, padx=5)
+
+        tk.Button(row3, text="Free", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.WARNING, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.free_process).pack(side=tk.LEFT, padx=10)
+
+        tk.Button(row3, text="Slab vs Fits", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.TEXT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.compare_slab).pack(side=tk.RIGHT)
+
+        # Demand paging section
+        paging_frame = tk.Frame(main, bg=Theme.BG_SECONDARY, padx=15, pady=12)
+        paging_frame.pack(fill=tk.X, pady=10)
+
+        tk.Label(paging_frame, text="─── DEMAND PAGING ───", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(anchor='w')
+
+        row4 = tk.Frame(paging_frame, bg=Theme.BG_SECONDARY)
+        row4.pack(fill=tk.X, pady=10)
+
+        tk.Label(row4, text="References:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT)
+        self.refs_entry = tk.Entry(row4, width=44, font=Theme.FONT,
+                                   bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.refs_entry.insert(0, "7 0 1 2 0 3 0 4 2 3 0 3 2 1 2 0 1 7 0 1")
+        self.refs_entry.pack(side=tk.LEFT, padx=5)
+
+        tk.Label(row4, text="Frames:", font=Theme.FONT_SMALL,
+                 bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(10, 5))
+        self.frames_entry = tk.Entry(row4, width=5, font=Theme.FONT,
+                                     bg=Theme.BG_INPUT, fg=Theme.TEXT)
+        self.frames_entry.insert(0, "3")
+        self.frames_entry.pack(side=tk.LEFT)
+
+        tk.Button(row4, text="Load File", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.TEXT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.load_reference_file).pack(side=tk.LEFT, padx=10)
+
+        tk.Button(row4, text="Run Paging", font=Theme.FONT_BOLD,
+                  bg=Theme.ACCENT, fg=Theme.BG_DARK, bd=0,
+                  padx=20, pady=6, cursor='hand2',
+                  command=self.run_paging).pack(side=tk.RIGHT)
+
+        tk.Button(row4, text="Fault Curve", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.ACCENT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.run_fault_curve).pack(side=tk.RIGHT, padx=10)
+
+        row5 = tk.Frame(paging_frame, bg=Theme.BG_SECONDARY)
+        row5.pack(fill=tk.X, pady=(0, 10))
+
+        self.tlb_entries = {}
+        for label, default, width in [("Levels:", "4", 3), ("TLB Entries:", "64", 5), ("Ways:", "4", 3)]:
+            tk.Label(row5, text=label, font=Theme.FONT_SMALL,
+                     bg=Theme.BG_SECONDARY, fg=Theme.TEXT_DIM).pack(side=tk.LEFT, padx=(0, 5))
+            entry = tk.Entry(row5, width=width, font=Theme.FONT,
+                             bg=Theme.BG_INPUT, fg=Theme.TEXT)
+            entry.insert(0, default)
+            entry.pack(side=tk.LEFT, padx=(0, 10))
+            self.tlb_entries[label] = entry
+
+        self.tlb_policy_var = tk.StringVar(value="LRU")
+        for policy in ["LRU", "Random"]:
+            tk.Radiobutton(row5, text=policy, variable=self.tlb_policy_var, value=policy,
+                           font=Theme.FONT_SMALL, bg=Theme.BG_SECONDARY, fg=Theme.TEXT,
+                           selectcolor=Theme.BG_TERTIARY).pack(side=tk.LEFT)
+        self.page_size_var = tk.StringVar(value="4KB")
+        for size in ["4KB", "2MB"]:
+            tk.Radiobutton(row5, text=size, variable=self.page_size_var, value=size,
+                           font=Theme.FONT_SMALL, bg=Theme.BG_SECONDARY, fg=Theme.TEXT,
+                           selectcolor=Theme.BG_TERTIARY).pack(side=tk.LEFT, padx=(10 if size == "4KB" else 0, 0))
+
+        tk.Button(row5, text="Translate", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.ACCENT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.run_translation).pack(side=tk.RIGHT)
+
+        tk.Button(row5, text="Load Addresses", font=Theme.FONT,
+                  bg=Theme.BG_TERTIARY, fg=Theme.TEXT, bd=0,
+                  padx=12, pady=5, cursor='hand2',
+                  command=self.load_address_file).pack(side=tk.RIGHT, padx=10)
+
+        self.paging_label = tk.Label(paging_frame, text="", font=Theme.FONT,
+                                     bg=Theme.BG_SECONDARY, fg=Theme.SUCCESS, justify=tk.LEFT)
+        self.paging_label.pack(anchor='w')
         
         # Visualization canvas
         viz_frame = tk.Frame(main, bg=Theme.BG_SECONDARY, padx=15, pady=12)
@@ -156,45 +1256,240 @@ class MemoryManagementGUI:
             size = int(self.block_entry.get())
             if size <= 0:
                 raise ValueError("Size must be positive")
-            block = MemoryBlock(size)
-            self.blocks.append(block)
+            if self.mode_var.get() == "Buddy" and isinstance(self.allocator, BuddyAllocator):
+                # the arena doubles as the blocks grow, keeping live allocations
+                self.allocator.grow((sum(self.sizes) + size).bit_length() - 1)
+                self.sizes.append(size)
+            elif self.mode_var.get() == "Buddy":
+                self.sizes.append(size)
+                self.reset_allocator()      # first block: nothing allocated yet
+            else:
+                self.allocator.add_block(MemoryBlock(size))
+                self.sizes.append(size)
             self.update_blocks_display()
             self.draw_memory()
             self.block_entry.delete(0, tk.END)
-        except ValueError as e:
+        except (ValueError, OverflowError) as e:
             messagebox.showerror("Error", str(e) or "Enter valid number")
     
     def random_blocks(self):
         self.clear_all()
         n = random.randint(5, 8)
-        for _ in range(n):
-            size = random.choice([50, 75, 100, 125, 150, 200, 250])
-            self.blocks.append(MemoryBlock(size))
+        self.sizes = [random.choice([50, 75, 100, 125, 150, 200, 250]) for _ in range(n)]
+        self.reset_allocator()
         self.update_blocks_display()
-        self.draw_memory()
     
     def clear_all(self):
-        self.blocks = []
+        self.sizes = []
+        self.allocator = IndexedAllocator()
         self.process_counter = 1
         self.update_blocks_display()
         self.canvas.delete("all")
         self.stats_label.config(text="")
     
+    def compare_slab(self):
+        """Replay one small-object churn trace on slabs and on each fit"""
+        if not self.sizes:
+            messagebox.showwarning("Warning", "Create memory blocks first")
+            return
+        trace = churn_trace(20000, seed=self.process_counter, live=max(1, sum(self.sizes) // 32),
+                            classes=(8, 16, 24, 32))
+        rows = compare_on_trace(self.sizes, trace)
+        self.stats_label.config(
+            text="\n".join(f"{name:<10} hit rate {hit:6.1%} | overhead {overhead:6.1%} | {seconds * 1000:.0f} ms"
+                           for name, hit, overhead, seconds in rows),
+            justify=tk.LEFT
+        )
+
+    def load_reference_file(self):
+        path = filedialog.askopenfilename(
+            title="Page references (32-bit native ints)",
+            filetypes=[("Binary traces", "*.bin *.dat"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            refs = load_references(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.reference_file = refs
+        self.reference_text = f"<{os.path.basename(path)}: {len(refs):,} refs>"
+        self.refs_entry.delete(0, tk.END)
+        self.refs_entry.insert(0, self.reference_text)
+
+    def read_references(self):
+        text = self.refs_entry.get()
+        if self.reference_file is not None and text == self.reference_text:
+            return self.reference_file
+        try:
+            refs = parse_references(text)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return None
+        if not refs:
+            messagebox.showwarning("Warning", "Enter a page reference string")
+            return None
+        return refs
+
+    def run_paging(self):
+        refs = self.read_references()
+        if refs is None:
+            return
+        try:
+            frames = int(self.frames_entry.get())
+            if frames <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Invalid frame count (must be positive integer)")
+            return
+        self.start_paging(f"Simulating {len(refs):,} references on {frames} frames...",
+                          PageReplacement.simulate, (refs, frames),
+                          lambda faults: self.show_faults(faults, len(refs)))
+
+    def run_fault_curve(self):
+        refs = self.read_references()
+        if refs is None:
+            return
+        self.start_paging(f"Stack distances of {len(refs):,} references...",
+                          self.fault_curves, (refs,), self.draw_fault_curve)
+
+    @staticmethod
+    def fault_curves(refs):
+        """LRU and OPT faults for every frame count, OPT up to 256 frames"""
+        lru = StackDistance.lru(refs)
+        return {"LRU": lru, "Optimal": StackDistance.optimal(refs, min(len(lru) - 1, 256))}
+
+    def load_address_file(self):
+        path = filedialog.askopenfilename(
+            title="Virtual addresses (64-bit native unsigned ints)",
+            filetypes=[("Binary traces", "*.bin *.dat"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.address_file = load_references(path, 'Q')
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.paging_label.config(text=f"{os.path.basename(path)}: {len(self.address_file):,} addresses loaded")
+
+    def run_translation(self):
+        try:
+            levels, entries, ways = (int(self.tlb_entries[k].get())
+                                     for k in ("Levels:", "TLB Entries:", "Ways:"))
+        except ValueError:
+            messagebox.showerror("Error", "Levels, TLB entries and ways must be integers")
+            return
+        try:
+            translator = AddressTranslator(levels, entries, ways, self.tlb_policy_var.get(),
+                                           self.page_size_var.get() == "2MB")
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        addresses = self.address_file
+        source = "loaded addresses"
+        if addresses is None:
+            addresses = address_trace(10 ** 6, seed=self.process_counter)
+            source = "a random 1M-address trace"
+        self.start_paging(f"Translating {source}...", translator.run, (addresses,), self.show_translation)
+
+    def show_translation(self, report):
+        self.paging_label.config(
+            text=f"TLB hit rate: {report['hit_rate']:.2%} | Walk accesses: {report['walk_accesses']:,}"
+                 f" | Page tables: {report['table_kb']:,}KB | EAT: {report['eat_ns']:.1f}ns")
+
+    def start_paging(self, text, work, args, show):
+        # long reference files run on a thread; a newer run makes this one stale
+        job = {}
+        self.paging = job
+        self.paging_label.config(text=text)
+        threading.Thread(target=self.paging_worker, args=(job, work, args), daemon=True).start()
+        self.parent.after(50, self.poll_paging, job, show)
+
+    @staticmethod
+    def paging_worker(job, work, args):
+        try:
+            job['result'] = work(*args)
+        except Exception as e:
+            job['error'] = e
+
+    def poll_paging(self, job, show):
+        if self.paging is not job:
+            return
+        if 'result' not in job and 'error' not in job:
+            self.parent.after(100, self.poll_paging, job, show)
+            return
+        self.paging = None
+        if 'error' in job:
+            messagebox.showerror("Paging Error", str(job['error']))
+            return
+        show(job['result'])
+
+    def show_faults(self, faults, n):
+        self.paging_label.config(text=" | ".join(
+            f"{algo}: {count:,} faults ({count / n:.1%})" for algo, count in faults.items()))
+
+    def draw_fault_curve(self, curves):
+        """Faults against frame count on the memory map canvas"""
+        c = self.canvas
+        c.delete("all")
+        width = max(c.winfo_width(), 400)
+        height = int(c['height'])
+        x0, x1, y0, y1 = 60, width - 20, 25, height - 25
+        frames = max(len(curve) for curve in curves.values()) - 1
+        peak = max(curve[0] for curve in curves.values()) or 1
+        colors = {"LRU": Theme.ACCENT, "Optimal": Theme.WARNING}
+        x = x1
+        for name in reversed(list(curves)):
+            item = c.create_text(x, 10, text=name, fill=colors[name], font=Theme.FONT_SMALL, anchor='e')
+            x = c.bbox(item)[0] - 15
+        c.create_line(x0, y1, x1, y1, fill=Theme.BORDER)
+        c.create_line(x0, y0, x0, y1, fill=Theme.BORDER)
+        c.create_text(x0, y1 + 12, text="0 frames", fill=Theme.TEXT_DIM, font=Theme.FONT_SMALL)
+        c.create_text(x1, y1 + 12, text=f"{frames} frames", fill=Theme.TEXT_DIM, font=Theme.FONT_SMALL, anchor='e')
+        c.create_text(x0 - 5, y0, text=f"{peak:,}", fill=Theme.TEXT_DIM, font=Theme.FONT_SMALL, anchor='e')
+        c.create_text(x0 - 5, y1, text="0", fill=Theme.TEXT_DIM, font=Theme.FONT_SMALL, anchor='e')
+        for name, curve in curves.items():
+            # thin long curves to about one point per pixel
+            step = max(1, len(curve) // (x1 - x0))
+            points = []
+            for k in list(range(0, len(curve) - 1, step)) + [len(curve) - 1]:
+                points += [x0 + k * (x1 - x0) / max(frames, 1), y1 - curve[k] * (y1 - y0) / peak]
+            if len(points) > 2:
+                c.create_line(*points, fill=colors[name], width=2)
+        self.paging_label.config(text=" | ".join(
+            f"{name}: {curve[-1]:,} faults at {len(curve) - 1} frames" for name, curve in curves.items()))
+
+    def reset_allocator(self):
+        """Start over on the same blocks with the chosen partitioning"""
+        blocks = [MemoryBlock(size) for size in self.sizes]
+        total = sum(self.sizes)
+        if self.mode_var.get() == "Buddy" and total:
+            # the largest power-of-two arena the blocks can hold, in 1KB units
+            self.allocator = BuddyAllocator(total.bit_length() - 1)
+        elif self.mode_var.get() == "Variable":
+            self.allocator = DynamicPartitioner(blocks)
+        elif self.mode_var.get() == "Slab":
+            self.allocator = SlabAllocator(blocks)
+        else:
+            self.allocator = IndexedAllocator(blocks)
+        self.draw_memory()
+        self.stats_label.config(text="")
+
     def update_blocks_display(self):
         for widget in self.blocks_frame.winfo_children():
             widget.destroy()
         
-        if not self.blocks:
+        if not self.sizes:
             tk.Label(self.blocks_frame, text="No memory blocks created",
                      font=Theme.FONT_SMALL, bg=Theme.BG_DARK, fg=Theme.TEXT_DIM).pack()
             return
         
-        text = "Memory Blocks: " + " | ".join([f"{b.size}KB" for b in self.blocks])
+        text = "Memory Blocks: " + " | ".join([f"{size}KB" for size in self.sizes])
         tk.Label(self.blocks_frame, text=text, font=Theme.FONT,
                  bg=Theme.BG_DARK, fg=Theme.TEXT).pack(anchor='w')
     
     def allocate_process(self):
-        if not self.blocks:
+        if not self.sizes:
             messagebox.showwarning("Warning", "Create memory blocks first")
             return
         
@@ -209,12 +1504,18 @@ class MemoryManagementGUI:
         algo = self.algo_var.get()
         process_id = f"P{self.process_counter}"
         
-        if algo == "First Fit":
-            success, block = MemoryAllocator.first_fit(self.blocks, size, process_id)
+        if isinstance(self.allocator, BuddyAllocator):
+            algo = "Buddy System"
+            success, block = self.allocator.allocate(size, process_id)
+        elif isinstance(self.allocator, SlabAllocator):
+            algo = f"the {-(-size // self.allocator.align) * self.allocator.align}KB slab cache"
+            success, block = self.allocator.allocate(size, process_id)
+        elif algo == "First Fit":
+            success, block = self.allocator.first_fit(size, process_id)
         elif algo == "Best Fit":
-            success, block = MemoryAllocator.best_fit(self.blocks, size, process_id)
+            success, block = self.allocator.best_fit(size, process_id)
         else:  # Worst Fit
-            success, block = MemoryAllocator.worst_fit(self.blocks, size, process_id)
+            success, block = self.allocator.worst_fit(size, process_id)
         
         if success:
             self.process_counter += 1
@@ -223,18 +1524,32 @@ class MemoryManagementGUI:
             messagebox.showinfo("Success", f"{process_id} allocated ({size}KB) using {algo}")
         else:
             messagebox.showerror("Allocation Failed", "No suitable block found")
+
+    def free_process(self):
+        process_id = self.free_entry.get().strip()
+        if self.allocator.free(process_id) is None:
+            messagebox.showerror("Error", f"No memory held by '{process_id}'")
+            return
+        self.free_entry.delete(0, tk.END)
+        self.draw_memory()
+        self.update_stats()
     
     def draw_memory(self):
         self.canvas.delete("all")
-        if not self.blocks:
+        if isinstance(self.allocator, BuddyAllocator):
+            self.draw_buddy_tree()
+            return
+        blocks = self.blocks
+        if not blocks:
             return
         
         x = 50
         y = 50
         max_width = 600
         
-        for i, block in enumerate(self.blocks):
-            width = min(block.size * 2, max_width // len(self.blocks))
+        addressed = not isinstance(self.allocator, IndexedAllocator)
+        for i, block in enumerate(blocks):
+            width = min(block.size * 2, max_width // len(blocks))
             height = 80
             
             if block.is_allocated:
@@ -252,19 +1567,49 @@ class MemoryManagementGUI:
             
             # Block label
             self.canvas.create_text(x + width//2, y + height + 15,
-                                    text=f"Block {i+1}", font=Theme.FONT_SMALL,
+                                    text=f"@{block.start}" if addressed else f"Block {i+1}",
+                                    font=Theme.FONT_SMALL,
                                     fill=Theme.TEXT_DIM)
             
             x += width + 20
     
+    def draw_buddy_tree(self):
+        """One row per split depth; each node spans its share of the arena"""
+        buddy = self.allocator
+        nodes = list(buddy.nodes())
+        depth = max(buddy.max_order - order for _, order, _ in nodes) + 1
+        x0, y0, max_width = 50, 20, 600
+        height = min(40, 240 // depth)
+        arena = 1 << buddy.max_order
+        for addr, order, state in nodes:
+            x = x0 + addr * max_width // arena
+            width = (1 << order) * max_width // arena
+            y = y0 + (buddy.max_order - order) * (height + 4)
+            if state == 'split':
+                color, text = Theme.BG_TERTIARY, ""
+            elif state == 'free':
+                color, text = Theme.SUCCESS, f"{buddy.unit << order}KB"
+            else:
+                color, text = Theme.ERROR, state
+            self.canvas.create_rectangle(x, y, x + width, y + height,
+                                          fill=color, outline=Theme.BORDER, width=1)
+            if text and width >= 8 * len(text):
+                self.canvas.create_text(x + width // 2, y + height // 2, text=text,
+                                        font=Theme.FONT_SMALL, fill=Theme.BG_DARK)
+        self.canvas.create_text(x0, y0 + depth * (height + 4) + 10, anchor='w',
+                                text=f"Arena {buddy.unit << buddy.max_order}KB",
+                                font=Theme.FONT_SMALL, fill=Theme.TEXT_DIM)
+
     def update_stats(self):
-        total = sum(b.size for b in self.blocks)
-        allocated = sum(b.process_size for b in self.blocks if b.is_allocated)
+        total, held, allocated, holes = self.allocator.usage()
         free = total - allocated
-        fragmentation = sum(b.size - b.process_size for b in self.blocks if b.is_allocated)
+        fragmentation = held - allocated
+        external = (total - held) - self.allocator.largest_hole()
         
         self.stats_label.config(
             text=f"Total: {total}KB | Allocated: {allocated}KB | Free: {free}KB | Internal Fragmentation: {fragmentation}KB"
+                 f"\nExternal Fragmentation: {external}KB outside the largest hole ({holes} holes)",
+            justify=tk.LEFT
         )
 
 def open_memory(parent_frame):
@@ -0,0 +1,405 @@
+"""
+Paging Module
+Demand paging with FIFO, LRU, Clock and Optimal page replacement,
+and TLB / multi-level page table address translation
+"""
+import heapq
+import mmap
+import random
+import re
+from array import array
+from collections import OrderedDict, deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used without it
+    np = None
+
+PAGE_SHIFT = 12                         # 4KB base pages
+LEVEL_BITS = 9                          # 512 entries per page table node
+
+class PageReplacement:
+    """Page fault counts for a reference string and a number of frames.
+
+    References can be any sequence of ints: a list, an array or the
+    memoryview load_references maps over a file, so strings of 10^8
+    entries are read without copying them into Python objects first.
+    """
+    ALGORITHMS = ("FIFO", "LRU", "Clock", "Optimal")
+
+    @staticmethod
+    def check_frames(frames):
+        if frames < 1:
+            raise ValueError("Frames must be positive")
+
+    @staticmethod
+    def fifo(refs, frames):
+        """Evict the page loaded longest ago"""
+        PageReplacement.check_frames(frames)
+        resident = set()
+        queue = deque()
+        faults = 0
+        for page in refs:
+            if page in resident:
+                continue
+            faults += 1
+            if len(resident) >= frames:
+                resident.discard(queue.popleft())
+            resident.add(page)
+            queue.append(page)
+        return faults
+
+    @staticmethod
+    def lru(refs, frames):
+        """Evict the least recently used page; the OrderedDict keeps recency order"""
+        PageReplacement.check_frames(frames)
+        resident = OrderedDict()
+        touch = resident.move_to_end
+        evict = resident.popitem
+        faults = 0
+        for page in refs:
+            if page in resident:
+                touch(page)
+                continue
+            faults += 1
+            if len(resident) >= frames:
+                evict(last=False)
+            resident[page] = None
+        return faults
+
+    @staticmethod
+    def clock(refs, frames):
+        """Second chance: the hand clears reference bits until it finds a clear one"""
+        PageReplacement.check_frames(frames)
+        slots = {}                      # page -> frame
+        pages = [None] * frames
+        referenced = bytearray(frames)
+        hand = 0
+        used = 0
+        faults = 0
+        for page in refs:
+            slot = slots.get(page)
+            if slot is not None:
+                referenced[slot] = 1
+                continue
+            faults += 1
+            if used < frames:
+                slot = used
+                used += 1
+            else:
+                while referenced[hand]:
+                    referenced[hand] = 0
+                    hand = hand + 1 if hand + 1 < frames else 0
+                slot = hand
+                hand = hand + 1 if hand + 1 < frames else 0
+                del slots[pages[slot]]
+            pages[slot] = page
+            slots[page] = slot
+            referenced[slot] = 1
+        return faults
+
+    @staticmethod
+    def optimal(refs, frames):
+        """Belady: evict the page used furthest in the future.
+
+        Resident pages sit in a max-heap keyed by the index of their next use.
+        Hits push a fresh entry and leave the old one stale; stale entries are
+        skipped on eviction and the heap is rebuilt once it grows past a few
+        times the frame count, so each reference costs O(log frames).
+        """
+        PageReplacement.check_frames(frames)
+        following = next_use(refs)
+        resident = {}                   # page -> index of its next use
+        heap = []
+        limit = 2 * frames + 64
+        faults = 0
+        for i, page in enumerate(refs):
+            upcoming = following[i]
+            if page not in resident:
+                faults += 1
+                if len(resident) >= frames:
+                    while True:
+                        key, victim = heapq.heappop(heap)
+                        if resident.get(victim) == -key:
+                            break
+                    del resident[victim]
+            resident[page] = upcoming
+            heapq.heappush(heap, (-upcoming, page))
+            if len(heap) > limit:
+                heap = [(-index, p) for p, index in resident.items()]
+                heapq.heapify(heap)
+        return faults
+
+    @staticmethod
+    def run(algo, refs, frames):
+        method = {"FIFO": PageReplacement.fifo, "LRU": PageReplacement.lru,
+                  "Clock": PageReplacement.clock, "Optimal": PageReplacement.optimal}[algo]
+        return method(refs, frames)
+
+    @staticmethod
+    def simulate(refs, frames, algorithms=ALGORITHMS):
+        """Fault counts of each algorithm, in order"""
+        return {algo: PageReplacement.run(algo, refs, frames) for algo in algorithms}
+
+class StackDistance:
+    """Mattson stack analysis: fault counts for every frame count in one pass.
+
+    LRU and OPT are stack algorithms: the pages held with k frames are
+    always among those held with k + 1. Each reference therefore has a
+    stack distance d, and it faults exactly when frames < d. The curves
+    returned are lists where curve[k] is the number of faults with k frames.
+    """
+    @staticmethod
+    def curve(hist, n, max_frames):
+        """Faults for 0..max_frames frames from a distance histogram"""
+        curve = [n]
+        for d in range(1, max_frames + 1):
+            curve.append(curve[-1] - (hist[d] if d < len(hist) else 0))
+        return curve
+
+    @staticmethod
+    def lru(refs, max_frames=None):
+        """LRU distance = distinct pages touched since the page's last use + 1.
+
+        A Fenwick tree over access times holds a 1 at each page's latest
+        access, so the distance is a prefix sum: O(log D) per reference for D
+        distinct pages. Times are renumbered whenever the tree fills, which
+        keeps it at O(D) entries however long the string is.
+        """
+        last = {}                       # page -> time of its latest access
+        size = 1024
+        tree = [0] * (size + 1)
+        clock = 0
+        hist = [0]
+        for page in refs:
+            if clock == size:
+                # keep only the latest accesses, renumbered 1..D in time order
+                order = sorted(last, key=last.get)
+                for t, p in enumerate(order, 1):
+                    last[p] = t
+                clock = len(order)
+                size = max(size, 2 * clock)
+                tree = [0] * (size + 1)
+                for i in range(1, size + 1):
+                    low = i - (i & -i)
+                    tree[i] = max(0, min(i, clock) - low)
+            clock += 1
+            prev = last.get(page)
+            if prev is not None:
+                below = 0
+                i = prev
+                while i:
+                    below += tree[i]
+                    i &= i - 1
+                d = len(last) - below + 1
+                if d >= len(hist):
+                    hist.extend([0] * (d + 1 - len(hist)))
+                hist[d] += 1
+                i = prev
+                while i <= size:
+                    tree[i] -= 1
+                    i += i & -i
+            i = clock
+            while i <= size:
+                tree[i] += 1
+                i += i & -i
+            last[page] = clock
+        return StackDistance.curve(hist, len(refs), len(last) if max_frames is None else max_frames)
+
+    @staticmethod
+    def optimal(refs, max_frames=None):
+        """OPT stack: the referenced page goes on top and each lower level keeps
+        whichever of its page and the one pushed down is needed sooner.
+
+        Only the top max_frames levels are kept, so a reference costs
+        O(depth) up to max_frames; the default covers every distinct page.
+        Finding the page and pushing down past it both walk the stack, so a
+        string of N references over D pages costs O(N * min(D, max_frames)),
+        against O(N log D) for the LRU curve: cap max_frames on large
+        footprints.
+        """
+        following = next_use(refs)
+        limit = len(set(refs)) if max_frames is None else max_frames
+        upcoming = {}                   # page -> index of its next use
+        stack = []
+        inside = set()
+        hist = [0] * (limit + 1)
+        for t, page in enumerate(refs):
+            upcoming[page] = following[t]
+            if page in inside:
+                j = stack.index(page)
+                hist[j + 1] += 1
+            elif limit:
+                j = len(stack)
+                inside.add(page)
+                if j < limit:
+                    stack.append(page)
+            else:
+                continue
+            if j == 0:
+                continue
+            carry = stack[0]
+            stack[0] = page
+            for i in range(1, min(j, limit)):
+                other = stack[i]
+                if upcoming[carry] < upcoming[other]:
+                    stack[i] = carry
+                    carry = other
+            if j < limit:
+                stack[j] = carry
+            else:
+                inside.discard(carry)
+        return StackDistance.curve(hist, len(refs), limit)
+
+class AddressTranslator:
+    """Virtual address translation through a set-associative TLB and a radix page table.
+
+    The TLB is one array of tags: page p can only live in set p % sets,
+    slots s * ways .. s * ways + ways - 1, so a lookup scans just those
+    ways. Under LRU each set is kept most recent first, so a hit moves its
+    tag to the front and a miss drops the last one. A miss walks `levels`
+    page table nodes, one less with huge pages, where the leaf sits one
+    level up and each page covers 512 base pages. Nodes are created on
+    first touch, so table_nodes is the page table's footprint.
+    """
+    CHUNK = 1 << 20
+
+    def __init__(self, levels=4, tlb_entries=64, ways=4, policy="LRU", huge_pages=False,
+                 tlb_ns=1, memory_ns=100, seed=0):
+        if not 2 <= levels <= 4:
+            raise ValueError("Page tables need 2 to 4 levels")
+        if ways < 1 or tlb_entries < ways or tlb_entries % ways:
+            raise ValueError("TLB entries must be a positive multiple of the ways")
+        if policy not in ("LRU", "Random"):
+            raise ValueError("TLB policy must be LRU or Random")
+        self.levels = levels
+        self.ways = ways
+        self.sets = tlb_entries // ways
+        self.lru = policy == "LRU"
+        self.huge_pages = huge_pages
+        self.tlb_ns = tlb_ns
+        self.memory_ns = memory_ns
+        self.rng = random.Random(seed)
+        self.tags = array('q', [-1]) * tlb_entries
+        self.page_shift = PAGE_SHIFT + (LEVEL_BITS if huge_pages else 0)
+        self.walk_levels = levels - 1 if huge_pages else levels
+        self.page_mask = (1 << (LEVEL_BITS * self.walk_levels)) - 1
+        self.leaves = set()             # leaf table nodes walked, by address prefix
+        self.last_page = -1
+        self.translations = 0
+        self.hits = 0
+        self.walks = 0
+
+    def feed(self, pages):
+        """Translate a stream of page numbers"""
+        tags, ways, sets, lru, leaves = self.tags, self.ways, self.sets, self.lru, self.leaves
+        last, hits, walks, count = self.last_page, 0, 0, 0
+        for page in pages:
+            count += 1
+            if page == last:
+                hits += 1               # still in its set: nothing was looked up since
+                continue
+            last = page
+            base = page % sets * ways
+            if tags[base] == page:
+                hits += 1               # already first in its set
+                continue
+            entries = tags[base:base + ways]
+            if page in entries:
+                hits += 1
+                if lru:
+                    way = entries.index(page)
+                    tags[base + 1:base + way + 1] = entries[:way]
+                    tags[base] = page
+                continue
+            walks += 1
+            leaves.add(page >> LEVEL_BITS)
+            if lru:
+                tags[base + 1:base + ways] = entries[:-1]
+                tags[base] = page
+            elif -1 in entries:
+                tags[base + entries.index(-1)] = page
+            else:
+                tags[base + self.rng.randrange(ways)] = page
+        self.last_page = last
+        self.translations += count
+        self.hits += hits
+        self.walks += walks
+
+    def run(self, addresses):
+        """Translate every address of a trace (any int sequence); returns report()"""
+        shift, mask = self.page_shift, self.page_mask
+        if np is not None and len(addresses) > 1:
+            data = np.asarray(addresses, dtype=np.uint64)
+            for start in range(0, len(data), self.CHUNK):
+                pages = (data[start:start + self.CHUNK] >> np.uint64(shift)) & np.uint64(mask)
+                # repeats of the previous page are TLB hits that change no state
+                keep = np.empty(len(pages), dtype=bool)
+                keep[0] = int(pages[0]) != self.last_page
+                np.not_equal(pages[1:], pages[:-1], out=keep[1:])
+                repeats = len(pages) - int(keep.sum())
+                self.feed(pages[keep].tolist())
+                self.translations += repeats
+                self.hits += repeats
+                self.last_page = int(pages[-1])
+        else:
+            self.feed((address >> shift) & mask for address in addresses)
+        return self.report()
+
+    def report(self):
+        """TLB hit rate, page walk memory accesses, table size and effective access time"""
+        n = self.translations
+        hit_rate = self.hits / n if n else 0.0
+        walk_accesses = self.walks * self.walk_levels
+        # each level up keeps one node per distinct prefix of the level below
+        nodes, level = 0, self.leaves
+        for _ in range(self.walk_levels):
+            nodes += len(level)
+            level = {prefix >> LEVEL_BITS for prefix in level}
+        # every access pays the TLB and the data reference; misses add the walk
+        eat = self.tlb_ns + self.memory_ns + (walk_accesses / n if n else 0.0) * self.memory_ns
+        return {"translations": n, "hit_rate": hit_rate, "walk_accesses": walk_accesses,
+                "table_nodes": nodes, "table_kb": nodes << (PAGE_SHIFT - 10), "eat_ns": eat}
+
+def address_trace(count, seed=0, working_set=1 << 30, locality=0.9):
+    """Seeded virtual addresses: 64-byte strides with probability locality,
+    else a jump anywhere in the working set"""
+    rnd = random.Random(seed)
+    trace = array('Q', bytes(8 * count))
+    address = 0
+    for i in range(count):
+        if rnd.random() < locality:
+            address = (address + 64) % working_set
+        else:
+            address = rnd.randrange(working_set) & ~63
+        trace[i] = address
+    return trace
+
+def next_use(refs):
+    """For each position, the index where the same page is referenced next
+    (len(refs) when it never is), from one backward pass"""
+    n = len(refs)
+    following = array('i' if n < 2 ** 31 else 'q', bytes((4 if n < 2 ** 31 else 8) * n))
+    seen = {}
+    for i in range(n - 1, -1, -1):
+        page = refs[i]
+        following[i] = seen.get(page, n)
+        seen[page] = i
+    return following
+
+def parse_references(text):
+    """Page numbers separated by spaces or commas"""
+    try:
+        return array('q', [int(tok) for tok in re.split(r'[\s,]+', text.strip()) if tok])
+    except ValueError:
+        raise ValueError("Reference string must be integers separated by spaces or commas")
+
+def load_references(path, typecode='i'):
+    """Map a binary file of native ints (array typecode) as a read-only sequence"""
+    with open(path, 'rb') as f:
+        if not f.seek(0, 2):
+            return array(typecode)
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(data) % array(typecode).itemsize:
+        raise ValueError(f"{path}: size is not a multiple of {array(typecode).itemsize} bytes")
+    return memoryview(data).cast(typecode)
@@ -0,0 +1,342 @@
+"""
+Scheduling engines pinned against the original list-based algorithms
+"""
+import math
+import random
+import unittest
+
+import cpu_scheduling
+from cpu_scheduling import (CPUScheduler, IncrementalScheduler, Process, ProcessTable,
+                            QuantileSketch, RealTimeScheduler, RTTask, RunningStats)
+
+np = cpu_scheduling.np
+
+class Baseline:
+    """The algorithms as first written: one tuple per slice, no switch costs"""
+    @staticmethod
+    def fcfs(processes):
+        sorted_p = sorted(processes, key=lambda p: (p.arrival, int(p.pid[1:])))
+        time = 0
+        gantt = []
+        for p in sorted_p:
+            if time < p.arrival:
+                gantt.append(('idle', time, p.arrival))
+                time = p.arrival
+            p.start_time = time
+            gantt.append((p.pid, time, time + p.burst))
+            time += p.burst
+            p.completion_time = time
+            p.turnaround_time = p.completion_time - p.arrival
+            p.waiting_time = p.turnaround_time - p.burst
+        return sorted_p, gantt
+
+    @staticmethod
+    def by_key(processes, order, key):
+        sorted_p = sorted(processes, key=order)
+        time = 0
+        gantt = []
+        completed = 0
+        while completed < len(sorted_p):
+            available = [p for p in sorted_p if p.arrival <= time and p.remaining > 0]
+            if not available:
+                next_arr = min((p.arrival for p in sorted_p if p.remaining > 0), default=time)
+                gantt.append(('idle', time, next_arr))
+                time = next_arr
+                continue
+            current = min(available, key=key)
+            if current.start_time == -1:
+                current.start_time = time
+            gantt.append((current.pid, time, time + current.burst))
+            time += current.burst
+            current.remaining = 0
+            current.completion_time = time
+            current.turnaround_time = current.completion_time - current.arrival
+            current.waiting_time = current.turnaround_time - current.burst
+            completed += 1
+        return sorted_p, gantt
+
+    @staticmethod
+    def sjf(processes):
+        return Baseline.by_key(processes, lambda p: (p.arrival, p.burst, int(p.pid[1:])),
+                               lambda p: p.burst)
+
+    @staticmethod
+    def priority(processes):
+        return Baseline.by_key(processes, lambda p: (p.arrival, p.priority, int(p.pid[1:])),
+                               lambda p: p.priority)
+
+    @staticmethod
+    def round_robin(processes, quantum):
+        queue = []
+        time = 0
+        gantt = []
+        completed = 0
+        n = len(processes)
+        sorted_p = sorted(processes, key=lambda p: p.arrival)
+        idx = 0
+        while completed < n:
+            while idx < n and sorted_p[idx].arrival <= time:
+                queue.append(sorted_p[idx])
+                idx += 1
+            if not queue:
+                if idx < n:
+                    gantt.append(('idle', time, sorted_p[idx].arrival))
+                    time = sorted_p[idx].arrival
+                continue
+            current = queue.pop(0)
+            if current.start_time == -1:
+                current.start_time = time
+            exec_time = min(quantum, current.remaining)
+            gantt.append((current.pid, time, time + exec_time))
+            time += exec_time
+            current.remaining -= exec_time
+            while idx < n and sorted_p[idx].arrival <= time:
+                queue.append(sorted_p[idx])
+                idx += 1
+            if current.remaining > 0:
+                queue.append(current)
+            else:
+                current.completion_time = time
+                current.turnaround_time = current.completion_time - current.arrival
+                current.waiting_time = current.turnaround_time - current.burst
+                completed += 1
+        return sorted_p, gantt
+
+def workload(seed, most=12, arrivals=20):
+    rnd = random.Random(seed)
+    return [(f"P{i + 1}", rnd.randint(0, arrivals), rnd.randint(1, 8), rnd.randint(1, 4))
+            for i in range(rnd.randint(1, most))]
+
+def processes(spec):
+    return [Process(*row) for row in spec]
+
+def merged(gantt):
+    """Consecutive slices of one process joined into a single segment"""
+    out = []
+    for pid, start, end in gantt:
+        if out and out[-1][0] == pid and out[-1][2] == start:
+            out[-1] = (pid, out[-1][1], end)
+        else:
+            out.append((pid, start, end))
+    return out
+
+def results(ordered):
+    return [(p.pid, p.start_time, p.completion_time, p.waiting_time, p.turnaround_time)
+            for p in ordered]
+
+class TestAgainstBaseline(unittest.TestCase):
+    TRIALS = 400
+
+    def check(self, name, run, reference):
+        for seed in range(self.TRIALS):
+            spec = workload(seed)
+            got, gantt = run(processes(spec))
+            want, want_gantt = reference(processes(spec))
+            self.assertEqual(results(got), results(want), (name, seed))
+            self.assertEqual(list(gantt), merged(want_gantt), (name, seed))
+
+    def test_fcfs(self):
+        self.check("FCFS", CPUScheduler.fcfs, Baseline.fcfs)
+
+    def test_sjf(self):
+        self.check("SJF", CPUScheduler.sjf, Baseline.sjf)
+
+    def test_priority(self):
+        self.check("Priority", CPUScheduler.priority, Baseline.priority)
+
+    def test_round_robin(self):
+        for quantum in (1, 2, 3, 5):
+            self.check(f"RR q={quantum}", lambda ps: CPUScheduler.round_robin(ps, quantum),
+                       lambda ps: Baseline.round_robin(ps, quantum))
+
+    def test_process_table_matches_lists(self):
+        for seed in range(100):
+            spec = workload(seed)
+            for name in ("fcfs", "sjf", "priority", "srtf", "preemptive_priority"):
+                method = getattr(CPUScheduler, name)
+                for cost in (0, 1):
+                    got, gantt = method(ProcessTable.from_processes(processes(spec)), cost)
+                    want, want_gantt = method(processes(spec), cost)
+                    self.assertEqual(results(got), results(want), (name, seed, cost))
+                    self.assertEqual(list(gantt), list(want_gantt), (name, seed, cost))
+
+    def test_streams_match_lists(self):
+        for seed in range(100):
+            spec = workload(seed)
+            for name in ("fcfs", "sjf", "priority"):
+                arrivals = sorted(processes(spec), key=lambda p: (p.arrival, int(p.pid[1:])))
+                got = list(getattr(CPUScheduler, name + "_stream")(arrivals))
+                _, gantt = getattr(CPUScheduler, name)(processes(spec))
+                segments = [item for kind, item in got if kind == 'segment']
+                self.assertEqual(segments, list(gantt), (name, seed))
+
+class TestEngineRelations(unittest.TestCase):
+    """Cases where two engines must produce the same schedule"""
+    def same(self, a, b, msg):
+        self.assertEqual(sorted(results(a[0])), sorted(results(b[0])), msg)
+        self.assertEqual(list(a[1]), list(b[1]), msg)
+
+    def test_preemptive_equals_non_preemptive_when_all_arrive_at_once(self):
+        for seed in range(200):
+            spec = [(pid, 0, burst, prio) for pid, _, burst, prio in workload(seed)]
+            self.same(CPUScheduler.srtf(processes(spec)), CPUScheduler.sjf(processes(spec)), seed)
+            self.same(CPUScheduler.preemptive_priority(processes(spec)),
+                      CPUScheduler.priority(processes(spec)), seed)
+
+    def test_single_level_mlfq_is_round_robin(self):
+        for seed in range(200):
+            spec = workload(seed)
+            quantum = seed % 4 + 1
+            self.same(CPUScheduler.mlfq(processes(spec), [quantum]),
+                      CPUScheduler.round_robin(processes(spec), quantum), seed)
+
+    def test_one_core_smp_is_uniprocessor(self):
+        for seed in range(200):
+            spec = workload(seed)
+            for algo, run in (("FCFS", CPUScheduler.fcfs), ("SJF", CPUScheduler.sjf),
+                              ("Priority", CPUScheduler.priority),
+                              ("Round Robin", lambda ps: CPUScheduler.round_robin(ps, 2))):
+                done, lanes = CPUScheduler.smp(processes(spec), algo, 1, 2)
+                self.same((done, lanes[0]), run(processes(spec)), (algo, seed))
+
+    def test_every_process_runs_its_burst(self):
+        for seed in range(100):
+            spec = workload(seed)
+            for name, run in (("SRTF", CPUScheduler.srtf),
+                              ("MLFQ", lambda ps: CPUScheduler.mlfq(ps, [2, 4, 8], 20)),
+                              ("CFS", CPUScheduler.cfs)):
+                done, gantt = run(processes(spec))
+                self.assertEqual(len(done), len(spec), (name, seed))
+                ran = {}
+                for pid, start, end in gantt:
+                    ran[pid] = ran.get(pid, 0) + end - start
+                for pid, arrival, burst, _ in spec:
+                    self.assertEqual(ran[pid], burst, (name, seed))
+                for p in done:
+                    self.assertEqual(p.turnaround_time, p.completion_time - p.arrival)
+                    self.assertEqual(p.waiting_time, p.turnaround_time - p.burst)
+
+    def test_switch_cost_only_adds_switch_segments(self):
+        for seed in range(100):
+            spec = workload(seed)
+            _, plain = CPUScheduler.fcfs(processes(spec))
+            _, costly = CPUScheduler.fcfs(processes(spec), 2)
+            switches = sum(1 for seg in costly if seg[0] == 'cs')
+            self.assertEqual(switches, CPUScheduler.context_switches(plain))
+            self.assertTrue(all(end - start == 2 for pid, start, end in costly if pid == 'cs'))
+
+    def test_incremental_matches_full_run(self):
+        for seed in range(100):
+            spec = workload(seed)
+            half = len(spec) // 2
+            for algo in ("FCFS", "SJF", "Priority"):
+                inc = IncrementalScheduler(algo, processes(spec[:half]), every=2)
+                inc.run()
+                for row in spec[half:]:
+                    inc.add(*row)
+                got = inc.run()
+                want = getattr(CPUScheduler, algo.lower())(processes(spec))
+                self.assertEqual(results(got[0]), results(want[0]), (algo, seed))
+                self.assertEqual(list(got[1]), list(want[1]), (algo, seed))
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestFCFSKernel(unittest.TestCase):
+    def test_table_matches_lists(self):
+        for seed in range(200):
+            spec = workload(seed, most=30, arrivals=60)
+            for cost in (0, 1, 3):
+                got, gantt = CPUScheduler.fcfs(ProcessTable.from_processes(processes(spec)), cost)
+                want, want_gantt = CPUScheduler.fcfs(processes(spec), cost)
+                self.assertEqual(results(got), results(want), (seed, cost))
+                self.assertEqual(len(gantt), len(want_gantt), (seed, cost))
+                self.assertEqual(gantt.finish(), want_gantt[-1][2])
+                totals = gantt.totals()
+                self.assertEqual(list(gantt), list(want_gantt), (seed, cost))
+                self.assertEqual(gantt.totals(), totals)
+                self.assertEqual(totals, super(type(gantt), gantt).totals())
+
+    def test_unsorted_input(self):
+        rnd = random.Random(7)
+        arrival = np.array([rnd.randint(0, 50) for _ in range(500)])
+        burst = np.array([rnd.randint(1, 9) for _ in range(500)])
+        order, start, completion = CPUScheduler.fcfs_arrays(arrival, burst)
+        ranked = sorted(range(500), key=lambda i: (arrival[i], i))
+        self.assertEqual(order.tolist(), ranked)
+        time = 0
+        for k, i in enumerate(ranked):
+            time = max(time, int(arrival[i]))
+            self.assertEqual(int(start[k]), time)
+            time += int(burst[i])
+            self.assertEqual(int(completion[k]), time)
+
+    def test_stats_match_lists(self):
+        spec = workload(3, most=40)
+        table = ProcessTable.from_processes(processes(spec))
+        _, gantt = CPUScheduler.fcfs(table, 1)
+        done, want_gantt = CPUScheduler.fcfs(processes(spec), 1)
+        fast = RunningStats.for_lanes([gantt], table)
+        slow = RunningStats.for_lanes([want_gantt], done)
+        for name in ('completed', 'switches', 'busy', 'overhead', 'end'):
+            self.assertEqual(getattr(fast, name), getattr(slow, name), name)
+        self.assertAlmostEqual(fast.avg_waiting, slow.avg_waiting)
+        self.assertEqual(fast.response_sketch.summary(), slow.response_sketch.summary())
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_accuracy(self):
+        rnd = random.Random(1)
+        values = sorted(rnd.randint(0, 10 ** 9) for _ in range(5000))
+        sketch = QuantileSketch(0.01)
+        for v in values:
+            sketch.add(v)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = values[max(1, math.ceil(q * len(values))) - 1]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * exact + 1, q)
+        self.assertEqual(sketch.summary()[3], values[-1])
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_add_many_matches_add(self):
+        rnd = random.Random(2)
+        for top in (10, 1000, 10 ** 12):
+            for n in (1, 100, 20000):
+                values = [rnd.randint(-5, top) for _ in range(n)]
+                one, bulk = QuantileSketch(), QuantileSketch()
+                for v in values:
+                    one.add(v)
+                bulk.add_many(np.array(values, dtype=np.int64))
+                self.assertEqual(list(one.counts), list(bulk.counts))
+                self.assertEqual(list(one.log_counts), list(bulk.log_counts))
+                self.assertEqual((one.count, one.max), (bulk.count, bulk.max))
+
+class TestRealTime(unittest.TestCase):
+    def task_sets(self):
+        for seed in range(1500):
+            rnd = random.Random(seed)
+            tasks = []
+            for i in range(rnd.randint(1, 4)):
+                period = rnd.randint(2, 12)
+                wcet = rnd.randint(1, max(1, period // 2))
+                deadline = rnd.randint(wcet, period) if rnd.random() < 0.5 else period
+                tasks.append(RTTask(f"T{i + 1}", period, wcet, deadline))
+            yield tasks
+
+    def test_analysis_agrees_with_simulation(self):
+        # synchronous release over one hyperperiod is the worst case
+        for tasks in self.task_sets():
+            horizon = RealTimeScheduler.hyperperiod(tasks)
+            for policy, test in (("EDF", RealTimeScheduler.edf_schedulable),
+                                 ("RM", RealTimeScheduler.rm_schedulable)):
+                _, misses = RealTimeScheduler.simulate(tasks, policy, horizon)
+                self.assertEqual(test(tasks), not misses, (policy, [
+                    (t.period, t.wcet, t.deadline) for t in tasks]))
+
+    def test_textbook_set(self):
+        tasks = [RTTask("T1", 5, 2), RTTask("T2", 7, 4)]
+        self.assertTrue(RealTimeScheduler.edf_schedulable(tasks))
+        self.assertFalse(RealTimeScheduler.rm_schedulable(tasks))
+
+    def test_bad_task(self):
+        with self.assertRaises(ValueError):
+            RTTask("T1", 5, 6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+"""
+Allocators pinned against the MemoryAllocator scans and a list model of holes
+"""
+import random
+import unittest
+
+from memory_management import (BlockTable, BuddyAllocator, DynamicPartitioner, IndexedAllocator,
+                               MemoryAllocator, MemoryBlock, PackedSizeIndex, SizeIndex,
+                               SlabAllocator, churn_trace)
+
+FITS = ("first_fit", "best_fit", "worst_fit")
+
+def blocks_of(sizes):
+    return [MemoryBlock(size) for size in sizes]
+
+def release(blocks, process_id):
+    """Free for a MemoryBlock list, which MemoryAllocator never does itself"""
+    for block in blocks:
+        if block.is_allocated and block.process_id == process_id:
+            block.is_allocated = False
+            block.process_id = None
+            block.process_size = 0
+            return block
+    return None
+
+class TestIndexedAllocator(unittest.TestCase):
+    def test_matches_memory_allocator(self):
+        for seed in range(60):
+            rnd = random.Random(seed)
+            sizes = [rnd.choice([0, rnd.randint(1, 500)]) for _ in range(rnd.randint(1, 80))]
+            for fit in FITS:
+                plain = blocks_of(sizes)
+                table = BlockTable.from_blocks(blocks_of(sizes))
+                indexed = IndexedAllocator(blocks_of(sizes))
+                for op in churn_trace(400, seed, (1, 400), live=len(sizes) // 2 + 1):
+                    if op[0] == 'alloc':
+                        ok, block = getattr(MemoryAllocator, fit)(plain, op[2], op[1])
+                        want = plain.index(block) if ok else None
+                        ok, row = getattr(MemoryAllocator, fit)(table, op[2], op[1])
+                        self.assertEqual(row.index if ok else None, want, (seed, fit))
+                        ok, row = getattr(indexed, fit)(op[2], op[1])
+                        self.assertEqual(row.index if ok else None, want, (seed, fit))
+                    else:
+                        release(plain, op[1])
+                        owner = table.owner_id(op[1])
+                        for index, flag in enumerate(table.allocated):
+                            if flag and table.owner[index] == owner:
+                                table.release(index)
+                                break
+                        indexed.free(op[1])
+                held = [b for b in plain if b.is_allocated]
+                self.assertEqual(indexed.usage(), (
+                    sum(sizes), sum(b.size for b in held), sum(b.process_size for b in held),
+                    len(plain) - len(held)))
+                self.assertEqual(indexed.largest_hole(),
+                                 max([b.size for b in plain if not b.is_allocated], default=0))
+
+    def test_add_block_grows_the_tree(self):
+        indexed = IndexedAllocator(blocks_of([10]))
+        for size in range(1, 40):
+            indexed.add_block(MemoryBlock(size))
+        self.assertEqual(indexed.first_fit(25, "P1")[1].index, 25)
+        self.assertEqual(indexed.best_fit(10, "P2")[1].index, 0)
+        self.assertEqual(indexed.worst_fit(1, "P3")[1].index, 39)
+        self.assertEqual(indexed.largest_hole(), 38)
+
+class TestAllocatorLimits(unittest.TestCase):
+    """Sizes past what packed 64-bit keys hold must still allocate"""
+    def test_block_of_two_gigabytes(self):
+        for fit in FITS:
+            indexed = IndexedAllocator([MemoryBlock(1 << 31)])
+            ok, row = getattr(indexed, fit)(1 << 30, "P1")
+            self.assertTrue(ok)
+            self.assertEqual(row.size, 1 << 31)
+            self.assertIsNotNone(indexed.free("P1"))
+            self.assertEqual(indexed.largest_hole(), 1 << 31)
+
+    def test_blocks_over_four_gigabytes_in_total(self):
+        indexed = IndexedAllocator(blocks_of([3 << 30, 3 << 30]))
+        self.assertEqual(indexed.worst_fit(3 << 30, "P1")[1].index, 0)
+        self.assertEqual(indexed.best_fit(3 << 30, "P2")[1].index, 1)
+        self.assertEqual(indexed.usage(), (6 << 30, 6 << 30, 6 << 30, 0))
+
+    def test_add_block_too_big_to_pack(self):
+        indexed = IndexedAllocator(blocks_of([100, 200]))
+        indexed.add_block(MemoryBlock(1 << 40))
+        indexed.add_block(MemoryBlock(50))
+        self.assertEqual(indexed.best_fit(150, "P1")[1].index, 1)
+        self.assertEqual(indexed.worst_fit(1, "P2")[1].index, 2)
+        self.assertEqual(indexed.best_fit(1, "P3")[1].index, 3)
+        indexed.free("P2")
+        self.assertEqual(indexed.largest_hole(), 1 << 40)
+
+    def test_many_megabyte_regions(self):
+        partitioner = DynamicPartitioner(blocks_of([1 << 20] * 5000))
+        for fit in FITS:
+            self.assertTrue(getattr(partitioner, fit)(1 << 19, fit)[0], fit)
+        self.assertEqual(partitioner.usage()[0], 5000 << 20)
+        self.assertEqual(partitioner.largest_hole(), 1 << 20)
+
+    def test_pack_rejects_without_touching_the_index(self):
+        index = PackedSizeIndex([(5, 1), (7, 2)])
+        for pair in ((1 << 31, 0), (0, 1 << 32), (-1, 0)):
+            with self.assertRaises(ValueError):
+                index.add(pair)
+        self.assertEqual(index.ceiling((6, 0)), (7, 2))
+        self.assertEqual(index.last(), (7, 2))
+
+    def test_packed_index_matches_tuples(self):
+        rnd = random.Random(3)
+        pairs = set()
+        packed, plain = PackedSizeIndex(), SizeIndex()
+        for _ in range(5000):
+            if pairs and rnd.random() < 0.4:
+                pair = rnd.choice(sorted(pairs))
+                pairs.discard(pair)
+                packed.remove(pair)
+                plain.remove(pair)
+            else:
+                pair = (rnd.randint(0, (1 << 31) - 1), rnd.randint(0, 1000))
+                if pair in pairs:
+                    continue
+                pairs.add(pair)
+                packed.add(pair)
+                plain.add(pair)
+            probe = (rnd.randint(0, 1 << 31), 0)
+            self.assertEqual(packed.ceiling(probe), plain.ceiling(probe))
+            self.assertEqual(packed.last(), plain.last())
+
+class HoleModel:
+    """Variable partitioning over a plain list of [start, size, region, pid]"""
+    def __init__(self, sizes):
+        self.parts = []
+        start = 0
+        for region, size in enumerate(sizes):
+            self.parts.append([start, size, region, None])
+            start += size
+
+    def allocate(self, fit, process_size, process_id):
+        holes = [p for p in self.parts if p[3] is None and p[1] >= process_size]
+        if not holes:
+            return None
+        if fit == "best_fit":
+            hole = min(holes, key=lambda p: (p[1], p[0]))
+        elif fit == "worst_fit":
+            hole = min(holes, key=lambda p: (-p[1], p[0]))
+        else:
+            hole = holes[0]
+        at = self.parts.index(hole)
+        self.parts.insert(at, [hole[0], process_size, hole[2], process_id])
+        hole[0] += process_size
+        hole[1] -= process_size
+        if not hole[1]:
+            self.parts.remove(hole)
+        return self.parts[at][0]
+
+    def free(self, process_id):
+        for at, part in enumerate(self.parts):
+            if part[3] == process_id:
+                part[3] = None
+                nxt = self.parts[at + 1] if at + 1 < len(self.parts) else None
+                if nxt and nxt[3] is None and nxt[2] == part[2]:
+                    part[1] += nxt[1]
+                    del self.parts[at + 1]
+                prev = self.parts[at - 1] if at else None
+                if prev and prev[3] is None and prev[2] == part[2]:
+                    prev[1] += part[1]
+                    del self.parts[at]
+                return
+
+class TestDynamicPartitioner(unittest.TestCase):
+    def test_matches_hole_model(self):
+        for seed in range(40):
+            rnd = random.Random(seed)
+            sizes = [rnd.randint(1, 2000) for _ in range(rnd.randint(1, 6))]
+            for fit in FITS:
+                model = HoleModel(sizes)
+                partitioner = DynamicPartitioner(blocks_of(sizes))
+                for op in churn_trace(600, seed, (1, 300), live=20):
+                    if op[0] == 'alloc':
+                        ok, node = getattr(partitioner, fit)(op[2], op[1])
+                        self.assertEqual(node.start if ok else None,
+                                         model.allocate(fit, op[2], op[1]), (seed, fit))
+                    else:
+                        partitioner.free(op[1])
+                        model.free(op[1])
+                table = partitioner.blocks
+                self.assertEqual([(row.start, row.size, row.process_id) for row in table],
+                                 [(p[0], p[1], p[3]) for p in model.parts], (seed, fit))
+                free = [p[1] for p in model.parts if p[3] is None]
+                self.assertEqual(partitioner.usage(), (
+                    sum(sizes), sum(sizes) - sum(free), sum(sizes) - sum(free), len(free)))
+
+    def test_replay_counts_failures(self):
+        trace = list(churn_trace(2000, 5, (64, 512), live=40))
+        for fit in FITS:
+            model = HoleModel([4096])
+            failed = 0
+            for op in trace:
+                if op[0] == 'alloc':
+                    failed += model.allocate(fit, op[2], op[1]) is None
+                else:
+                    model.free(op[1])
+            self.assertEqual(DynamicPartitioner([MemoryBlock(4096)]).replay(trace, fit), failed)
+
+class TestBuddyAllocator(unittest.TestCase):
+    def test_free_everything_merges_back(self):
+        buddy = BuddyAllocator(10)
+        trace = list(churn_trace(3000, 1, (1, 100), live=10))
+        buddy.replay(trace)
+        for pid in list(buddy.owners):
+            buddy.free(pid)
+        self.assertEqual(buddy.usage(), (1024, 0, 0, 1))
+        self.assertEqual(buddy.largest_hole(), 1024)
+
+    def test_blocks_are_aligned_powers_of_two(self):
+        buddy = BuddyAllocator(12)
+        for op in churn_trace(2000, 2, (1, 300), live=12):
+            if op[0] == 'alloc':
+                ok, addr = buddy.allocate(op[2], op[1])
+                if ok:
+                    order = buddy.order_for(op[2])
+                    self.assertEqual(addr % (1 << order), 0)
+            else:
+                buddy.free(op[1])
+        table = buddy.blocks
+        self.assertEqual(sum(row.size for row in table), 1 << 12)
+        total, held, requested, holes = buddy.usage()
+        self.assertEqual(held, table.held)
+        self.assertEqual(requested, table.requested)
+        self.assertEqual(holes, len(table) - table.allocated_blocks)
+
+    def test_grow_keeps_addresses(self):
+        buddy = BuddyAllocator(4)
+        self.assertEqual(buddy.allocate(16, "P1"), (True, 0))
+        self.assertEqual(buddy.allocate(1, "P2"), (False, None))
+        buddy.grow(6)
+        self.assertEqual(buddy.allocate(32, "P3"), (True, 32))
+        self.assertEqual(buddy.allocate(16, "P4"), (True, 16))
+        self.assertEqual(buddy.free("P1"), 0)
+        self.assertEqual(buddy.usage(), (64, 48, 48, 1))
+
+class TestSlabAllocator(unittest.TestCase):
+    def test_pages_go_out_lowest_address_first(self):
+        slab = SlabAllocator(blocks_of([130]), slab_size=64, align=64)
+        slab.add_block(MemoryBlock(128))
+        addrs = [slab.allocate(64, f"P{i}")[1] for i in range(4)]
+        self.assertEqual(addrs, [0, 64, 130, 194])
+        self.assertEqual(slab.allocate(64, "P5"), (False, None))
+        self.assertEqual(slab.allocate(65, "P6"), (False, None))
+
+    def test_churn_accounting(self):
+        slab = SlabAllocator(blocks_of([4096, 1000]), slab_size=256, align=16)
+        live = {}
+        for op in churn_trace(5000, 4, (1, 256), live=50):
+            if op[0] == 'alloc':
+                ok, addr = slab.allocate(op[2], op[1])
+                if ok:
+                    size = -(-op[2] // 16) * 16
+                    for other, (start, length) in live.items():
+                        self.assertTrue(addr + size <= start or start + length <= addr, other)
+                    live[op[1]] = (addr, size)
+            else:
+                self.assertEqual(slab.free(op[1]), live.pop(op[1], (None,))[0])
+        total, held, requested, holes = slab.usage()
+        self.assertEqual(total, 19 * 256)
+        self.assertEqual(requested, sum(length for _, length in live.values()))
+        self.assertEqual(held + holes * 256, total)
+
+if __name__ == "__main__":
+    unittest.main()
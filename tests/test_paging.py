@@ -0,0 +1,190 @@
+"""
+Page replacement, stack curves and address translation against list models
+"""
+import os
+import random
+import tempfile
+import unittest
+from array import array
+
+import paging
+from paging import (AddressTranslator, PageReplacement, StackDistance, address_trace,
+                    load_references, next_use, parse_references)
+
+TEXTBOOK = "7 0 1 2 0 3 0 4 2 3 0 3 2 1 2 0 1 7 0 1"
+
+def reference_faults(algo, refs, frames):
+    """Fault counts from a plain list of resident pages"""
+    resident = []
+    hand = 0
+    used = {}
+    faults = 0
+    for t, page in enumerate(refs):
+        if page in resident:
+            if algo == "LRU":
+                resident.remove(page)
+                resident.append(page)
+            used[page] = 1
+            continue
+        faults += 1
+        if len(resident) < frames:
+            resident.append(page)
+            used[page] = 1
+            continue
+        if algo == "Optimal":
+            def upcoming(p):
+                rest = refs[t + 1:]
+                return rest.index(p) if p in rest else len(refs)
+            victim = max(resident, key=upcoming)
+            resident[resident.index(victim)] = page
+        elif algo == "Clock":
+            while used[resident[hand]]:
+                used[resident[hand]] = 0
+                hand = (hand + 1) % frames
+            resident[hand] = page
+            hand = (hand + 1) % frames
+        else:
+            resident.pop(0)
+            resident.append(page)
+        used[page] = 1
+    return faults
+
+def random_refs(seed, count=300):
+    rnd = random.Random(seed)
+    pages = rnd.randint(1, 30)
+    return [rnd.randrange(pages) for _ in range(rnd.randint(1, count))]
+
+class TestPageReplacement(unittest.TestCase):
+    def test_textbook_string(self):
+        refs = parse_references(TEXTBOOK)
+        self.assertEqual(PageReplacement.simulate(refs, 3),
+                         {"FIFO": 15, "LRU": 12, "Clock": 14, "Optimal": 9})
+
+    def test_matches_list_model(self):
+        for seed in range(150):
+            refs = random_refs(seed)
+            for frames in (1, 2, 3, 5, 8):
+                for algo in PageReplacement.ALGORITHMS:
+                    self.assertEqual(PageReplacement.run(algo, refs, frames),
+                                     reference_faults(algo, refs, frames), (algo, seed, frames))
+
+    def test_frames_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            PageReplacement.fifo([1, 2], 0)
+
+class TestStackDistance(unittest.TestCase):
+    def test_curves_match_per_frame_runs(self):
+        for seed in range(120):
+            refs = random_refs(seed, 3000 if seed % 10 == 0 else 300)
+            lru = StackDistance.lru(refs)
+            opt = StackDistance.optimal(refs)
+            self.assertEqual(lru[0], len(refs))
+            for frames in range(1, len(lru)):
+                self.assertEqual(lru[frames], PageReplacement.lru(refs, frames), (seed, frames))
+                self.assertEqual(opt[frames], PageReplacement.optimal(refs, frames), (seed, frames))
+
+    def test_capped_curves(self):
+        refs = random_refs(4, 2000)
+        for cap in (0, 1, 3, 50):
+            self.assertEqual(StackDistance.lru(refs, cap), StackDistance.lru(refs, 100)[:cap + 1])
+            self.assertEqual(StackDistance.optimal(refs, cap),
+                             StackDistance.optimal(refs, 100)[:cap + 1])
+
+    def test_next_use(self):
+        refs = parse_references(TEXTBOOK)
+        following = next_use(refs)
+        for i, page in enumerate(refs):
+            later = [j for j in range(i + 1, len(refs)) if refs[j] == page]
+            self.assertEqual(following[i], later[0] if later else len(refs))
+
+def translate(addresses, levels, entries, ways, huge):
+    """(hits, walk accesses, table nodes) from per-set lists kept oldest first"""
+    shift = paging.PAGE_SHIFT + (paging.LEVEL_BITS if huge else 0)
+    walk_levels = levels - 1 if huge else levels
+    mask = (1 << paging.LEVEL_BITS * walk_levels) - 1
+    sets = [[] for _ in range(entries // ways)]
+    hits = walks = 0
+    nodes = set()
+    for address in addresses:
+        page = (address >> shift) & mask
+        tlb_set = sets[page % len(sets)]
+        if page in tlb_set:
+            hits += 1
+            tlb_set.remove(page)
+        else:
+            walks += 1
+            for level in range(walk_levels):
+                nodes.add((level, page >> paging.LEVEL_BITS * (walk_levels - level)))
+            if len(tlb_set) == ways:
+                tlb_set.pop(0)
+        tlb_set.append(page)
+    return hits, walks * walk_levels, len(nodes)
+
+class TestAddressTranslator(unittest.TestCase):
+    def check(self, use_numpy):
+        saved = paging.np
+        if not use_numpy:
+            paging.np = None
+        try:
+            for seed in range(80):
+                rnd = random.Random(seed)
+                levels = rnd.randint(2, 4)
+                ways = rnd.choice([1, 2, 4, 8])
+                entries = ways * rnd.choice([1, 2, 3, 8])
+                huge = rnd.random() < 0.4
+                addresses = address_trace(rnd.randint(1, 3000), seed, rnd.choice(
+                    [1 << 16, 1 << 24, 1 << 40]), rnd.random())
+                translator = AddressTranslator(levels, entries, ways, "LRU", huge)
+                translator.CHUNK = rnd.choice([7, 100, 1 << 20])
+                report = translator.run(addresses)
+                hits, walk_accesses, nodes = translate(addresses, levels, entries, ways, huge)
+                self.assertEqual(report["translations"], len(addresses))
+                self.assertEqual(round(report["hit_rate"] * len(addresses)), hits, seed)
+                self.assertEqual(report["walk_accesses"], walk_accesses, seed)
+                self.assertEqual(report["table_nodes"], nodes, seed)
+        finally:
+            paging.np = saved
+
+    @unittest.skipIf(paging.np is None, "NumPy not installed")
+    def test_lru_matches_set_model_numpy(self):
+        self.check(True)
+
+    def test_lru_matches_set_model_pure(self):
+        self.check(False)
+
+    def test_random_policy_is_seeded(self):
+        addresses = address_trace(5000, 3, 1 << 24, 0.5)
+        first = AddressTranslator(4, 16, 4, "Random", seed=9).run(addresses)
+        self.assertEqual(AddressTranslator(4, 16, 4, "Random", seed=9).run(addresses), first)
+        self.assertEqual(first["translations"], 5000)
+
+    def test_bad_configuration(self):
+        for kwargs in ({"levels": 5}, {"tlb_entries": 6, "ways": 4}, {"policy": "FIFO"}):
+            with self.assertRaises(ValueError):
+                AddressTranslator(**kwargs)
+
+class TestReferenceFiles(unittest.TestCase):
+    def test_round_trip(self):
+        refs = array('i', random_refs(1, 1000))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "refs.bin")
+            with open(path, "wb") as f:
+                refs.tofile(f)
+            mapped = load_references(path)
+            self.assertEqual(list(mapped), list(refs))
+            self.assertEqual(PageReplacement.simulate(mapped, 4), PageReplacement.simulate(refs, 4))
+            mapped.release()
+            with open(path, "ab") as f:
+                f.write(b"\0")
+            with self.assertRaises(ValueError):
+                load_references(path)
+            open(path, "wb").close()
+            self.assertEqual(len(load_references(path)), 0)
+
+    def test_parse(self):
+        self.assertEqual(list(parse_references(" 1, 2 3,,4\n")), [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            parse_references("1 two 3")
+
+if __name__ == "__main__":
+    unittest.main()